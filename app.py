@@ -3,13 +3,20 @@ import pandas as pd
 import sys
 import os
 from datetime import datetime
-import time
+import uuid
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from scrapper.improved_scraper import scrape_with_retry
-from analytics.sentiment_analysis import SentimentAnalyzer, extract_keywords
+from scrapper.driver_manager import get_driver_manager
+from scrapper.jobs import JobRunner, QUEUED, ANALYZING, CANCELLED, FAILED
+from analytics.keywords import KeywordCounter
+from analytics.score_cache import ScoreCache
+from analytics.result_cache import ResultCache, dataset_fingerprint
+from analytics.summary import DatasetSummary
+from analytics.review_browser import ReviewBrowser, SORT_OPTIONS
+from analytics.pipeline import analyze_reviews
+from utils.review_store import ReviewStore, PYARROW_AVAILABLE
 from analytics.visualizations import AdvancedVisualizer
 from utils.export_utils import ExportManager
 
@@ -60,11 +67,201 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_score_cache():
+    """One sentiment score cache per server process, shared by all sessions"""
+    return ScoreCache()
+
+
+@st.cache_resource
+def get_review_store():
+    """Parquet history of every scrape (None when pyarrow is not installed)"""
+    return ReviewStore() if PYARROW_AVAILABLE else None
+
+
+@st.cache_resource
+def get_job_runner():
+    """Background scrape jobs for every session; at most two scrape at once, the rest queue"""
+    return JobRunner(max_concurrent=2)
+
+
+@st.cache_resource
+def get_result_cache():
+    """Figures, tables and word clouds per dataset, shared by all sessions"""
+    return ResultCache()
+
+
+def cached(name, compute):
+    """Result of compute() for the current dataset, computed once per dataset"""
+    return get_result_cache().get_or_compute(st.session_state.data_fingerprint, name, compute)
+
+
+def set_dataset(data):
+    """Make analyzed reviews the dashboard's current dataset"""
+    st.session_state.scraped_data = data
+    st.session_state.analyzed_data = data
+    st.session_state.data_fingerprint = dataset_fingerprint(data)
+
+
+def dataset_summary():
+    """Counts, averages and per-product stats of the current dataset, aggregated once per dataset"""
+    return cached("summary", lambda: DatasetSummary.from_frame(st.session_state.analyzed_data))
+
+
+def selection_summary(mask):
+    """The dataset's summary when every review is selected; None lets exports summarize a subset"""
+    return dataset_summary() if mask.all() else None
+
+
+def get_review_browser():
+    """This session's ReviewBrowser, rebuilt only when the dataset changes"""
+    if st.session_state.get('browser_fingerprint') != st.session_state.data_fingerprint:
+        st.session_state.review_browser = ReviewBrowser(st.session_state.analyzed_data)
+        st.session_state.browser_fingerprint = st.session_state.data_fingerprint
+    return st.session_state.review_browser
+
+
+def keyword_counter(df):
+    """Word and phrase counts per sentiment/product/rating, counted once per dataset"""
+    return cached("keyword_counter", lambda: KeywordCounter(
+        group_by=[col for col in KEYWORD_GROUPS.values() if col in df.columns], ngrams=(1, 2)
+    ).update(df))
+
+
+def wordcloud_png(df, sentiment_type):
+    """Word cloud PNG for one sentiment, drawn from the shared keyword counts once per dataset"""
+    def draw():
+        frequencies = keyword_counter(df).counts('VADER_Sentiment').get(sentiment_type, {})
+        buf = AdvancedVisualizer(df, dataset_summary()).create_wordcloud(sentiment_type, frequencies=frequencies)
+        return buf.getvalue() if buf else None
+    return cached(f"wordcloud_{sentiment_type.lower()}", draw)
+
+
+def show_quick_stats(summary):
+    col_a, col_b, col_c, col_d = st.columns(4)
+    with col_a:
+        st.metric("Total Reviews", summary.total)
+    with col_b:
+        st.metric("Positive", f"{summary.sentiment_count('Positive')} ({summary.sentiment_share('Positive'):.0f}%)")
+    with col_c:
+        st.metric("Negative", f"{summary.sentiment_count('Negative')} ({summary.sentiment_share('Negative'):.0f}%)")
+    with col_d:
+        st.metric("Avg Rating", f"{summary.avg_rating:.2f} ⭐")
+
+
+def show_no_reviews_help():
+    st.error("😞 **No reviews found!**")
+    st.warning("""
+    **Possible reasons:**
+    - Products don't have customer reviews yet
+    - Product name might be too specific or misspelled
+    - Try searching for popular products or brand names
+    
+    **Suggestions:**
+    - Try: "Nike shoes", "Levis jeans", "Puma t-shirt"
+    - Increase number of products to search
+    - Use generic product names
+    """)
+    
+    # Show search suggestion
+    with st.expander("🔍 Search Tips"):
+        st.markdown("""
+        **Good searches:**
+        - ✅ Brand names: "Nike", "Adidas", "Puma"
+        - ✅ Generic products: "running shoes", "jeans", "t-shirt"
+        - ✅ Popular categories: "sneakers", "formal shirt"
+        
+        **Avoid:**
+        - ❌ Very specific: "Nike Air Max 270 React White"
+        - ❌ Model numbers: "SKU-12345"
+        - ❌ Rare products: "vintage cricket bat 1980"
+        """)
+
+
+@st.fragment(run_every=1.0)
+def show_scrape_job():
+    """Live status of this session's scrape job; only this fragment reruns while polling"""
+    runner = get_job_runner()
+    job = runner.get(st.session_state.scrape_job_id)
+    if job is None:
+        st.session_state.scrape_job_id = None
+        return
+    
+    if job.status == QUEUED:
+        st.progress(0.0)
+        st.text(f"⏳ Waiting for a free scraper ({runner.queue_position(job.id)} jobs ahead)...")
+    elif job.active:
+        st.progress(job.progress)
+        if job.status == ANALYZING:
+            st.text("🤖 Analyzing sentiment...")
+        else:
+            rating = job.summary.avg_rating
+            st.text(f"🔍 Product {job.products_scraped}/{job.no_of_products} "
+                    f"(checked {job.products_checked}) · {job.reviews} reviews so far"
+                    + ("" if pd.isna(rating) else f" · avg {rating:.2f} ⭐"))
+            st.info("💡 **Tip:** If products don't have reviews, the scraper will automatically skip them and search for more products.")
+        partial = job.partial()
+        if not partial.empty:
+            st.dataframe(partial[['Product Name', 'Rating', 'Comment']].tail(5), use_container_width=True, hide_index=True)
+    
+    if job.active:
+        if st.button("⏹️ Cancel", use_container_width=True, disabled=job.cancel_requested):
+            runner.cancel(job.id)
+        return
+    
+    # Finished: make the results the dashboard's dataset once, then redraw every tab
+    data = job.data
+    if st.session_state.loaded_job_id != job.id:
+        if data is not None and not data.empty:
+            set_dataset(data)
+        st.session_state.loaded_job_id = job.id
+        st.rerun()
+    
+    if job.status == FAILED:
+        st.error(f"❌ Scraping failed: {job.error}")
+    elif data is None or data.empty:
+        if job.status == CANCELLED:
+            st.warning("⏹️ Scraping cancelled before any reviews were found")
+        else:
+            show_no_reviews_help()
+    else:
+        summary = dataset_summary()
+        if job.status == CANCELLED:
+            st.warning(f"⏹️ Scraping cancelled; kept {summary.total} reviews from {summary.products} products")
+        else:
+            st.success(f"🎉 Successfully scraped {summary.total} reviews from {summary.products} products!")
+        show_quick_stats(summary)
+
+
+# Columns the dashboard needs from the review store; everything else stays on disk
+DASHBOARD_COLUMNS = [
+    'Product Name', 'Overall Rating', 'Price', 'Date', 'Rating', 'Reviewer', 'Comment',
+    'Rating_Numeric', 'Date_Parsed'
+]
+
+# Keyword grouping label -> column
+KEYWORD_GROUPS = {'Sentiment': 'VADER_Sentiment', 'Product': 'Product Name', 'Rating': 'Rating'}
+
+SENTIMENT_LABELS = {
+    'Positive': "😊 Positive Reviews",
+    'Neutral': "😐 Neutral Reviews",
+    'Negative': "😞 Negative Reviews",
+}
+
+
 # Initialize session state
 if 'scraped_data' not in st.session_state:
     st.session_state.scraped_data = None
 if 'analyzed_data' not in st.session_state:
     st.session_state.analyzed_data = None
+if 'data_fingerprint' not in st.session_state:
+    st.session_state.data_fingerprint = None
+if 'session_id' not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+if 'scrape_job_id' not in st.session_state:
+    st.session_state.scrape_job_id = None
+if 'loaded_job_id' not in st.session_state:
+    st.session_state.loaded_job_id = None
 
 # Header
 st.markdown('<h1 class="main-header">🛍️ Myntra Review Scraper Pro</h1>', unsafe_allow_html=True)
@@ -95,6 +292,19 @@ with st.sidebar:
         help="Run browser in background (faster)"
     )
     
+    block_resources = st.checkbox(
+        "⚡ Block Images & Trackers",
+        value=True,
+        help="Skip images, fonts, media and analytics scripts (less bandwidth, faster pages)"
+    )
+    
+    save_history = st.checkbox(
+        "💾 Save to History",
+        value=PYARROW_AVAILABLE,
+        disabled=not PYARROW_AVAILABLE,
+        help="Keep every scrape in a local Parquet store so it can be reopened without scraping again"
+    )
+    
     st.divider()
     
     st.subheader("📥 Export Options")
@@ -115,102 +325,31 @@ with tab1:
     with col1:
         st.info("👆 Configure your search in the sidebar and click 'Start Scraping'")
         
-        if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
+        current_job = get_job_runner().get(st.session_state.scrape_job_id) if st.session_state.scrape_job_id else None
+        busy = current_job is not None and current_job.active
+        
+        if st.button("🚀 Start Scraping", type="primary", use_container_width=True, disabled=busy):
             if not product_name:
                 st.error("⚠️ Please enter a product name!")
             else:
-                with st.spinner("🔄 Scraping reviews... This may take a few minutes..."):
-                    # Progress tracking
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    info_box = st.empty()
-                    
-                    status_text.text("🌐 Initializing browser...")
-                    progress_bar.progress(10)
-                    time.sleep(0.5)
-                    
-                    status_text.text("🔍 Searching for products...")
-                    progress_bar.progress(30)
-                    
-                    # Info message
-                    info_box.info("💡 **Tip:** If products don't have reviews, the scraper will automatically skip them and search for more products.")
-                    
-                    # Scrape data
-                    data = scrape_with_retry(
-                        product_name=product_name,
-                        no_of_products=num_products,
-                        headless=headless_mode
-                    )
-                    
-                    progress_bar.progress(70)
-                    
-                    if data is not None and not data.empty:
-                        status_text.text("🤖 Analyzing sentiment...")
-                        
-                        # Sentiment analysis
-                        analyzer = SentimentAnalyzer()
-                        data = analyzer.analyze_dataframe(data)
-                        
-                        st.session_state.scraped_data = data
-                        st.session_state.analyzed_data = data
-                        
-                        progress_bar.progress(100)
-                        status_text.text("✅ Scraping completed!")
-                        info_box.empty()  # Clear info message
-                        
-                        st.success(f"🎉 Successfully scraped {len(data)} reviews from {data['Product Name'].nunique()} products!")
-                        
-                        # Quick stats
-                        col_a, col_b, col_c, col_d = st.columns(4)
-                        with col_a:
-                            st.metric("Total Reviews", len(data))
-                        with col_b:
-                            positive = len(data[data['VADER_Sentiment'] == 'Positive'])
-                            st.metric("Positive", f"{positive} ({positive/len(data)*100:.0f}%)")
-                        with col_c:
-                            negative = len(data[data['VADER_Sentiment'] == 'Negative'])
-                            st.metric("Negative", f"{negative} ({negative/len(data)*100:.0f}%)")
-                        with col_d:
-                            try:
-                                rating_numeric = pd.to_numeric(
-                                    data['Rating'].astype(str).str.extract(r'(\d+\.?\d*)')[0], 
-                                    errors='coerce'
-                                )
-                                avg_rating = rating_numeric.mean()
-                            except:
-                                avg_rating = 0.0
-                            st.metric("Avg Rating", f"{avg_rating:.2f} ⭐")
-                    else:
-                        progress_bar.progress(100)
-                        status_text.text("❌ No reviews found")
-                        info_box.empty()  # Clear info message
-                        
-                        st.error("😞 **No reviews found!**")
-                        st.warning("""
-                        **Possible reasons:**
-                        - Products don't have customer reviews yet
-                        - Product name might be too specific or misspelled
-                        - Try searching for popular products or brand names
-                        
-                        **Suggestions:**
-                        - Try: "Nike shoes", "Levis jeans", "Puma t-shirt"
-                        - Increase number of products to search
-                        - Use generic product names
-                        """)
-                        
-                        # Show search suggestion
-                        with st.expander("🔍 Search Tips"):
-                            st.markdown("""
-                            **Good searches:**
-                            - ✅ Brand names: "Nike", "Adidas", "Puma"
-                            - ✅ Generic products: "running shoes", "jeans", "t-shirt"
-                            - ✅ Popular categories: "sneakers", "formal shirt"
-                            
-                            **Avoid:**
-                            - ❌ Very specific: "Nike Air Max 270 React White"
-                            - ❌ Model numbers: "SKU-12345"
-                            - ❌ Rare products: "vintage cricket bat 1980"
-                            """)
+                # The scrape runs in a background worker; this session only polls it
+                resource_blocking = "standard" if block_resources else "none"
+                score_cache = get_score_cache()
+                job = get_job_runner().submit(
+                    st.session_state.session_id,
+                    product_name,
+                    num_products,
+                    postprocess=lambda data: analyze_reviews(data, score_cache=score_cache),
+                    headless=headless_mode,
+                    resource_blocking=resource_blocking,
+                    dedup=True,
+                    driver_manager=get_driver_manager(headless_mode, resource_blocking),
+                    store=get_review_store() if save_history else None
+                )
+                st.session_state.scrape_job_id = job.id
+        
+        if st.session_state.scrape_job_id:
+            show_scrape_job()
     
     with col2:
         st.subheader("📋 Features")
@@ -223,30 +362,52 @@ with tab1:
         ✅ **Product Comparison**  
         """)
 
+        review_store = get_review_store()
+        stored_queries = review_store.queries() if review_store is not None else []
+        if stored_queries:
+            st.subheader("📂 Load from History")
+            history_query = st.selectbox("Saved search", stored_queries)
+            history_range = st.date_input("Scraped between", value=[], help="Leave empty for every scrape")
+            history_text = st.text_input("Comments matching", placeholder="optional, e.g. \"true to size\"")
+
+            if st.button("📂 Load Reviews", use_container_width=True):
+                scraped_from, scraped_to = (list(history_range) + [None, None])[:2]
+                with st.spinner("Loading saved reviews..."):
+                    data = review_store.read(
+                        columns=DASHBOARD_COLUMNS,
+                        query=history_query,
+                        scraped_from=scraped_from,
+                        scraped_to=scraped_to or scraped_from,
+                        doc_ids=review_store.search(history_text) if history_text.strip() else None
+                    )
+                if data.empty:
+                    st.warning("No saved reviews match that selection")
+                else:
+                    data = analyze_reviews(data, score_cache=get_score_cache())
+                    set_dataset(data)
+                    st.success(f"Loaded {len(data)} reviews from {dataset_summary().products} products")
+
 with tab2:
     st.header("📊 Analytics Dashboard")
     
     if st.session_state.analyzed_data is not None:
         df = st.session_state.analyzed_data
-        viz = AdvancedVisualizer(df)
+        summary = dataset_summary()
+        viz = AdvancedVisualizer(df, summary)
         
         # Key metrics
         col1, col2, col3, col4, col5 = st.columns(5)
         
-        total = len(df)
-        pos = len(df[df['VADER_Sentiment'] == 'Positive'])
-        neg = len(df[df['VADER_Sentiment'] == 'Negative'])
-        neu = len(df[df['VADER_Sentiment'] == 'Neutral'])
-        avg_sent = df['VADER_Score'].mean()
+        avg_sent = summary.avg_sentiment
         
         with col1:
-            st.metric("📝 Total Reviews", total)
+            st.metric("📝 Total Reviews", summary.total)
         with col2:
-            st.metric("😊 Positive", pos, f"{pos/total*100:.1f}%")
+            st.metric("😊 Positive", summary.sentiment_count('Positive'), f"{summary.sentiment_share('Positive'):.1f}%")
         with col3:
-            st.metric("😐 Neutral", neu, f"{neu/total*100:.1f}%")
+            st.metric("😐 Neutral", summary.sentiment_count('Neutral'), f"{summary.sentiment_share('Neutral'):.1f}%")
         with col4:
-            st.metric("😞 Negative", neg, f"{neg/total*100:.1f}%")
+            st.metric("😞 Negative", summary.sentiment_count('Negative'), f"{summary.sentiment_share('Negative'):.1f}%")
         with col5:
             sentiment_emoji = "😊" if avg_sent > 0.05 else ("😞" if avg_sent < -0.05 else "😐")
             st.metric(f"{sentiment_emoji} Avg Sentiment", f"{avg_sent:.3f}")
@@ -256,18 +417,19 @@ with tab2:
         # Charts
         col1, col2 = st.columns(2)
         
+        # Figures are built once per dataset; reruns from other widgets reuse them
         with col1:
-            st.plotly_chart(viz.create_sentiment_distribution(), use_container_width=True)
+            st.plotly_chart(cached("sentiment_distribution", viz.create_sentiment_distribution), use_container_width=True)
         
         with col2:
-            st.plotly_chart(viz.create_rating_distribution(), use_container_width=True)
+            st.plotly_chart(cached("rating_distribution", viz.create_rating_distribution), use_container_width=True)
         
-        st.plotly_chart(viz.create_sentiment_vs_rating(), use_container_width=True)
+        st.plotly_chart(cached("sentiment_vs_rating", viz.create_sentiment_vs_rating), use_container_width=True)
         
-        st.plotly_chart(viz.create_product_comparison(), use_container_width=True)
+        st.plotly_chart(cached("product_comparison", viz.create_product_comparison), use_container_width=True)
         
         # Timeline chart
-        timeline = viz.create_timeline_chart()
+        timeline = cached("timeline", viz.create_timeline_chart)
         if timeline:
             st.plotly_chart(timeline, use_container_width=True)
         
@@ -278,7 +440,13 @@ with tab3:
     st.header("💬 Review Explorer")
     
     if st.session_state.analyzed_data is not None:
-        df = st.session_state.analyzed_data
+        browser = get_review_browser()
+        
+        search_query = st.text_input(
+            "🔎 Search reviews",
+            placeholder='e.g. fabric "colour faded" -wash',
+            help='Words must all appear; OR between alternatives, -word to exclude, "quotes" for a phrase'
+        )
         
         # Filters
         col1, col2, col3 = st.columns(3)
@@ -286,41 +454,56 @@ with tab3:
         with col1:
             sentiment_filter = st.multiselect(
                 "Filter by Sentiment",
-                options=df['VADER_Sentiment'].unique(),
-                default=df['VADER_Sentiment'].unique()
+                options=browser.options('VADER_Sentiment'),
+                default=browser.options('VADER_Sentiment')
             )
         
         with col2:
             product_filter = st.multiselect(
                 "Filter by Product",
-                options=df['Product Name'].unique(),
-                default=df['Product Name'].unique()
+                options=browser.options('Product Name'),
+                default=browser.options('Product Name')
             )
         
         with col3:
             rating_filter = st.multiselect(
                 "Filter by Rating",
-                options=sorted(df['Rating'].unique()),
-                default=df['Rating'].unique()
+                options=browser.options('Rating'),
+                default=browser.options('Rating')
             )
         
-        # Apply filters
-        filtered_df = df[
-            (df['VADER_Sentiment'].isin(sentiment_filter)) &
-            (df['Product Name'].isin(product_filter)) &
-            (df['Rating'].isin(rating_filter))
-        ]
+        # Apply filters (precomputed masks; only the page shown is materialized)
+        selection = browser.select({
+            'VADER_Sentiment': sentiment_filter,
+            'Product Name': product_filter,
+            'Rating': rating_filter
+        }, search_query)
+        total = int(selection.sum())
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            sort_by = st.selectbox("Sort by", list(SORT_OPTIONS))
+        with col2:
+            page_size = st.selectbox("Reviews per page", [10, 25, 50, 100], index=1)
+        with col3:
+            pages = max((total + page_size - 1) // page_size, 1)
+            page_number = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
         
-        st.write(f"Showing {len(filtered_df)} reviews")
+        page_df = browser.page(selection, sort_by, page_number - 1, page_size, query=search_query)
+        first = (page_number - 1) * page_size
+        st.write(f"Showing {first + 1 if total else 0}-{first + len(page_df)} of {total} reviews (page {page_number} of {pages})")
+        
+        if total:
+            with st.expander("🔑 Top words in these reviews"):
+                st.write(", ".join(f"{word} ({count})" for word, count in browser.top_terms(selection)))
         
         # Display reviews
-        for idx, row in filtered_df.iterrows():
-            sentiment_color = {
-                'Positive': '🟢',
-                'Neutral': '🟡',
-                'Negative': '🔴'
-            }
-            
+        sentiment_color = {
+            'Positive': '🟢',
+            'Neutral': '🟡',
+            'Negative': '🔴'
+        }
+        for idx, row in page_df.iterrows():
             with st.expander(f"{sentiment_color.get(row['VADER_Sentiment'], '⚪')} {row['Product Name'][:50]}... - ⭐ {row['Rating']}"):
                 st.write(f"**Reviewer:** {row['Reviewer']}")
                 st.write(f"**Date:** {row['Date']}")
@@ -335,7 +518,7 @@ with tab3:
         
         with export_col1:
             if st.button("📊 Download Excel", use_container_width=True):
-                filename = ExportManager.export_to_excel(filtered_df)
+                filename = ExportManager.export_to_excel(browser.frame(selection), summary=selection_summary(selection))
                 if filename:
                     with open(filename, 'rb') as f:
                         st.download_button(
@@ -347,7 +530,7 @@ with tab3:
         
         with export_col2:
             if st.button("📄 Download CSV", use_container_width=True):
-                csv = filtered_df.to_csv(index=False)
+                csv = browser.frame(selection).to_csv(index=False)
                 st.download_button(
                     "⬇️ Download CSV File",
                     csv,
@@ -357,7 +540,7 @@ with tab3:
         
         with export_col3:
             if st.button("📋 Generate Summary", use_container_width=True):
-                summary = ExportManager.create_summary_report(filtered_df)
+                summary = ExportManager.create_summary_report(browser.frame(selection), selection_summary(selection))
                 st.download_button(
                     "⬇️ Download Summary",
                     summary,
@@ -380,49 +563,57 @@ with tab4:
         
         with col1:
             st.write("**Positive Reviews**")
-            viz = AdvancedVisualizer(df)
-            wc_pos = viz.create_wordcloud('Positive')
+            wc_pos = wordcloud_png(df, 'Positive')
             if wc_pos:
                 st.image(wc_pos)
         
         with col2:
             st.write("**Negative Reviews**")
-            wc_neg = viz.create_wordcloud('Negative')
+            wc_neg = wordcloud_png(df, 'Negative')
             if wc_neg:
                 st.image(wc_neg)
         
         st.divider()
         
         # Keyword extraction
-        st.subheader("🔑 Top Keywords by Sentiment")
+        st.subheader("🔑 Top Keywords")
         
-        keywords = extract_keywords(df)
+        counter = keyword_counter(df)
         
         col1, col2, col3 = st.columns(3)
-        
         with col1:
-            if 'Positive' in keywords:
-                st.write("**😊 Positive Reviews**")
-                for word, count in keywords['Positive'][:10]:
-                    st.write(f"• {word}: {count}")
-        
+            group_label = st.radio("Group by", [label for label, col in KEYWORD_GROUPS.items() if col in counter.group_by], horizontal=True)
         with col2:
-            if 'Neutral' in keywords:
-                st.write("**😐 Neutral Reviews**")
-                for word, count in keywords['Neutral'][:10]:
-                    st.write(f"• {word}: {count}")
-        
+            ngram = 1 if st.radio("Terms", ["Words", "Phrases"], horizontal=True) == "Words" else 2
         with col3:
-            if 'Negative' in keywords:
-                st.write("**😞 Negative Reviews**")
-                for word, count in keywords['Negative'][:10]:
-                    st.write(f"• {word}: {count}")
+            ranking = st.radio("Rank by", ["Most frequent", "Most distinctive"], horizontal=True,
+                               help="Distinctive terms are common in one group but rare in the others (TF-IDF)")
+        
+        group_col = KEYWORD_GROUPS[group_label]
+        if ranking == "Most frequent":
+            keywords = counter.top(group_col, n=10, ngram=ngram)
+        else:
+            keywords = counter.distinctive(group_col, n=10, ngram=ngram)
+        
+        if group_col == 'VADER_Sentiment':
+            groups = [value for value in SENTIMENT_LABELS if value in keywords]
+        else:
+            groups = sorted((value for value in keywords if value is not None), key=str)
+        
+        for row in range(0, len(groups), 3):
+            for col, value in zip(st.columns(3), groups[row:row + 3]):
+                with col:
+                    st.write(f"**{SENTIMENT_LABELS.get(value, value)}**")
+                    if not keywords[value]:
+                        st.caption("Nothing stands out")
+                    for term, score in keywords[value]:
+                        st.write(f"• {term}: {score}")
         
         st.divider()
         
         # Detailed stats table
         st.subheader("📊 Detailed Statistics")
-        stats_df = viz.create_detailed_stats_table()
+        stats_df = cached("detailed_stats", AdvancedVisualizer(df, dataset_summary()).create_detailed_stats_table)
         st.dataframe(stats_df, use_container_width=True, hide_index=True)
         
     else:
@@ -0,0 +1,243 @@
+"""
+Headless batch runner: scrape many product queries without the Streamlit app
+
+Usage:
+    python batch.py queries.txt --concurrency 2 --output store
+    python batch.py queries.txt --output csv --out-dir exports --analyze
+
+queries.txt holds one search per line; blank lines and lines starting with # are skipped.
+Finished queries are recorded in a checkpoint file, so rerunning the same command
+after a crash resumes with the queries that had not completed.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from scrapper.improved_scraper import scrape_with_retry, FETCH_MODES
+from scrapper.driver_manager import get_driver_manager
+from scrapper.rate_limiter import RateLimiter
+from scrapper.resource_blocking import BLOCKING_PROFILES
+
+logger = logging.getLogger("batch")
+
+OUTPUTS = ("store", "parquet", "csv")
+
+
+def read_queries(path):
+    """Queries from a text file, in order, without blanks, comments or repeats"""
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            query = line.strip()
+            if query and not query.startswith("#") and query not in queries:
+                queries.append(query)
+    return queries
+
+
+class Checkpoint:
+    """JSON record of finished queries, rewritten atomically after each one"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = json.load(f).get("done", {})
+
+    def is_done(self, query):
+        return query in self.done
+
+    def mark_done(self, query, result):
+        with self._lock:
+            self.done[query] = result
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"done": self.done}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def _slug(query):
+    return "-".join(query.lower().split()).replace("/", "-")
+
+
+def write_output(data, query, args, store):
+    """Save one query's reviews; returns where they went"""
+    if args.output == "store":
+        return store.append(data, query)
+
+    if args.analyze:
+        from analytics.pipeline import analyze_reviews
+        data = analyze_reviews(data, score_cache=_score_cache(args))
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    path = os.path.join(args.out_dir, f"reviews_{_slug(query)}_{datetime.now():%Y%m%d_%H%M%S}.{args.output}")
+    if args.output == "parquet":
+        data.to_parquet(path, index=False)
+    else:
+        data.to_csv(path, index=False)
+    return path
+
+
+class OutputWriter:
+    """
+    Store-like wrapper around write_output for scrape_with_retry: the incremental
+    state and dedup index are only committed once append() has saved the reviews
+    """
+
+    def __init__(self, args, store):
+        self.args = args
+        self.store = store
+        self.output = None
+        self.error = None
+
+    def append(self, data, query):
+        if data is None or data.empty:
+            return None
+        try:
+            self.output = write_output(data, query, self.args, self.store)
+        except Exception as e:
+            self.error = e
+            raise
+        return self.output
+
+
+_score_cache_instance = None
+_score_cache_lock = threading.Lock()
+
+
+def _score_cache(args):
+    """One sentiment score cache for the whole batch"""
+    global _score_cache_instance
+    with _score_cache_lock:
+        if _score_cache_instance is None:
+            from analytics.score_cache import ScoreCache
+            _score_cache_instance = ScoreCache(args.score_cache)
+        return _score_cache_instance
+
+
+def run_query(query, args, limiter, store):
+    """Scrape, save and time one query; returns its checkpoint record"""
+    start = time.perf_counter()
+    writer = OutputWriter(args, store)
+    data = scrape_with_retry(
+        query,
+        args.products,
+        max_retries=args.retries,
+        headless=True,
+        max_workers=args.workers,
+        fetch_mode=args.fetch_mode,
+        cache_path=args.page_cache,
+        driver_manager=get_driver_manager(True, args.resource_blocking),
+        resource_blocking=args.resource_blocking,
+        state_path=args.state if args.incremental else None,
+        dedup=True,
+        dedup_path=args.dedup_index,
+        limiter=limiter,
+        store=writer,
+    )
+    elapsed = time.perf_counter() - start
+
+    reviews = 0 if data is None else len(data)
+    if writer.error is not None:
+        logger.error(f"Could not save {reviews} reviews for {query!r}: {writer.error}")
+
+    return {
+        "reviews": reviews,
+        "products": 0 if data is None else int(data["Product Name"].nunique()),
+        "seconds": round(elapsed, 2),
+        "reviews_per_second": round(reviews / elapsed, 2) if elapsed else 0.0,
+        "output": writer.output,
+        "ok": data is not None and writer.error is None,
+        "finished": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape Myntra reviews for every query in a file")
+    parser.add_argument("queries", help="text file with one product query per line")
+    parser.add_argument("--products", type=int, default=3, help="products to scrape per query")
+    parser.add_argument("--concurrency", type=int, default=1, help="queries scraped at the same time")
+    parser.add_argument("--workers", type=int, default=1, help="browsers per query")
+    parser.add_argument("--requests-per-second", type=float, default=1.0,
+                        help="politeness limit per host, shared by all queries")
+    parser.add_argument("--fetch-mode", choices=FETCH_MODES, default="selenium")
+    parser.add_argument("--resource-blocking", choices=tuple(BLOCKING_PROFILES), default="standard")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--output", choices=OUTPUTS, default="store")
+    parser.add_argument("--store-dir", default="data/reviews", help="review store root (--output store)")
+    parser.add_argument("--out-dir", default="exports", help="directory for --output parquet/csv")
+    parser.add_argument("--analyze", action="store_true", help="add sentiment columns to parquet/csv output")
+    parser.add_argument("--incremental", action="store_true", help="only fetch reviews newer than earlier runs")
+    parser.add_argument("--state", default=".cache/scrape_state.sqlite", help="incremental scrape state file")
+    parser.add_argument("--dedup-index", default=None, help="SQLite dedup index shared across runs")
+    parser.add_argument("--page-cache", default=None, help="SQLite page cache file")
+    parser.add_argument("--score-cache", default=".cache/sentiment.sqlite", help="sentiment score cache (--analyze)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="checkpoint file (default: <queries file>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and run every query")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    queries = read_queries(args.queries)
+    checkpoint_path = args.checkpoint or f"{args.queries}.checkpoint.json"
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = Checkpoint(checkpoint_path)
+
+    pending = [q for q in queries if not checkpoint.is_done(q)]
+    if len(pending) < len(queries):
+        logger.info(f"Resuming: {len(queries) - len(pending)} of {len(queries)} queries already done")
+    if not pending:
+        return 0
+
+    store = None
+    if args.output == "store":
+        from utils.review_store import ReviewStore
+        store = ReviewStore(args.store_dir)
+
+    limiter = RateLimiter(args.requests_per_second)
+    failed = 0
+    print(f"{'query':<30} {'reviews':>8} {'products':>8} {'seconds':>8} {'reviews/s':>10}")
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        futures = {executor.submit(run_query, q, args, limiter, store): q for q in pending}
+        for future in as_completed(futures):
+            query = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Query {query!r} failed: {e}")
+                failed += 1
+                continue
+            if not result["ok"]:
+                failed += 1
+                print(f"{query[:30]:<30} {'failed':>8}")
+                continue
+            checkpoint.mark_done(query, result)
+            print(f"{query[:30]:<30} {result['reviews']:>8} {result['products']:>8} "
+                  f"{result['seconds']:>8.1f} {result['reviews_per_second']:>10.2f}")
+
+    if _score_cache_instance is not None:
+        _score_cache_instance.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Benchmark: review deduplication rate, throughput and memory as the persistent history grows
+
+Run from the repo root:  python benchmarks/bench_dedup.py [--runs N] [--per-run N] [--near]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapper.dedup import DedupIndex
+
+WORDS = ("great quality fits perfectly colour faded after wash value money comfortable size runs "
+         "small return fabric stitching came apart good awesome loved delivery late product fine").split()
+
+
+def make_run(run, n, repeat_rate, history, rng):
+    """One scrape: new reviews, plus repeats of earlier ones (variants / re-scrapes)"""
+    rows = []
+    for i in range(n):
+        if history and rng.random() < repeat_rate:
+            rows.append(rng.choice(history))
+            continue
+        row = {
+            'Reviewer': f"user{rng.randrange(1_000_000)}",
+            'Date': f"{rng.randint(1, 28)} Mar 2024",
+            'Comment': " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 15))),
+        }
+        rows.append(row)
+        if len(history) < 100_000:
+            history.append(row)
+        else:
+            history[rng.randrange(len(history))] = row
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--per-run', type=int, default=50_000)
+    parser.add_argument('--repeat-rate', type=float, default=0.2)
+    parser.add_argument('--near', action='store_true', help="also run MinHash/LSH near-duplicate detection")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    history = []
+    path = os.path.join(tempfile.mkdtemp(), 'dedup.sqlite')
+    index = DedupIndex(path, near_duplicates=args.near)
+
+    print(f"{'run':>4} {'history':>9} {'dup rate':>9} {'rows/s':>9} {'peak MB':>8} {'index MB':>9}")
+    total = 0
+    for run in range(args.runs):
+        df = make_run(run, args.per_run, args.repeat_rate, history, rng)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        index.filter(df)
+        index.commit()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = index.stats()
+        total += len(df)
+        print(f"{run + 1:>4} {total:>9} {stats['duplicate_rate']:>9.1%} {len(df) / elapsed:>9.0f} "
+              f"{peak / 2**20:>8.1f} {os.path.getsize(path) / 2**20:>9.1f}")
+        index.rollback()  # per-run counters
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
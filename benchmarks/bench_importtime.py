@@ -0,0 +1,77 @@
+"""
+Benchmark: import cost of the app's modules, checked against a budget
+
+Each module is imported in a fresh interpreter under `python -X importtime`, after
+pandas/numpy (which every module needs anyway), so the number is what the module
+itself adds. Heavy optional dependencies must not be loaded at import at all.
+
+Run from the repo root:  python benchmarks/bench_importtime.py [--repeat N]
+Exits non-zero when a module is over budget or pulls in a heavy dependency.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Milliseconds a module may add on top of pandas/numpy (best of --repeat runs)
+BUDGETS = {
+    'scrapper.improved_scraper': 150,
+    'analytics.sentiment_analysis': 50,
+    'analytics.visualizations': 30,
+    'utils.export_utils': 30,
+    'analytics.pipeline': 80,
+    'batch': 200,
+}
+
+# Loaded on first use only: browsers, models, charting and PDF libraries
+HEAVY = ('selenium', 'webdriver_manager', 'textblob', 'vaderSentiment', 'nltk',
+         'plotly', 'wordcloud', 'matplotlib', 'fpdf', 'requests')
+
+LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)")
+
+
+def measure(module):
+    """(cumulative ms of module, set of top-level packages it loaded)"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, 'src'), ROOT]))
+    code = f"import pandas, numpy; import {module}"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, cwd=ROOT, env=env)
+    if result.returncode:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        micros, indent, name = match.groups()
+        loaded.add(name.split('.')[0])
+        if name == module and not indent:
+            cumulative = int(micros) / 1000
+    return cumulative, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'module':<30} {'ms':>8} {'budget':>8}  heavy imports")
+    for module, budget in BUDGETS.items():
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        heavy = sorted(set.union(*(loaded for _, loaded in runs)) & set(HEAVY))
+        over = best > budget or heavy
+        failures += bool(over)
+        print(f"{module:<30} {best:>8.1f} {budget:>8}  {', '.join(heavy) or '-'}{'  OVER' if over else ''}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
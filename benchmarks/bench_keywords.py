@@ -0,0 +1,71 @@
+"""
+Benchmark: keyword extraction, regex per comment per sentiment (old) vs one-pass KeywordCounter (new)
+
+Run from the repo root:  python benchmarks/bench_keywords.py [--reviews N]
+"""
+import argparse
+from collections import Counter
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analytics.keywords import KeywordCounter
+from utils.text_index import STOP_WORDS
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_text_index import make_comments
+
+
+def old_extract_keywords(df, text_column='Comment', sentiment_column='VADER_Sentiment', top_n=20):
+    """The original implementation: filter per sentiment, regex each comment"""
+    results = {}
+    for sentiment in df[sentiment_column].unique():
+        words = []
+        for review in df[df[sentiment_column] == sentiment][text_column]:
+            text_words = re.findall(r'\b[a-z]{3,}\b', str(review).lower())
+            words.extend([w for w in text_words if w not in STOP_WORDS])
+        results[sentiment] = Counter(words).most_common(top_n)
+    return results
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reviews', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Comment': make_comments(args.reviews, rng),
+        'VADER_Sentiment': rng.choice(['Positive', 'Neutral', 'Negative'], size=args.reviews),
+        'Product Name': rng.choice([f"Product {i}" for i in range(50)], size=args.reviews),
+        'Rating': rng.choice(['1', '2', '3', '4', '5'], size=args.reviews),
+    })
+
+    old, old_time = timed(lambda: old_extract_keywords(df))
+    new, new_time = timed(lambda: KeywordCounter().update(df).top(n=20))
+    print(f"{'words by sentiment':<44} old {old_time:6.2f}s  new {new_time:6.2f}s  "
+          f"same: {all(old[k] == new[k] for k in old)}")
+
+    counter, grouped_time = timed(lambda: KeywordCounter(
+        group_by=['VADER_Sentiment', 'Product Name', 'Rating'], ngrams=(1, 2)).update(df))
+    print(f"{'words + bigrams by sentiment/product/rating':<44} {grouped_time:6.2f}s for all three groupings")
+    for column in counter.group_by:
+        _, t = timed(lambda: counter.distinctive(column, n=10, ngram=2))
+        print(f"  distinctive bigrams by {column:<20} {t * 1e3:6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
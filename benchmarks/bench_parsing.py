@@ -0,0 +1,116 @@
+"""
+Micro-benchmark: review page parsing, BeautifulSoup (old) vs lxml (new)
+
+Run from the repo root:  python benchmarks/bench_parsing.py [reviews ...]
+"""
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup as bs
+import lxml.html
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapper.parsing import parse_review_nodes
+
+CONTAINER_XPATH = "//div[@class='detailed-reviews-userReviewsContainer']"
+ITEM_XPATH = f"{CONTAINER_XPATH}//div[@class='user-review-main user-review-showRating']"
+
+
+def review(i):
+    return (
+        '<div class="user-review-userReviewWrapper">'
+        '<div class="user-review-main user-review-showRating">'
+        f'<span class="user-review-starRating">{i % 5 + 1}</span></div>'
+        f'<div class="user-review-reviewTextWrapper">Review {i}: fits well, good fabric, colour as shown</div>'
+        f'<div class="user-review-left"><span>User {i}</span><span>{i % 28 + 1} Jan 2024</span></div>'
+        '</div>'
+    )
+
+
+def fixture_page(n):
+    """
+    A reviews page laid out like Myntra's: one container holding every review,
+    padded with the kind of markup that surrounds reviews
+    """
+    chrome = '<header>' + '<nav><a href="/x">link</a></nav>' * 200 + '</header>'
+    return (
+        f'<html><head><title>Reviews</title></head><body>{chrome}'
+        '<div class="detailed-reviews-userReviewsContainer">'
+        + ''.join(review(i) for i in range(n)) +
+        '</div></body></html>'
+    )
+
+
+def parse_old(html):
+    """The original scraper: whole-page html.parser + cascaded findAll per container"""
+    review_html = bs(html, "html.parser")
+    review_container = (
+        review_html.find_all("div", {"class": "detailed-reviews-userReviewsContainer"}) or
+        review_html.find_all("div", {"class": lambda c: c and "userReview" in c})
+    )
+    reviews = []
+    for container in review_container:
+        user_rating = (
+            container.find_all("div", {"class": "user-review-main user-review-showRating"}) or
+            container.find_all("div", {"class": lambda c: c and "showRating" in (c or "")})
+        )
+        user_comment = (
+            container.find_all("div", {"class": "user-review-reviewTextWrapper"}) or
+            container.find_all("div", {"class": lambda c: c and "reviewText" in (c or "")})
+        )
+        user_name = container.find_all("div", {"class": "user-review-left"})
+        for i in range(len(user_rating)):
+            rating = user_rating[i].find("span", class_="user-review-starRating").get_text().strip()
+            comment = user_comment[i].text.strip()
+            spans = user_name[i].find_all("span")
+            reviews.append((spans[1].text.strip(), rating, spans[0].text.strip(), comment))
+    return reviews
+
+
+def review_nodes(html):
+    """
+    What pagination.NEW_NODES_SCRIPT hands over from the browser: the element
+    around each review's rating row that holds no other review
+    """
+    items = lxml.html.document_fromstring(html).xpath(ITEM_XPATH)
+    nodes = []
+    for i, node in enumerate(items):
+        neighbours = items[max(i - 1, 0):i] + items[i + 1:i + 2]
+        # Like Node.contains: walk up from the neighbour rather than scan the subtree
+        while node.getparent() is not None and not any(
+                node.getparent() in other.iterancestors() for other in neighbours):
+            node = node.getparent()
+        nodes.append(lxml.html.tostring(node, encoding="unicode", with_tail=False))
+    return nodes
+
+
+def parse_new(html):
+    """The new path from the same page: extract one node per review, then parse them with lxml"""
+    return parse_review_nodes(review_nodes(html))[0]
+
+
+def best_of(fn, arg, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    print(f"{'reviews':>8} {'old ms/1k':>10} {'new ms/1k':>10} {'speedup':>8}")
+    for n in sizes:
+        html = fixture_page(n)
+        assert len(parse_old(html)) == n
+        assert parse_old(html) == parse_new(html)
+
+        old = best_of(parse_old, html) / n * 1000 * 1000
+        new = best_of(parse_new, html) / n * 1000 * 1000
+        print(f"{n:>8} {old:>10.1f} {new:>10.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100, 1000, 5000])
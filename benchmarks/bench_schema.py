@@ -0,0 +1,84 @@
+"""
+Benchmark: memory per review row, all-object scraped frame (old) vs compact typed schema (new)
+
+Run from the repo root:  python benchmarks/bench_schema.py [rows ...] [--products N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.normalize import normalize_reviews, sentiment_labels
+from utils.schema import split_products, compact_reviews, bytes_per_row
+
+PHRASES = [
+    "great quality and fits perfectly", "colour faded after one wash", "value for money",
+    "very comfortable", "size runs small, had to return", "not as shown in the picture",
+    "excellent fabric", "stitching came apart", "good", "awesome product, loved it",
+]
+NAMES = ["Aarav", "Priya", "Rohit", "Sneha", "Vikram", "Ananya", "Karan", "Meera", "Myntra Customer"]
+
+
+def make_scraped(n, products, seed=0):
+    """Reviews as the scraper builds them: strings only, product fields repeated per row"""
+    rng = random.Random(seed)
+    catalogue = [
+        (f"Brand{p % 40} Men Solid Round Neck T-shirt {p} | Buy Online at Myntra",
+         f"{rng.uniform(3, 5):.1f}", f"₹{rng.randint(299, 2999):,}")
+        for p in range(products)
+    ]
+    rows = []
+    for _ in range(n):
+        name, overall, price = rng.choice(catalogue)
+        rows.append({
+            'Product Name': name,
+            'Overall Rating': overall,
+            'Price': price,
+            'Date': f"{rng.randint(1, 28)} {rng.choice(['Jan', 'Feb', 'Mar', 'Apr'])} 2024",
+            'Rating': str(rng.randint(1, 5)),
+            'Reviewer': rng.choice(NAMES),
+            'Comment': " ".join(rng.sample(PHRASES, rng.randint(1, 3))),
+        })
+    return pd.DataFrame(rows).astype(object)
+
+
+def analyze(df, seed=0):
+    """Stand-in sentiment columns with the dtypes analyze_dataframe used to produce"""
+    rng = np.random.default_rng(seed)
+    for score, label in (('TB_Polarity', 'TB_Sentiment'), ('VADER_Score', 'VADER_Sentiment')):
+        df[score] = rng.uniform(-1, 1, len(df))
+        df[label] = np.asarray(sentiment_labels(df[score]), dtype=object)
+    df['TB_Subjectivity'] = rng.uniform(0, 1, len(df))
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('rows', nargs='*', type=int, default=[10_000, 100_000])
+    parser.add_argument('--products', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'old B/row':>10} {'new B/row':>10} {'tables B/row':>13} {'saving':>7} {'convert s':>10}")
+    for n in args.rows:
+        old = analyze(normalize_reviews(make_scraped(n, args.products)))
+
+        start = time.perf_counter()
+        new = compact_reviews(old)
+        elapsed = time.perf_counter() - start
+
+        products, reviews = split_products(old)
+        assert (new['Product Name'].astype(object).to_numpy() == old['Product Name'].to_numpy()).all()
+
+        old_b, new_b = bytes_per_row(old), bytes_per_row(new)
+        tables_b = (products.memory_usage(deep=True).sum() + reviews.memory_usage(deep=True).sum()) / n
+        print(f"{n:>8} {old_b:>10.0f} {new_b:>10.0f} {tables_b:>13.0f} {1 - new_b / old_b:>7.0%} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: sentiment scoring throughput, row-by-row apply (old) vs batch engine (new)
+
+Run from the repo root:  python benchmarks/bench_sentiment.py [rows ...] [--workers N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analytics.sentiment_analysis import SentimentAnalyzer
+
+PHRASES = [
+    "great quality and fits perfectly", "colour faded after one wash", "value for money",
+    "very comfortable", "size runs small, had to return", "not as shown in the picture",
+    "excellent fabric", "stitching came apart", "good", "awesome product, loved it",
+    "delivery was late but product is fine", "worst purchase ever",
+]
+
+
+def make_reviews(n, seed=0):
+    """Review comments with the heavy repetition typical of short e-commerce reviews"""
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'Comment': [" ".join(rng.sample(PHRASES, rng.randint(1, 3))) for _ in range(n)]
+    })
+
+
+def analyze_old(analyzer, df):
+    """The original analyze_dataframe: two TextBlob passes and one VADER pass via apply"""
+    df['TB_Polarity'], df['TB_Subjectivity'] = zip(*df['Comment'].apply(analyzer.analyze_textblob))
+    df['TB_Sentiment'] = df['TB_Polarity'].apply(analyzer.get_sentiment_label)
+    df['VADER_Score'] = df['Comment'].apply(analyzer.analyze_vader)
+    df['VADER_Sentiment'] = df['VADER_Score'].apply(analyzer.get_sentiment_label)
+    return df
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('rows', nargs='*', type=int, default=[10_000, 100_000])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--skip-old-above', type=int, default=20_000,
+                        help="the old path is extrapolated from this many rows for larger sizes")
+    args = parser.parse_args()
+
+    serial = SentimentAnalyzer(n_workers=1)
+    parallel = SentimentAnalyzer(n_workers=args.workers)
+
+    print(f"{'rows':>8} {'old rows/s':>11} {'new rows/s':>11} {'new (x' + str(args.workers) + ') rows/s':>16} {'per core':>9}")
+    for n in args.rows:
+        df = make_reviews(n)
+
+        sample = df.head(min(n, args.skip_old_above)).copy()
+        old_df, old_t = timed(analyze_old, serial, sample)
+        old_rate = len(sample) / old_t
+
+        new_df, new_t = timed(serial.analyze_dataframe, df.copy())
+        par_df, par_t = timed(parallel.analyze_dataframe, df.copy())
+
+        cols = ['TB_Polarity', 'TB_Subjectivity', 'VADER_Score']
+        assert (new_df.head(len(sample))[cols].values == old_df[cols].values).all()
+        assert (new_df[cols].values == par_df[cols].values).all()
+
+        print(f"{n:>8} {old_rate:>11.0f} {n / new_t:>11.0f} {n / par_t:>16.0f} {n / par_t / args.workers:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
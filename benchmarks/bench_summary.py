@@ -0,0 +1,84 @@
+"""
+Benchmark: dashboard metrics by filtering the frame per metric (old) vs one DatasetSummary (new),
+and keeping a summary current over streamed batches vs recomputing it
+
+Run from the repo root:  python benchmarks/bench_summary.py [--reviews N] [--batch N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analytics.summary import DatasetSummary
+from utils.normalize import normalize_reviews, sentiment_labels, numeric_rating, parsed_dates
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_schema import make_scraped
+
+
+def old_metrics(df):
+    """What the quick stats, Analytics tab, stats table, Excel sheet and report each computed"""
+    for _ in range(2):  # quick stats and Analytics tab
+        len(df[df['VADER_Sentiment'] == 'Positive'])
+        len(df[df['VADER_Sentiment'] == 'Negative'])
+        len(df[df['VADER_Sentiment'] == 'Neutral'])
+        df['VADER_Score'].mean()
+    for _ in range(3):  # detailed stats table, Excel statistics sheet, summary report
+        df['VADER_Sentiment'].value_counts()
+        numeric_rating(df).mean()
+        df['VADER_Score'].mean()
+        df['Product Name'].nunique()
+    df['Rating'].value_counts().sort_index()
+    df['Product Name'].value_counts().head(5)
+    dates = parsed_dates(df)
+    dates.min(), dates.max()
+    df.groupby('Product Name', observed=True)[['Rating_Numeric', 'VADER_Score']].mean()
+
+
+def new_metrics(df):
+    summary = DatasetSummary.from_frame(df)
+    summary.sentiment_counts, summary.rating_counts, summary.product_stats
+    summary.avg_rating, summary.avg_sentiment, summary.products, summary.date_range
+    return summary
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reviews', type=int, default=500_000)
+    parser.add_argument('--products', type=int, default=500)
+    parser.add_argument('--batch', type=int, default=50_000, help="reviews per streamed batch")
+    args = parser.parse_args()
+
+    df = normalize_reviews(make_scraped(args.reviews, args.products))
+    df['VADER_Score'] = np.random.default_rng(0).uniform(-1, 1, len(df))
+    df['VADER_Sentiment'] = sentiment_labels(df['VADER_Score'])
+
+    _, old_time = timed(lambda: old_metrics(df))
+    _, new_time = timed(lambda: new_metrics(df))
+    print(f"all dashboard metrics, {len(df)} reviews:  old {old_time:.2f}s  new {new_time:.2f}s")
+
+    batches = [df.iloc[i:i + args.batch] for i in range(0, len(df), args.batch)]
+    summary = DatasetSummary()
+    rescan = incremental = 0.0
+    for n, batch in enumerate(batches, 1):
+        _, t = timed(lambda: summary.update(batch).sentiment_counts)
+        incremental += t
+        _, t = timed(lambda: DatasetSummary.from_frame(df.iloc[:n * args.batch]).sentiment_counts)
+        rescan += t
+    print(f"{len(batches)} streamed batches of {args.batch}:  rescan every batch {rescan:.2f}s  "
+          f"update per batch {incremental:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: inverted text index build, query latency and keyword stats over many reviews
+
+Run from the repo root:  python benchmarks/bench_text_index.py [--reviews N] [--batch N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.text_index import InvertedIndex
+
+WORDS = ("great quality fits perfectly colour faded after wash value for money comfortable size runs "
+         "small return fabric stitching came apart good awesome loved delivery late product fine not "
+         "worth price soft material true to fit cotton shrink tight loose recommend").split()
+
+QUERIES = [
+    'fabric',
+    'great quality',
+    '"colour faded"',
+    '"runs small" -return',
+    'stitching OR shrink',
+    'w1234',
+    '"value for money" recommend',
+]
+
+
+def make_comments(n, rng, vocabulary=20_000):
+    # Zipf-like word choice over the review words plus a long tail of rarer ones,
+    # so some terms are in most reviews and most terms in very few, as in real text
+    words = np.array(WORDS + [f"w{i}" for i in range(vocabulary - len(WORDS))])
+    weights = 1 / np.arange(1, len(words) + 1)
+    lengths = rng.integers(3, 26, size=n)
+    tokens = words[rng.choice(len(words), size=lengths.sum(), p=weights / weights.sum())]
+    return [" ".join(comment) for comment in np.split(tokens, np.cumsum(lengths)[:-1])]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reviews', type=int, default=1_000_000)
+    parser.add_argument('--batch', type=int, default=100_000, help="reviews per add() (one ingestion)")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    comments = make_comments(args.reviews, rng)
+    path = os.path.join(tempfile.mkdtemp(), 'text_index')
+
+    index = InvertedIndex(path)
+    start = time.perf_counter()
+    for i in range(0, len(comments), args.batch):
+        index.add(comments[i:i + args.batch])
+        index.save()
+    build = time.perf_counter() - start
+    print(f"built {index.n_docs} reviews in {build:.1f}s ({index.n_docs / build:,.0f} reviews/s), "
+          f"{len(index.segments)} segments, {len(index.vocab.terms)} terms")
+
+    start = time.perf_counter()
+    index = InvertedIndex(path)
+    print(f"loaded in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    print(f"{'query':<34} {'matches':>9} {'match ms':>9} {'ranked ms':>10}")
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            t = time.perf_counter()
+            docs = index.match(query)
+            timings.append(time.perf_counter() - t)
+        ranked = []
+        for _ in range(args.repeat):
+            t = time.perf_counter()
+            index.search(query, limit=50)
+            ranked.append(time.perf_counter() - t)
+        print(f"{query:<34} {len(docs):>9} {np.median(timings) * 1e3:>9.1f} {np.median(ranked) * 1e3:>10.1f}")
+
+    subset = np.zeros(index.n_docs, dtype=bool)
+    subset[::3] = True
+    t = time.perf_counter()
+    top = index.top_terms(subset, n=10, min_length=3)
+    print(f"top terms over {subset.sum()} reviews in {(time.perf_counter() - t) * 1e3:.0f} ms: "
+          f"{', '.join(term for term, _ in top[:5])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: word clouds from joined comment text via matplotlib (old) vs from shared
+keyword counts rendered straight to PNG (new)
+
+Run from the repo root:  python benchmarks/bench_wordcloud.py [--reviews N]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from analytics.keywords import KeywordCounter
+from analytics.visualizations import AdvancedVisualizer
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_text_index import make_comments
+
+SENTIMENTS = ['Positive', 'Negative']
+
+
+def old_wordcloud(df, sentiment_type):
+    """The original implementation: WordCloud.generate on one big string, drawn through matplotlib"""
+    from wordcloud import WordCloud
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    text = ' '.join(df[df['VADER_Sentiment'] == sentiment_type]['Comment'].astype(str))
+    wordcloud = WordCloud(width=800, height=400, background_color='white',
+                          colormap='viridis' if sentiment_type == 'Positive' else 'Reds',
+                          max_words=100).generate(text)
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(f'{sentiment_type} Reviews Word Cloud', fontsize=16, fontweight='bold')
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', bbox_inches='tight', dpi=150)
+    plt.close()
+    return buf.getvalue()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reviews', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Comment': make_comments(args.reviews, rng),
+        'VADER_Sentiment': rng.choice(['Positive', 'Neutral', 'Negative'], size=args.reviews),
+    })
+
+    # Warm imports and font loading so neither side pays them
+    old_wordcloud(df.head(100), 'Positive')
+    AdvancedVisualizer(df.head(100)).create_wordcloud('Positive')
+
+    old, old_time = timed(lambda: [old_wordcloud(df, s) for s in SENTIMENTS])
+    print(f"old: generate + matplotlib, both clouds        {old_time:6.2f}s  "
+          f"({sum(len(png) for png in old) / 1e3:.0f} KB PNG)")
+
+    counter, count_time = timed(lambda: KeywordCounter().update(df))
+    viz = AdvancedVisualizer(df)
+    new, draw_time = timed(lambda: [
+        viz.create_wordcloud(s, frequencies=counter.counts().get(s, {})).getvalue() for s in SENTIMENTS
+    ])
+    print(f"new: shared counts {count_time:.2f}s + from_frequencies {draw_time:.2f}s  "
+          f"{count_time + draw_time:6.2f}s  ({sum(len(png) for png in new) / 1e3:.0f} KB PNG)")
+    print(f"     draw only (counts already shared with the keyword tables)  {draw_time:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
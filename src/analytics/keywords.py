@@ -0,0 +1,164 @@
+from collections import Counter, defaultdict
+import math
+import re
+import logging
+
+import pandas as pd
+
+from utils.text_index import STOP_WORDS
+
+logger = logging.getLogger(__name__)
+
+# Words of 3+ letters; the newline matches too, marking where one comment ends
+KEYWORD_PATTERN = re.compile(r"\b[a-z]{3,}\b|\n")
+WORD_PATTERN = re.compile(r"\b[a-z]{3,}\b")
+BOUNDARY = "\n"
+
+# Phrases may start with a negation ("not worth", "not good"), not with other stop words
+PHRASE_EDGE_STOP_WORDS = STOP_WORDS - {'not'} | {BOUNDARY}
+
+
+def _as_strings(texts):
+    if isinstance(texts, pd.Series):
+        # A list iterates much faster than arrow-backed strings
+        texts = texts.tolist()
+    return [text if isinstance(text, str) else str(text) for text in texts]
+
+
+def _count_words(text):
+    # Whitespace is always a word boundary, so each distinct whitespace-separated chunk
+    # yields the same words wherever it occurs: count the chunks in C, then run the
+    # regex once per distinct chunk instead of over the whole text
+    counts = Counter()
+    for chunk, count in Counter(text.split()).items():
+        for word in WORD_PATTERN.findall(chunk):
+            counts[word] += count
+    for word in STOP_WORDS:
+        counts.pop(word, None)
+    return counts
+
+
+def count_terms(texts, ngrams=(1,)):
+    """
+    Keyword counts over comments: words of 3+ letters minus stop words, plus n-grams
+    of consecutive words (n > 1) within a comment that neither start nor end with a
+    stop word. All texts are lowercased and tokenized once, in one pass; words and
+    n-grams are counted from the same tokens.
+    """
+    text = BOUNDARY.join(_as_strings(texts)).lower()
+    if not any(n > 1 for n in ngrams):
+        return _count_words(text) if 1 in ngrams else Counter()
+
+    words = KEYWORD_PATTERN.findall(text)
+    counts = Counter()
+    for n in ngrams:
+        if n == 1:
+            counts.update(words)
+            for word in STOP_WORDS | {BOUNDARY}:
+                counts.pop(word, None)
+            continue
+        counts.update(
+            " ".join(gram) for gram in zip(*(words[i:] for i in range(n)))
+            if gram[0] not in PHRASE_EDGE_STOP_WORDS and gram[-1] not in PHRASE_EDGE_STOP_WORDS
+            and BOUNDARY not in gram
+        )
+    return counts
+
+
+def _ngram_size(term):
+    return term.count(" ") + 1
+
+
+class KeywordCounter:
+    """
+    Keyword and phrase counts per group of reviews (sentiment, product, rating...).
+
+    update() tokenizes each comment once and adds its terms to the counter of its
+    combination of group values, so one pass serves every grouping; counts per single
+    column are summed from those on first request. Calling update() with each new
+    batch keeps the counts current without rescanning earlier reviews.
+    """
+
+    def __init__(self, group_by=('VADER_Sentiment',), ngrams=(1,), text_column='Comment'):
+        """
+        Args:
+            group_by: Columns to count by; top()/distinctive() can use any of them
+            ngrams: Phrase lengths to count, e.g. (1, 2, 3) for words, bigrams and trigrams
+            text_column: Column holding the review text
+        """
+        self.group_by = list(group_by)
+        self.ngrams = tuple(ngrams)
+        self.text_column = text_column
+        self.reviews = 0
+        self._counts = defaultdict(Counter)  # tuple of group values -> term counts
+        self._by_column = {}
+
+    def update(self, df):
+        """Add a batch of reviews; returns self"""
+        if df is None or df.empty:
+            return self
+        texts = df[self.text_column].fillna('')
+        for key, group in texts.groupby([df[col] for col in self.group_by], observed=True, dropna=False, sort=False):
+            # Missing group values become None (NaN keys never compare equal)
+            key = tuple(None if pd.isna(value) else value for value in key)
+            self._counts[key].update(count_terms(group, self.ngrams))
+        self.reviews += len(df)
+        self._by_column = {}
+        return self
+
+    def counts(self, column=None):
+        """{group value: Counter of terms} for one of the group_by columns (default the first)"""
+        column = column or self.group_by[0]
+        if column not in self._by_column:
+            position = self.group_by.index(column)
+            totals = defaultdict(Counter)
+            for key, counter in self._counts.items():
+                totals[key[position]].update(counter)
+            self._by_column[column] = dict(totals)
+        return self._by_column[column]
+
+    def top(self, column=None, n=20, ngram=None):
+        """
+        Most frequent terms per group
+
+        Args:
+            column: group_by column (default the first)
+            ngram: Only terms of this many words (default: every counted length)
+
+        Returns: {group value: [(term, count), ...]}
+        """
+        results = {}
+        for value, counter in self.counts(column).items():
+            if ngram is None:
+                results[value] = counter.most_common(n)
+            else:
+                results[value] = Counter(
+                    {term: count for term, count in counter.items() if _ngram_size(term) == ngram}
+                ).most_common(n)
+        return results
+
+    def distinctive(self, column=None, n=20, ngram=None):
+        """
+        Terms that set each group apart, by TF-IDF with the groups as documents:
+        share of the group's terms x log((1 + groups) / (1 + groups using the term)).
+        Terms used by every group score 0 and are left out.
+
+        Returns: {group value: [(term, score), ...]}
+        """
+        groups = self.counts(column)
+        group_freq = Counter()
+        for counter in groups.values():
+            group_freq.update(counter.keys())
+
+        results = {}
+        for value, counter in groups.items():
+            total = sum(counter.values()) or 1
+            scores = {}
+            for term, count in counter.items():
+                if ngram is not None and _ngram_size(term) != ngram:
+                    continue
+                idf = math.log((1 + len(groups)) / (1 + group_freq[term]))
+                if idf > 0:
+                    scores[term] = count / total * idf
+            results[value] = [(term, round(score, 5)) for term, score in Counter(scores).most_common(n)]
+        return results
@@ -0,0 +1,24 @@
+from utils.normalize import normalize_reviews
+from utils.schema import compact_reviews
+from .sentiment_analysis import SentimentAnalyzer
+
+
+def analyze_reviews(data, score_cache=None, n_workers=1):
+    """
+    Scraped reviews -> typed columns, sentiment scores and the compact schema,
+    ready for the dashboard, exports or the batch runner
+    
+    Args:
+        data: Review DataFrame from the scraper or the review store
+        score_cache: Optional ScoreCache shared across runs
+        n_workers: Processes used for sentiment scoring
+    """
+    # Typed rating/price/date columns, parsed once for every consumer
+    if 'Rating_Numeric' not in data.columns:
+        data = normalize_reviews(data)
+    
+    analyzer = SentimentAnalyzer(n_workers=n_workers, cache=score_cache)
+    data = analyzer.analyze_dataframe(data)
+    
+    # Categorical/float32 schema keeps large result sets small
+    return compact_reviews(data)
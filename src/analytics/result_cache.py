@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import hashlib
+import io
+import pickle
+import sys
+import threading
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def dataset_fingerprint(df):
+    """Content hash of a review frame: equal data gives an equal fingerprint across reruns and sessions"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _size_of(value):
+    """Approximate bytes held by a cached result"""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, io.BytesIO):
+        return value.getbuffer().nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    try:
+        # Plotly figures, keyword dicts: the pickled size tracks the data they hold
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    In-memory LRU of derived results (figures, tables, images) keyed by dataset
+    fingerprint and result name, bounded by total approximate size
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        """
+        Args:
+            max_bytes: Least recently used results beyond this total size are evicted
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, fingerprint, name, compute):
+        """
+        Return the cached result for (fingerprint, name), computing it on a miss
+
+        Args:
+            fingerprint: dataset_fingerprint() of the data compute reads
+            name: What is computed, e.g. "sentiment_distribution"
+            compute: Called with no arguments on a miss; None results are cached too
+        """
+        key = (fingerprint, name)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # Computed outside the lock so other sessions are not held up meanwhile
+        value = compute()
+        size = _size_of(value)
+
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self._bytes += size
+                self._evict()
+        return value
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
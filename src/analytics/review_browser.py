@@ -0,0 +1,132 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from utils.normalize import numeric_rating, parsed_dates
+from utils.text_index import InvertedIndex, STOP_WORDS
+
+logger = logging.getLogger(__name__)
+
+FILTER_COLUMNS = ['VADER_Sentiment', 'Product Name', 'Rating']
+
+BEST_MATCH = 'Best match'
+
+# Sort label -> (column, ascending); missing values always sort last. Best match
+# ranks by BM25 while searching and falls back to the next option otherwise
+SORT_OPTIONS = {
+    BEST_MATCH: None,
+    'Newest first': ('Date_Parsed', False),
+    'Oldest first': ('Date_Parsed', True),
+    'Most positive': ('VADER_Score', False),
+    'Most negative': ('VADER_Score', True),
+    'Highest rating': ('Rating_Numeric', False),
+    'Lowest rating': ('Rating_Numeric', True),
+}
+
+
+class ReviewBrowser:
+    """
+    Filter, search, sort and page an analyzed review frame without touching every row per page.
+
+    Built once per dataset: one boolean mask per filter value, one row order per sort
+    option (on first use) and an InvertedIndex over comments (on first search).
+    A page view then costs a few vectorized mask operations plus the rows shown.
+    """
+
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        self._masks = {}
+        for col in FILTER_COLUMNS:
+            if col not in self.df.columns:
+                continue
+            codes, values = pd.factorize(self.df[col], sort=True)
+            self._masks[col] = {value: codes == code for code, value in enumerate(values)}
+        self._orders = {}
+        self._index = None
+        self._ranking = (None, None)
+
+    def __len__(self):
+        return len(self.df)
+
+    def options(self, col):
+        """Filter values of a column, sorted"""
+        return list(self._masks.get(col, {}))
+
+    def _sort_values(self, col):
+        if col == 'Rating_Numeric':
+            return numeric_rating(self.df).to_numpy(dtype=float)
+        if col == 'Date_Parsed':
+            dates = parsed_dates(self.df)
+            return np.where(dates.isna(), np.nan, dates.to_numpy(dtype='datetime64[ns]').astype('int64'))
+        return pd.to_numeric(self.df[col], errors='coerce').to_numpy(dtype=float)
+
+    def order(self, sort):
+        """Row positions in the order of a SORT_OPTIONS label"""
+        if SORT_OPTIONS[sort] is None:
+            sort = next(label for label, option in SORT_OPTIONS.items() if option is not None)
+        if sort not in self._orders:
+            col, ascending = SORT_OPTIONS[sort]
+            values = self._sort_values(col)
+            keys = values if ascending else -values
+            # NaN sorts last either way; stable so ties keep scrape order
+            self._orders[sort] = np.argsort(keys, kind='stable')
+        return self._orders[sort]
+
+    @property
+    def index(self):
+        """InvertedIndex over the comments; doc ids are row positions"""
+        if self._index is None:
+            self._index = InvertedIndex()
+            self._index.add(self.df['Comment'].fillna(''))
+            logger.info(f"Indexed {len(self._index.vocab)} terms over {len(self.df)} comments")
+        return self._index
+
+    def search(self, query):
+        """Mask of reviews whose comment matches query (all rows for an empty query)"""
+        if not str(query).strip():
+            return np.ones(len(self.df), dtype=bool)
+        mask = np.zeros(len(self.df), dtype=bool)
+        mask[self.index.match(query)] = True
+        return mask
+
+    def ranking(self, query):
+        """Rows matching query, best BM25 match first (the last query's ranking is kept)"""
+        if self._ranking[0] != query:
+            self._ranking = (query, self.index.search(query)[0])
+        return self._ranking[1]
+
+    def select(self, filters=None, query=""):
+        """
+        Mask of reviews matching the filters and the search query
+
+        Args:
+            filters: {column: selected values}; a column left out is not filtered
+            query: Comment search (InvertedIndex syntax: words, OR, -word, "phrase")
+        """
+        mask = self.search(query)
+        for col, selected in (filters or {}).items():
+            values = self._masks.get(col, {})
+            selected_mask = np.zeros(len(self.df), dtype=bool)
+            for value in selected:
+                if value in values:
+                    selected_mask |= values[value]
+            mask &= selected_mask
+        return mask
+
+    def page(self, mask, sort=BEST_MATCH, page=0, page_size=25, query=""):
+        """The page-th page_size rows of the selection in sort order, as a DataFrame"""
+        if SORT_OPTIONS[sort] is None and str(query).strip():
+            order = self.ranking(query)
+        else:
+            order = self.order(sort)
+        rows = order[mask[order]]
+        return self.df.iloc[rows[page * page_size:(page + 1) * page_size]]
+
+    def top_terms(self, mask, n=10):
+        """Most frequent words (3+ letters, no stop words) in the selected comments"""
+        return self.index.top_terms(mask, n=n, exclude=STOP_WORDS, min_length=3)
+
+    def frame(self, mask):
+        """Every selected row in dataset order (for exports)"""
+        return self.df[mask]
@@ -0,0 +1,106 @@
+from importlib import metadata
+import hashlib
+import threading
+import time
+import logging
+
+from utils.sqlite import connect, chunked
+
+logger = logging.getLogger(__name__)
+
+
+def _package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# Bump SCORING_REVISION when the scoring code itself changes meaning
+SCORING_REVISION = 1
+ANALYZER_VERSION = (
+    f"r{SCORING_REVISION}-textblob{_package_version('textblob')}"
+    f"-vader{_package_version('vaderSentiment')}"
+)
+
+
+def normalize_comment(text):
+    """Collapse whitespace; both models tokenize on it, so scores are unchanged"""
+    return " ".join(str(text).split())
+
+
+def comment_key(text, version=ANALYZER_VERSION):
+    """Cache key for an already-normalized comment under one analyzer version"""
+    return hashlib.blake2b(f"{version}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+class ScoreCache:
+    """Persistent sentiment scores in SQLite, keyed by comment hash, with LRU eviction"""
+
+    def __init__(self, path: str = ".cache/sentiment.sqlite", max_entries: int = 1_000_000):
+        """
+        Args:
+            path: SQLite file (created if missing)
+            max_entries: Least recently used scores beyond this count are evicted
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            " key BLOB PRIMARY KEY, polarity REAL, subjectivity REAL, compound REAL, accessed REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS scores_accessed ON scores (accessed)")
+        self._conn.commit()
+
+    def get_many(self, keys):
+        """Return {key: (polarity, subjectivity, compound)} for the keys present"""
+        found = {}
+        now = time.time()
+        with self._lock:
+            for chunk in chunked(keys):
+                placeholders = ",".join("?" * len(chunk))
+                for key, polarity, subjectivity, compound in self._conn.execute(
+                    f"SELECT key, polarity, subjectivity, compound FROM scores WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    found[key] = (polarity, subjectivity, compound)
+            self._conn.executemany("UPDATE scores SET accessed = ? WHERE key = ?", [(now, key) for key in found])
+            self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """Store (key, (polarity, subjectivity, compound)) pairs, then evict over max_entries"""
+        now = time.time()
+        rows = [(key, float(p), float(s), float(c), now) for key, (p, s, c) in items]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)", rows)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # Trim to 90% so eviction doesn't run on every insert once full
+        excess = count - int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY accessed LIMIT ?)", (excess,)
+        )
+        logger.info(f"Sentiment cache evicted {excess} scores")
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,75 @@
 import pandas as pd
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from .score_cache import normalize_comment, comment_key
+from .keywords import KeywordCounter
+from utils.normalize import sentiment_labels
+
 logger = logging.getLogger(__name__)
 
+# One VADER instance per worker process (its lexicon takes a while to load).
+# TextBlob and VADER are imported on first scoring, so runs answered entirely
+# from the score cache never load either model.
+_vader = None
+
+
+def _get_vader():
+    global _vader
+    if _vader is None:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        _vader = SentimentIntensityAnalyzer()
+    return _vader
+
+
+def _score_texts(texts):
+    """
+    Score a chunk of texts with both models, each computed once per text
+    Returns: list of (polarity, subjectivity, compound) tuples
+    """
+    from textblob import TextBlob
+    vader = _get_vader()
+    
+    scores = []
+    for text in texts:
+        try:
+            sentiment = TextBlob(text).sentiment
+            polarity, subjectivity = sentiment.polarity, sentiment.subjectivity
+        except:
+            polarity, subjectivity = 0, 0
+        try:
+            compound = vader.polarity_scores(text)['compound']
+        except:
+            compound = 0
+        scores.append((polarity, subjectivity, compound))
+    return scores
+
 
 class SentimentAnalyzer:
     """Analyze sentiment of reviews using multiple methods"""
     
-    def __init__(self):
-        self.vader = SentimentIntensityAnalyzer()
+    def __init__(self, n_workers=1, chunk_size=2000, cache=None):
+        """
+        Args:
+            n_workers: Processes used by analyze_dataframe (1 scores in-process)
+            chunk_size: Unique texts sent to a worker process at a time
+            cache: ScoreCache consulted before scoring and filled afterwards
+        """
+        self.n_workers = max(1, int(n_workers))
+        self.chunk_size = chunk_size
+        self.cache = cache
+    
+    @property
+    def vader(self):
+        return _get_vader()
     
     def analyze_textblob(self, text):
         """
         Analyze sentiment using TextBlob
         Returns: polarity (-1 to 1), subjectivity (0 to 1)
         """
+        from textblob import TextBlob
         try:
             blob = TextBlob(str(text))
             return blob.sentiment.polarity, blob.sentiment.subjectivity
@@ -45,19 +98,70 @@ class SentimentAnalyzer:
         else:
             return "Neutral"
     
+    def score_texts(self, texts):
+        """
+        Score unique texts, fanning chunks out to worker processes when configured
+        Returns: float array of shape (len(texts), 3): polarity, subjectivity, compound
+        """
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 3))
+        
+        if self.n_workers == 1 or len(texts) <= self.chunk_size:
+            scores = _score_texts(texts)
+        else:
+            chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+            with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+                scores = [score for chunk in executor.map(_score_texts, chunks) for score in chunk]
+        
+        return np.asarray(scores, dtype=float)
+    
+    def _cached_scores(self, texts):
+        """score_texts, paying only for comments not already in the score cache"""
+        keys = [comment_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        fresh = self.score_texts([texts[i] for i in missing])
+        self.cache.put_many((keys[i], score) for i, score in zip(missing, fresh))
+        
+        hits = len(keys) - len(missing)
+        logger.info(f"Sentiment cache: {hits}/{len(keys)} hits ({hits / len(keys) * 100 if keys else 0:.0f}%), "
+                    f"lifetime hit rate {self.cache.hit_rate * 100:.0f}%")
+        
+        scores = np.empty((len(keys), 3))
+        for i, key in enumerate(keys):
+            if key in cached:
+                scores[i] = cached[key]
+        if missing:
+            scores[missing] = fresh
+        return scores
+    
     def analyze_dataframe(self, df, text_column='Comment'):
         """
         Add sentiment analysis to entire dataframe
+        
+        Identical comments are scored once and the results broadcast back to every row.
         """
         logger.info("Starting sentiment analysis...")
         
+        codes, uniques = pd.factorize(df[text_column].map(normalize_comment).to_numpy(dtype=object))
+        scores = self._cached_scores(uniques) if self.cache is not None else self.score_texts(uniques)
+        logger.info(f"Scored {len(uniques)} unique comments for {len(df)} reviews")
+        
+        if len(scores):
+            scores = scores[codes]
+        else:
+            scores = np.zeros((len(df), 3))
+        
         # TextBlob analysis
-        df['TB_Polarity'], df['TB_Subjectivity'] = zip(*df[text_column].apply(self.analyze_textblob))
-        df['TB_Sentiment'] = df['TB_Polarity'].apply(self.get_sentiment_label)
+        df['TB_Polarity'] = scores[:, 0]
+        df['TB_Subjectivity'] = scores[:, 1]
+        df['TB_Sentiment'] = sentiment_labels(df['TB_Polarity'])
         
         # VADER analysis
-        df['VADER_Score'] = df[text_column].apply(self.analyze_vader)
-        df['VADER_Sentiment'] = df['VADER_Score'].apply(self.get_sentiment_label)
+        df['VADER_Score'] = scores[:, 2]
+        df['VADER_Sentiment'] = sentiment_labels(df['VADER_Score'])
         
         logger.info("Sentiment analysis completed!")
         return df
@@ -65,10 +169,11 @@ class SentimentAnalyzer:
     def get_sentiment_stats(self, df):
         """
         Get sentiment statistics
+        (labels are categorical, so drop the zero counts of labels no review has)
         """
         stats = {
-            'TextBlob': df['TB_Sentiment'].value_counts().to_dict(),
-            'VADER': df['VADER_Sentiment'].value_counts().to_dict(),
+            'TextBlob': df['TB_Sentiment'].value_counts()[lambda counts: counts > 0].to_dict(),
+            'VADER': df['VADER_Sentiment'].value_counts()[lambda counts: counts > 0].to_dict(),
             'Average_Polarity': df['TB_Polarity'].mean(),
             'Average_VADER': df['VADER_Score'].mean()
         }
@@ -78,31 +183,7 @@ class SentimentAnalyzer:
 def extract_keywords(df, text_column='Comment', sentiment_column='VADER_Sentiment', top_n=20):
     """
     Extract most common keywords from reviews by sentiment
+    (one pass; see keywords.KeywordCounter for phrases, other groupings and batches)
     """
-    from collections import Counter
-    import re
-    
-    # Stop words to ignore
-    stop_words = set(['the', 'is', 'in', 'and', 'to', 'a', 'of', 'for', 'it', 'this', 
-                      'that', 'on', 'with', 'as', 'are', 'was', 'be', 'but', 'not',
-                      'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                      'can', 'could', 'should', 'i', 'you', 'my', 'me', 'your'])
-    
-    results = {}
-    
-    for sentiment in df[sentiment_column].unique():
-        sentiment_reviews = df[df[sentiment_column] == sentiment][text_column]
-        
-        # Extract words
-        words = []
-        for review in sentiment_reviews:
-            # Convert to lowercase and extract words
-            text = str(review).lower()
-            text_words = re.findall(r'\b[a-z]{3,}\b', text)
-            words.extend([w for w in text_words if w not in stop_words])
-        
-        # Count frequency
-        word_counts = Counter(words)
-        results[sentiment] = word_counts.most_common(top_n)
-    
-    return results
+    counter = KeywordCounter(group_by=[sentiment_column], text_column=text_column).update(df)
+    return counter.top(n=top_n)
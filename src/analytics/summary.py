@@ -0,0 +1,139 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from utils.normalize import numeric_rating, parsed_dates
+
+logger = logging.getLogger(__name__)
+
+# One aggregate cell per combination of these; every metric is summed from the cells
+GROUP_COLUMNS = ['Product Name', 'VADER_Sentiment', 'Rating']
+
+# How cells from separate batches combine
+CELL_AGGREGATES = {
+    'reviews': 'sum',
+    'rating_sum': 'sum',
+    'rated': 'sum',
+    'score_sum': 'sum',
+    'scored': 'sum',
+    'first_date': 'min',
+    'last_date': 'max',
+}
+
+
+class DatasetSummary:
+    """
+    Dashboard and report metrics for a review frame: counts by sentiment, rating
+    histogram, per-product stats, date range and averages.
+
+    update() aggregates a batch in one grouped pass into cells of counts and sums per
+    product/sentiment/rating, and merges them into the cells of earlier batches, so
+    streamed data is never rescanned. Every metric is read off the few cells.
+    Columns missing from a batch (e.g. sentiment before analysis) count as unknown.
+    """
+
+    def __init__(self):
+        self._cells = None
+        self._derived = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls().update(df)
+
+    def update(self, df):
+        """Add a batch of reviews; returns self"""
+        if df is None or df.empty:
+            return self
+        missing = pd.Series(np.nan, index=df.index)
+        keys = [df[col] if col in df.columns else missing.rename(col) for col in GROUP_COLUMNS]
+        values = pd.DataFrame({
+            'rating': numeric_rating(df).astype(float) if 'Rating' in df.columns else missing,
+            'score': df['VADER_Score'] if 'VADER_Score' in df.columns else missing,
+            'date': parsed_dates(df) if 'Date' in df.columns or 'Date_Parsed' in df.columns else pd.NaT,
+        }, index=df.index)
+        cells = values.groupby(keys, observed=True, dropna=False, sort=False).agg(
+            reviews=('rating', 'size'),
+            rating_sum=('rating', 'sum'),
+            rated=('rating', 'count'),
+            score_sum=('score', 'sum'),
+            scored=('score', 'count'),
+            first_date=('date', 'min'),
+            last_date=('date', 'max'),
+        )
+        if self._cells is not None:
+            cells = pd.concat([self._cells, cells]).groupby(
+                level=list(range(len(GROUP_COLUMNS))), observed=True, dropna=False, sort=False
+            ).agg(CELL_AGGREGATES)
+        self._cells = cells
+        self._derived = {}
+        return self
+
+    def _by(self, column):
+        """Cell totals per value of one group column (missing values left out)"""
+        if column not in self._derived:
+            if self._cells is None:
+                totals = pd.DataFrame(columns=list(CELL_AGGREGATES))
+            else:
+                totals = self._cells.groupby(level=column, observed=True, sort=False).agg(CELL_AGGREGATES)
+                totals = totals[totals['reviews'] > 0]
+            self._derived[column] = totals
+        return self._derived[column]
+
+    def _sum(self, column):
+        return 0 if self._cells is None else self._cells[column].sum()
+
+    @property
+    def total(self):
+        return int(self._sum('reviews'))
+
+    @property
+    def sentiment_counts(self):
+        """Reviews per sentiment label, most common first (like value_counts)"""
+        return self._by('VADER_Sentiment')['reviews'].astype(int).sort_values(ascending=False, kind='stable')
+
+    def sentiment_count(self, label):
+        return int(self.sentiment_counts.get(label, 0))
+
+    def sentiment_share(self, label):
+        """Percentage of all reviews with this sentiment label"""
+        return self.sentiment_count(label) / self.total * 100 if self.total else 0.0
+
+    @property
+    def rating_counts(self):
+        """Reviews per star rating, by rating (like value_counts().sort_index())"""
+        return self._by('Rating')['reviews'].astype(int).sort_index()
+
+    @property
+    def product_stats(self):
+        """Product, Reviews, Avg Rating, Avg Sentiment per product, most reviewed first"""
+        totals = self._by('Product Name')
+        stats = pd.DataFrame({
+            'Product': totals.index.astype(object),
+            'Reviews': totals['reviews'].astype(int).to_numpy(),
+            'Avg Rating': (totals['rating_sum'] / totals['rated'].replace(0, np.nan)).to_numpy(),
+            'Avg Sentiment': (totals['score_sum'] / totals['scored'].replace(0, np.nan)).to_numpy(),
+        })
+        return stats.sort_values('Reviews', ascending=False, kind='stable').reset_index(drop=True)
+
+    @property
+    def products(self):
+        """Number of distinct products"""
+        return len(self._by('Product Name'))
+
+    @property
+    def avg_rating(self):
+        rated = self._sum('rated')
+        return self._sum('rating_sum') / rated if rated else np.nan
+
+    @property
+    def avg_sentiment(self):
+        scored = self._sum('scored')
+        return self._sum('score_sum') / scored if scored else np.nan
+
+    @property
+    def date_range(self):
+        """(first, last) review date; NaT when no date parsed"""
+        if self._cells is None:
+            return pd.NaT, pd.NaT
+        return self._cells['first_date'].min(), self._cells['last_date'].max()
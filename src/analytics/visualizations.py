@@ -1,22 +1,40 @@
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
 import io
 import base64
+from collections import Counter
+
+from utils.normalize import parsed_dates
+from .keywords import KeywordCounter
+from .summary import DatasetSummary
 
 
 class AdvancedVisualizer:
-    """Create advanced visualizations for review data"""
+    """
+    Create advanced visualizations for review data
+
+    Plotly is imported by the chart methods, and WordCloud only when a
+    word cloud is drawn, so importing this module stays cheap.
+    """
     
-    def __init__(self, df):
+    def __init__(self, df, summary=None):
+        """
+        Args:
+            summary: DatasetSummary of df, when one is already kept (computed on first use otherwise)
+        """
         self.df = df
+        self._summary = summary
+    
+    @property
+    def summary(self):
+        if self._summary is None:
+            self._summary = DatasetSummary.from_frame(self.df)
+        return self._summary
     
     def create_sentiment_distribution(self):
         """Pie chart showing sentiment distribution"""
-        sentiment_counts = self.df['VADER_Sentiment'].value_counts()
+        import plotly.graph_objects as go
+        
+        sentiment_counts = self.summary.sentiment_counts
         
         colors = {
             'Positive': '#00D26A',
@@ -43,7 +61,9 @@ class AdvancedVisualizer:
     
     def create_rating_distribution(self):
         """Bar chart showing rating distribution"""
-        rating_counts = self.df['Rating'].value_counts().sort_index()
+        import plotly.graph_objects as go
+        
+        rating_counts = self.summary.rating_counts
         
         fig = go.Figure(data=[go.Bar(
             x=rating_counts.index,
@@ -66,6 +86,8 @@ class AdvancedVisualizer:
     
     def create_sentiment_vs_rating(self):
         """Box plot comparing sentiment scores vs ratings"""
+        import plotly.express as px
+        
         fig = px.box(
             self.df,
             x='Rating',
@@ -90,20 +112,10 @@ class AdvancedVisualizer:
     
     def create_product_comparison(self):
         """Compare products by average rating and sentiment"""
-        # Convert Rating to numeric first
-        df_copy = self.df.copy()
-        df_copy['Rating_Numeric'] = pd.to_numeric(
-            df_copy['Rating'].astype(str).str.extract(r'(\d+\.?\d*)')[0], 
-            errors='coerce'
-        )
-        
-        product_stats = df_copy.groupby('Product Name').agg({
-            'Rating_Numeric': 'mean',
-            'VADER_Score': 'mean',
-            'Comment': 'count'
-        }).reset_index()
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
-        product_stats.columns = ['Product', 'Avg Rating', 'Avg Sentiment', 'Review Count']
+        product_stats = self.summary.product_stats.rename(columns={'Reviews': 'Review Count'})
         
         fig = make_subplots(
             rows=1, cols=2,
@@ -146,43 +158,52 @@ class AdvancedVisualizer:
         
         return fig
     
-    def create_wordcloud(self, sentiment_type='Positive'):
-        """Generate word cloud for specific sentiment"""
-        sentiment_reviews = self.df[self.df['VADER_Sentiment'] == sentiment_type]['Comment']
-        text = ' '.join(sentiment_reviews.astype(str))
+    def create_wordcloud(self, sentiment_type='Positive', frequencies=None, max_words=100):
+        """
+        Generate word cloud for specific sentiment as PNG bytes (BytesIO)
+
+        Args:
+            frequencies: {term: count} for the sentiment, e.g. from a shared
+                KeywordCounter; counted from the comments when not given
+            max_words: Most frequent words drawn
+        """
+        from wordcloud import WordCloud, STOPWORDS
+        
+        if frequencies is None:
+            frequencies = KeywordCounter().update(self.df).counts().get(sentiment_type, {})
         
-        if not text.strip():
+        # Single words only, minus WordCloud's own stop words as generate() would drop
+        words = Counter({
+            term: count for term, count in frequencies.items()
+            if ' ' not in term and term not in STOPWORDS
+        }).most_common(max_words)
+        if not words:
             return None
         
-        # Generate word cloud
         wordcloud = WordCloud(
             width=800,
             height=400,
             background_color='white',
             colormap='viridis' if sentiment_type == 'Positive' else 'Reds',
-            max_words=100
-        ).generate(text)
+            max_words=max_words
+        ).generate_from_frequencies(dict(words))
         
-        # Convert to image
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.axis('off')
-        ax.set_title(f'{sentiment_type} Reviews Word Cloud', fontsize=16, fontweight='bold')
-        
-        # Convert to base64 for Streamlit
+        # Render straight to PNG with PIL; no matplotlib figure
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', dpi=150)
+        wordcloud.to_image().save(buf, format='png')
         buf.seek(0)
-        plt.close()
         
         return buf
     
     def create_timeline_chart(self):
         """Show sentiment trends over time"""
+        import plotly.express as px
+        
         # Try to parse dates
         try:
-            self.df['Date_Parsed'] = pd.to_datetime(self.df['Date'], errors='coerce')
-            df_with_dates = self.df.dropna(subset=['Date_Parsed'])
+            df_with_dates = self.df[['VADER_Sentiment']].assign(
+                Date_Parsed=parsed_dates(self.df)
+            ).dropna(subset=['Date_Parsed'])
             
             if len(df_with_dates) == 0:
                 return None
@@ -191,7 +212,7 @@ class AdvancedVisualizer:
             timeline = df_with_dates.groupby([
                 df_with_dates['Date_Parsed'].dt.to_period('M'),
                 'VADER_Sentiment'
-            ]).size().reset_index(name='Count')
+            ], observed=True).size().reset_index(name='Count')
             
             timeline['Date'] = timeline['Date_Parsed'].astype(str)
             
@@ -237,29 +258,16 @@ class AdvancedVisualizer:
             'Unique Products'
         ])
         
-        total = len(self.df)
-        pos = len(self.df[self.df['VADER_Sentiment'] == 'Positive'])
-        neg = len(self.df[self.df['VADER_Sentiment'] == 'Negative'])
-        neu = len(self.df[self.df['VADER_Sentiment'] == 'Neutral'])
-        
-        # Convert Rating to numeric properly
-        try:
-            rating_numeric = pd.to_numeric(
-                self.df['Rating'].astype(str).str.extract(r'(\d+\.?\d*)')[0], 
-                errors='coerce'
-            )
-            avg_rating = rating_numeric.mean()
-        except:
-            avg_rating = 0.0
+        summary = self.summary
         
         stats['Value'].extend([
-            str(total),
-            f"{avg_rating:.2f}",
-            f"{(pos/total*100):.1f}%",
-            f"{(neg/total*100):.1f}%",
-            f"{(neu/total*100):.1f}%",
-            f"{self.df['VADER_Score'].mean():.3f}",
-            str(self.df['Product Name'].nunique())
+            str(summary.total),
+            f"{summary.avg_rating:.2f}",
+            f"{summary.sentiment_share('Positive'):.1f}%",
+            f"{summary.sentiment_share('Negative'):.1f}%",
+            f"{summary.sentiment_share('Neutral'):.1f}%",
+            f"{summary.avg_sentiment:.3f}",
+            str(summary.products)
         ])
         
         return pd.DataFrame(stats)
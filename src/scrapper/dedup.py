@@ -0,0 +1,172 @@
+import hashlib
+import threading
+import zlib
+import logging
+
+import numpy as np
+
+from utils.sqlite import connect, chunked
+from .scrape_state import review_key
+
+logger = logging.getLogger(__name__)
+
+MINHASH_PRIME = (1 << 31) - 1
+
+
+class MinHasher:
+    """MinHash signatures of character shingles, bucketed into LSH bands"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, shingle_size: int = 5, seed: int = 1):
+        """
+        Args:
+            num_perm: Hash functions per signature
+            bands: LSH bands; num_perm / bands rows per band. 64 / 8 flags pairs
+                above roughly 0.77 Jaccard similarity
+            shingle_size: Characters per shingle
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MINHASH_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self.b = rng.integers(0, MINHASH_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+    def signature(self, text):
+        """MinHash signature (uint64 array), or None for text shorter than one shingle"""
+        text = " ".join(text.lower().split())
+        k = self.shingle_size
+        if len(text) < k:
+            return None
+        shingles = {text[i:i + k] for i in range(len(text) - k + 1)}
+        # crc32 is stable across processes (unlike hash()), so persisted bands stay comparable
+        values = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((self.a * values + self.b) % MINHASH_PRIME).min(axis=1)
+
+    def band_keys(self, scope, signature):
+        """One bucket key per band; scope keeps buckets of different reviewers/dates apart"""
+        return [
+            hashlib.blake2b(
+                f"{scope}\0{band}\0".encode("utf-8") + signature[band * self.rows:(band + 1) * self.rows].tobytes(),
+                digest_size=16,
+            ).digest()
+            for band in range(self.bands)
+        ]
+
+
+class DedupIndex:
+    """
+    Drops reviews already seen in this run or (with a path) in earlier runs, across products.
+
+    Exact duplicates share review_key (reviewer + date + normalized comment). With
+    near_duplicates, reviews by the same reviewer on the same date whose comments are
+    similar (MinHash/LSH) are dropped too, e.g. one review edited between variants.
+
+    Keys are staged in memory until commit(); with a path they are then written to
+    SQLite, so memory stays bounded by one run no matter how large the history grows.
+    """
+
+    def __init__(self, path: str = None, near_duplicates: bool = False, minhasher: MinHasher = None):
+        """
+        Args:
+            path: SQLite file holding keys from committed runs (None: this run only)
+            near_duplicates: Also drop near-duplicate comments via MinHash/LSH
+            minhasher: MinHasher to use (default MinHasher())
+        """
+        self.path = path
+        self.near_duplicates = near_duplicates
+        self.minhasher = minhasher or (MinHasher() if near_duplicates else None)
+        self.seen = 0
+        self.duplicates = 0
+        self.near = 0
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if path:
+            self._conn = connect(path)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS keys (key BLOB PRIMARY KEY) WITHOUT ROWID")
+            self._conn.commit()
+
+    def _stored(self, keys):
+        """Subset of keys present in the SQLite index"""
+        if self._conn is None or not keys:
+            return set()
+        found = set()
+        for chunk in chunked(list(keys)):
+            placeholders = ",".join("?" * len(chunk))
+            found.update(key for (key,) in self._conn.execute(
+                f"SELECT key FROM keys WHERE key IN ({placeholders})", chunk
+            ))
+        return found
+
+    def filter(self, review_data):
+        """Return review_data without the reviews already seen, remembering the rest"""
+        if review_data is None or review_data.empty:
+            return review_data
+
+        names, dates, comments = review_data["Reviewer"], review_data["Date"], review_data["Comment"]
+        exact = [review_key(n, d, c) for n, d, c in zip(names, dates, comments)]
+        bands = None
+        if self.near_duplicates:
+            bands = []
+            for n, d, c in zip(names, dates, comments):
+                signature = self.minhasher.signature(str(c))
+                bands.append([] if signature is None else self.minhasher.band_keys(f"{n}\0{d}", signature))
+
+        with self._lock:
+            candidates = set(exact)
+            if bands is not None:
+                candidates.update(key for row in bands for key in row)
+            known = self._stored(candidates - self._pending)
+
+            keep = []
+            near = 0
+            for i, key in enumerate(exact):
+                if key in self._pending or key in known:
+                    keep.append(False)
+                    continue
+                row_bands = bands[i] if bands is not None else []
+                if any(band in self._pending or band in known for band in row_bands):
+                    keep.append(False)
+                    near += 1
+                    continue
+                keep.append(True)
+                self._pending.add(key)
+                self._pending.update(row_bands)
+
+            self.seen += len(exact)
+            self.duplicates += len(exact) - sum(keep)
+            self.near += near
+
+        return review_data[np.array(keep)].reset_index(drop=True)
+
+    def commit(self):
+        """Persist this run's keys so later runs treat them as seen"""
+        if self._conn is None:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._conn.executemany("INSERT OR IGNORE INTO keys VALUES (?)", [(key,) for key in pending])
+            self._conn.commit()
+
+    def rollback(self):
+        """Forget the keys and counts staged since the last commit, e.g. from a failed attempt"""
+        with self._lock:
+            self._pending = set()
+            self.seen = self.duplicates = self.near = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "reviews_seen": self.seen,
+                "duplicates_dropped": self.duplicates,
+                "near_duplicates_dropped": self.near,
+                "duplicate_rate": round(self.duplicates / self.seen, 4) if self.seen else 0.0,
+            }
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
@@ -0,0 +1,163 @@
+import atexit
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Optional: measure the browser's real memory; otherwise fall back to the JS heap size
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class DriverManager:
+    """Keep warmed browser sessions alive between scrapes, recycling unhealthy or old ones"""
+
+    def __init__(self, driver_factory=None, headless: bool = True, resource_blocking: str = "none", max_idle: int = 4,
+                 max_age: float = 30 * 60, max_uses: int = 50, max_memory_mb: float = 1500):
+        """
+        Args:
+            driver_factory: Callable(headless, resource_blocking) -> new driver
+                (defaults to create_driver)
+            headless: Passed to driver_factory
+            resource_blocking: Blocking profile passed to driver_factory
+            max_idle: Browsers kept warm between scrapes; extras are quit on release
+            max_age: Recycle a browser this many seconds after it was started
+            max_uses: Recycle a browser after this many scrapes
+            max_memory_mb: Recycle a browser whose memory use exceeds this
+        """
+        if driver_factory is None:
+            from .improved_scraper import create_driver
+            driver_factory = create_driver
+
+        self.driver_factory = driver_factory
+        self.headless = headless
+        self.resource_blocking = resource_blocking
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+
+        self._idle = []
+        self._info = {}  # id(driver) -> {"started": ..., "uses": ...}
+        self._lock = threading.Lock()
+
+        self.started = 0
+        self.reused = 0
+        self.startup_seconds = 0.0
+
+    def acquire(self):
+        """Return a healthy warm browser, or start a new one"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if self._usable(driver):
+                with self._lock:
+                    self._info[id(driver)]["uses"] += 1
+                    self.reused += 1
+                logger.info("Reusing warm browser session")
+                return driver
+            self._quit(driver)
+
+        start = time.perf_counter()
+        driver = self.driver_factory(self.headless, self.resource_blocking)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._info[id(driver)] = {"started": time.monotonic(), "uses": 1}
+            self.started += 1
+            self.startup_seconds += elapsed
+        return driver
+
+    def release(self, driver):
+        """Hand a browser back; it is kept warm if healthy and there is room"""
+        if driver is None:
+            return
+        try:
+            # Drop the previous page so an idle browser holds as little memory as possible
+            driver.get("about:blank")
+        except Exception:
+            self._quit(driver)
+            return
+
+        if not self._usable(driver):
+            self._quit(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+        self._quit(driver)
+
+    def _usable(self, driver):
+        """Health check plus age, use-count and memory recycling limits"""
+        info = self._info.get(id(driver))
+        if info is None:
+            return False
+        if time.monotonic() - info["started"] > self.max_age or info["uses"] >= self.max_uses:
+            return False
+        try:
+            if driver.execute_script("return 1") != 1:
+                return False
+        except Exception:
+            return False
+        memory = self._memory_mb(driver)
+        if memory is not None and memory > self.max_memory_mb:
+            logger.info(f"Recycling browser using {memory:.0f} MB")
+            return False
+        return True
+
+    def _memory_mb(self, driver):
+        try:
+            if PSUTIL_AVAILABLE:
+                process = psutil.Process(driver.service.process.pid)
+                return sum(p.memory_info().rss for p in [process, *process.children(recursive=True)]) / 2**20
+            heap = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0")
+            return heap / 2**20 if heap else None
+        except Exception:
+            return None
+
+    def _quit(self, driver):
+        with self._lock:
+            self._info.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        """Quit every idle browser"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+    def stats(self):
+        """Startup counters; saved time assumes each reuse avoided an average cold start"""
+        with self._lock:
+            average = self.startup_seconds / self.started if self.started else 0.0
+            return {
+                "drivers_started": self.started,
+                "drivers_reused": self.reused,
+                "driver_startup_seconds": round(self.startup_seconds, 2),
+                "driver_startup_saved_seconds": round(self.reused * average, 2),
+            }
+
+
+_shared_managers = {}
+_shared_lock = threading.Lock()
+
+
+def get_driver_manager(headless: bool = True, resource_blocking: str = "none"):
+    """Process-wide manager per browser configuration, so Streamlit reruns and retries share warm browsers"""
+    key = (headless, resource_blocking)
+    with _shared_lock:
+        if key not in _shared_managers:
+            manager = DriverManager(headless=headless, resource_blocking=resource_blocking)
+            atexit.register(manager.close_all)
+            _shared_managers[key] = manager
+        return _shared_managers[key]
@@ -0,0 +1,156 @@
+import json
+import re
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+
+# Myntra ships page data as `window.__myx = {...}` inside a script tag
+STATE_PATTERN = re.compile(r"window\.(?:__myx|__INITIAL_STATE__)\s*=\s*")
+TITLE_PATTERN = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+class HttpFetcher:
+    """Fetch raw page HTML over a pooled keep-alive HTTP session"""
+
+    def __init__(self, pool_size: int = 4, timeout: float = 15):
+        """
+        Args:
+            pool_size: Keep-alive connections kept open per host
+            timeout: Per-request timeout in seconds
+        """
+        # requests is only needed in HTTP mode; Selenium runs never import it
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+
+    def get(self, url):
+        """Return the page HTML, or None if the request failed"""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    def get_json(self, url):
+        """Return decoded JSON from an API endpoint, or None if the request failed"""
+        try:
+            response = self.session.get(url, timeout=self.timeout, headers={"Accept": "application/json"})
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logger.warning(f"HTTP JSON fetch failed for {url}: {e}")
+            return None
+
+    def close(self):
+        self.session.close()
+
+
+def extract_embedded_json(html):
+    """Pull the embedded JSON state blob out of a page, or None if absent"""
+    if not html:
+        return None
+
+    decoder = json.JSONDecoder()
+    for match in STATE_PATTERN.finditer(html):
+        try:
+            state, _ = decoder.raw_decode(html, match.end())
+        except ValueError:
+            continue
+        if isinstance(state, dict):
+            return state
+    return None
+
+
+def extract_title(html):
+    """Return the <title> text, matching what the browser path reads"""
+    match = TITLE_PATTERN.search(html or "")
+    return match.group(1).strip() if match else None
+
+
+def parse_search_state(state):
+    """Product page links from the search results state"""
+    products = (
+        state.get("searchData", {}).get("results", {}).get("products")
+        or state.get("products")
+        or []
+    )
+    urls = []
+    seen = set()
+    for product in products:
+        href = product.get("landingPageUrl")
+        if href and href not in seen:
+            seen.add(href)
+            urls.append(href)
+    return urls
+
+
+def parse_product_state(state):
+    """
+    Product details from the product page state
+    Returns: dict with id, name, rating, price (None if pdpData is missing)
+    """
+    pdp = state.get("pdpData")
+    if not pdp:
+        return None
+
+    ratings = pdp.get("ratings") or {}
+    average = ratings.get("averageRating")
+    price = pdp.get("price") or {}
+    amount = price.get("discounted") or price.get("mrp")
+
+    return {
+        "id": pdp.get("id"),
+        "name": pdp.get("name"),
+        "rating": f"{float(average):.1f}" if average else "N/A",
+        "price": f"₹{amount}" if amount else "N/A",
+    }
+
+
+def parse_reviews_state(state):
+    """
+    Individual reviews from the reviews page state or a reviews API page
+    Returns: list of dicts with id, date, rating, name, comment (None if absent)
+    """
+    if not isinstance(state, dict):
+        return None
+    # Review pages nest the list under reviewsData; the reviews API returns it bare
+    data = state.get("reviewsData") or state.get("reviewData") or state
+    if not isinstance(data, dict) or "reviews" not in data:
+        return None
+
+    reviews = []
+    for review in data.get("reviews") or []:
+        rating = review.get("userRating")
+        reviews.append({
+            "id": review.get("id") or review.get("reviewId"),
+            "date": _format_date(review.get("updatedOn") or review.get("createdOn")),
+            "rating": str(int(float(rating))) if rating is not None else "No rating",
+            "name": (review.get("userName") or "Anonymous").strip(),
+            "comment": (review.get("reviewText") or "No comment").strip(),
+        })
+    return reviews
+
+
+def _format_date(value):
+    """Render epoch milliseconds the way the review page displays dates"""
+    if value is None:
+        return "Unknown date"
+    try:
+        return datetime.fromtimestamp(int(value) / 1000).strftime("%d %b %Y").lstrip("0")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return str(value)
@@ -1,11 +1,6 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup as bs
 import pandas as pd
+import importlib.util
+import json
 import time
 import sys
 import os
@@ -13,20 +8,132 @@ from urllib.parse import quote
 from tqdm import tqdm
 import logging
 
-# For cloud deployment
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    CLOUD_MODE = True
-except ImportError:
-    CLOUD_MODE = False
+from .scraper_pool import ScraperPool
+from .rate_limiter import RateLimiter
+from .timing import Timings
+from .page_cache import PageCache
+from .driver_manager import DriverManager
+from .scrape_state import ScrapeState, review_key
+from .dedup import DedupIndex
+from .resource_blocking import PageStats, apply_to_options, apply_to_driver
+from .waiting import wait_for_selector, wait_for_document_ready, count_elements
+from .pagination import iter_api_review_pages, iter_dom_review_batches
+from .parsing import parse_search_results, parse_product_page, parse_review_nodes
+from .http_fetcher import (
+    HttpFetcher,
+    extract_embedded_json,
+    extract_title,
+    parse_search_state,
+    parse_product_state,
+    parse_reviews_state,
+)
+
+# For cloud deployment; Selenium and webdriver_manager themselves are only imported
+# when a browser is actually started
+CLOUD_MODE = importlib.util.find_spec("webdriver_manager") is not None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+BASE_URL = "https://www.myntra.com"
+FETCH_MODES = ("selenium", "http")
+SEARCH_RESULTS_SELECTOR = "ul.results-base li.product-base"
+PRODUCT_READY_SELECTOR = "span.pdp-price, div.index-overallRating, a.detailed-reviews-allReviews"
+# Review container layouts, most specific first; the first one present on a page is used
+REVIEW_CONTAINER_SELECTORS = [
+    "div.detailed-reviews-userReviewsContainer",
+    "div[class*='userReview']",
+    "div[class*='review' i][class*='container' i]",
+]
+REVIEW_CONTAINER_SELECTOR = ", ".join(REVIEW_CONTAINER_SELECTORS)
+# The element marking one review inside a container (parsing.RATING_CHAIN in CSS);
+# one container may hold every review, so loaded reviews are counted by these
+REVIEW_ITEM_SELECTORS = [
+    "div.user-review-main.user-review-showRating",
+    "div[class*='showRating']",
+    "span[class*='rating' i]",
+]
+SCROLL_SETTLE_TIMEOUT = 2  # Longest wait for a scroll to load more reviews
+REVIEWS_API_PAGE_SIZE = 50
+REVIEW_COLUMNS = ["Product Name", "Overall Rating", "Price", "Date", "Rating", "Reviewer", "Comment"]
+
+
+def product_id_from_link(product_link):
+    """Myntra product links end in /<product id>/buy"""
+    parts = product_link.rstrip("/").split("/")
+    return parts[-2] if len(parts) > 1 else product_link
+
+
+def create_driver(headless: bool = True, resource_blocking: str = "none"):
+    """
+    Launch a Chrome session with the scraper's standard options
+    
+    resource_blocking: Name of a BLOCKING_PROFILES entry ("none", "images", "standard")
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
+    options = Options()
+    apply_to_options(options, resource_blocking)
+    
+    # Performance optimizations
+    options.add_argument("--headless")  # Always headless for cloud
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-software-rasterizer")
+    
+    # Add user agent to avoid detection
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36")
+    
+    try:
+        # Initialize Chrome driver
+        if CLOUD_MODE:
+            # For cloud deployment (Streamlit Cloud, Heroku, etc.)
+            # Use system chromium-driver instead of webdriver-manager
+            try:
+                # Try to use system chromium-driver first
+                service = Service('/usr/bin/chromedriver')
+                driver = webdriver.Chrome(service=service, options=options)
+            except:
+                # Fallback to webdriver-manager with specific Chrome version
+                try:
+                    from selenium.webdriver.chrome.service import Service as ChromeService
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    # Force download matching ChromeDriver for installed Chrome
+                    service = ChromeService(ChromeDriverManager(driver_version="144.0.7559").install())
+                    driver = webdriver.Chrome(service=service, options=options)
+                except:
+                    # Last resort - use default system chrome
+                    options.binary_location = '/usr/bin/chromium'
+                    driver = webdriver.Chrome(options=options)
+        else:
+            # For local development
+            driver = webdriver.Chrome(options=options)
+        
+        driver.set_page_load_timeout(30)
+        apply_to_driver(driver, resource_blocking)
+        logger.info("Browser initialized successfully")
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to initialize browser: {e}")
+        raise
+
+
 class ImprovedScraper:
-    def __init__(self, product_name: str, no_of_products: int, headless: bool = False):
+    def __init__(self, product_name: str, no_of_products: int, headless: bool = False,
+                 max_workers: int = 1, requests_per_second: float = 1.0, base_url: str = BASE_URL,
+                 fetch_mode: str = "selenium", max_reviews_per_product: int = None,
+                 resource_blocking: str = "none", page_stats: PageStats = None,
+                 cache: PageCache = None, driver_manager: DriverManager = None,
+                 limiter: RateLimiter = None, timings: Timings = None, state: ScrapeState = None,
+                 dedup: DedupIndex = None):
         """
         Initialize the scraper with improved settings
         
@@ -34,81 +141,175 @@ class ImprovedScraper:
             product_name: Product to search for
             no_of_products: Number of products to scrape
             headless: Run browser in headless mode (no GUI)
+            max_workers: Number of browsers scraping product pages in parallel
+            requests_per_second: Politeness limit per host, shared by all workers
+            base_url: Site root, override to point at a local fixture server
+            fetch_mode: "selenium" renders every page; "http" fetches raw HTML and
+                parses the embedded JSON, starting a browser only as a fallback
+            max_reviews_per_product: Stop paginating a product after this many reviews
+            resource_blocking: Browser blocking profile: "none", "images" or
+                "standard" (images, fonts, media and trackers off, eager page load)
+            cache: Persistent page cache consulted before every fetch
+            driver_manager: Source of warm browsers; they are returned to it on close
+                instead of being quit
+            limiter: Shared rate limiter (pool workers reuse the parent's)
+            timings: Shared fetch/wait/parse timing accumulator
+            page_stats: Shared per-page bytes/load-time accumulator
+            state: Incremental mode: reviews recorded by earlier runs are skipped and
+                pagination stops at the first one, so only new reviews are returned;
+                a product with nothing new still counts as scraped (empty result)
+            dedup: Index that drops reviews already yielded for another product (colour/size
+                variants) or, if persistent, in an earlier run; applied before anything
+                downstream (sentiment scoring, storage) sees the reviews
         """
-        options = Options()
-        
-        # Performance optimizations
-        options.add_argument("--headless")  # Always headless for cloud
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-software-rasterizer")
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"fetch_mode must be one of {FETCH_MODES}, got {fetch_mode!r}")
         
-        # Add user agent to avoid detection
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36")
-        
-        try:
-            # Initialize Chrome driver
-            if CLOUD_MODE:
-                # For cloud deployment (Streamlit Cloud, Heroku, etc.)
-                # Use system chromium-driver instead of webdriver-manager
-                try:
-                    # Try to use system chromium-driver first
-                    service = Service('/usr/bin/chromedriver')
-                    self.driver = webdriver.Chrome(service=service, options=options)
-                except:
-                    # Fallback to webdriver-manager with specific Chrome version
-                    try:
-                        from selenium.webdriver.chrome.service import Service as ChromeService
-                        # Force download matching ChromeDriver for installed Chrome
-                        service = ChromeService(ChromeDriverManager(driver_version="144.0.7559").install())
-                        self.driver = webdriver.Chrome(service=service, options=options)
-                    except:
-                        # Last resort - use default system chrome
-                        options.binary_location = '/usr/bin/chromium'
-                        self.driver = webdriver.Chrome(options=options)
-            else:
-                # For local development
-                self.driver = webdriver.Chrome(options=options)
-            
-            self.driver.set_page_load_timeout(30)
-            logger.info("Browser initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize browser: {e}")
-            raise
+        # The browser is started on first use so HTTP mode and warm-cache runs
+        # can avoid it entirely
+        self._driver = None
+        self.fetch_mode = fetch_mode
+        self.resource_blocking = resource_blocking
+        self.cache = cache
+        self.driver_manager = driver_manager
+        # Snapshot before this scraper's own browser is acquired, to report per-run startup costs
+        self._drivers_before = driver_manager.stats() if driver_manager is not None else None
+        self.http = HttpFetcher() if fetch_mode == "http" else None
+        if fetch_mode == "selenium" and cache is None:
+            self._driver = self._start_driver(headless)
         
         self.product_name = product_name
         self.no_of_products = no_of_products
-        self.wait = WebDriverWait(self.driver, 10)
+        self.headless = headless
+        self.max_workers = max(1, int(max_workers))
+        self.limiter = limiter or RateLimiter(requests_per_second)
+        self.timings = timings or Timings()
+        self.page_stats = page_stats or PageStats()
+        self.stats = {}
+        self.products_scraped = 0
+        self.products_checked = 0
+        self.base_url = base_url.rstrip("/")
+        self.max_reviews_per_product = max_reviews_per_product
+        self.state = state
+        self.dedup = dedup
+        self.product_id = None
+        self._known = None
+        self._known_hit = False
+        self.products_up_to_date = 0
+        self.pool = ScraperPool(self._spawn_worker, self.max_workers, workers=[self])
+
+    def _spawn_worker(self):
+        """Create an extra single-browser scraper for the worker pool"""
+        return ImprovedScraper(
+            self.product_name,
+            self.no_of_products,
+            headless=self.headless,
+            base_url=self.base_url,
+            fetch_mode=self.fetch_mode,
+            max_reviews_per_product=self.max_reviews_per_product,
+            resource_blocking=self.resource_blocking,
+            cache=self.cache,
+            driver_manager=self.driver_manager,
+            limiter=self.limiter,
+            timings=self.timings,
+            page_stats=self.page_stats,
+            state=self.state,
+        )
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            logger.info("Starting browser")
+            self._driver = self._start_driver(self.headless)
+        return self._driver
+
+    def _start_driver(self, headless):
+        if self.driver_manager is not None:
+            return self.driver_manager.acquire()
+        return create_driver(headless, self.resource_blocking)
+
+    def _get(self, url):
+        """Load url in the browser, respecting the per-host rate limit"""
+        with self.timings.measure("throttle"):
+            self.limiter.acquire(url)
+        with self.timings.measure("fetch"):
+            self.driver.get(url)
+
+    def _render(self, url, kind, wait_until_ready):
+        """Page HTML after the browser has rendered it, served from the cache when fresh"""
+        if self.cache is not None:
+            html = self.cache.get(url, kind, variant="rendered")
+            if html is not None:
+                return html
+        
+        self._get(url)
+        with self.timings.measure("wait"):
+            wait_until_ready()
+        self.page_stats.record(self.driver)
+        html = self.driver.page_source
+        
+        if self.cache is not None:
+            self.cache.put(url, kind, html, variant="rendered")
+        return html
+
+    def _cached(self, kind):
+        """Incremental runs always fetch review listings live; a cached page would hide new reviews"""
+        return self.cache is not None and not (self.state is not None and kind in ("reviews", "api"))
+
+    def _http_get(self, url, kind):
+        """Fetch raw HTML over HTTP (or the cache), respecting the per-host rate limit"""
+        if self._cached(kind):
+            html = self.cache.get(url, kind, variant="raw")
+            if html is not None:
+                return html
+        
+        with self.timings.measure("throttle"):
+            self.limiter.acquire(url)
+        with self.timings.measure("fetch"):
+            html = self.http.get(url)
+        
+        if self._cached(kind):
+            self.cache.put(url, kind, html, variant="raw")
+        return html
+
+    def _http_get_json(self, url):
+        """Fetch a JSON API response (or the cache), respecting the per-host rate limit"""
+        if self._cached("api"):
+            cached = self.cache.get(url, "api")
+            if cached is not None:
+                return json.loads(cached)
+        
+        with self.timings.measure("throttle"):
+            self.limiter.acquire(url)
+        with self.timings.measure("fetch"):
+            data = self.http.get_json(url)
+        
+        if self._cached("api") and data is not None:
+            self.cache.put(url, "api", json.dumps(data))
+        return data
+
+    def _parse_state(self, html):
+        with self.timings.measure("parse"):
+            return extract_embedded_json(html)
 
     def scrape_product_urls(self):
         """Scrape product URLs from search results"""
         try:
             search_string = self.product_name.replace(" ", "-")
             encoded_query = quote(search_string)
-            url = f"https://www.myntra.com/{search_string}?rawQuery={encoded_query}"
+            url = f"{self.base_url}/{search_string}?rawQuery={encoded_query}"
             
             logger.info(f"Searching for: {self.product_name}")
-            self.driver.get(url)
-            time.sleep(3)  # Wait for page to load
+            if self.http is not None:
+                product_urls = self._http_product_urls(url)
+                if product_urls:
+                    logger.info(f"Found {len(product_urls)} products")
+                    return product_urls
             
-            myntra_html = bs(self.driver.page_source, "html.parser")
-            pclass = myntra_html.findAll("ul", {"class": "results-base"})
+            html = self._render(url, "search", lambda: wait_for_selector(self.driver, SEARCH_RESULTS_SELECTOR))
             
-            product_urls = []
-            seen = set()
-            for ul in pclass:
-                items = ul.findAll("li", {"class": "product-base"})
-                for item in items:
-                    a_tag = item.find("a", href=True)
-                    if a_tag:
-                        href = a_tag["href"]
-                        if href not in seen:
-                            seen.add(href)
-                            product_urls.append(href)
+            with self.timings.measure("parse"):
+                product_urls = parse_search_results(html)
             
             logger.info(f"Found {len(product_urls)} products")
             return product_urls
@@ -117,53 +318,143 @@ class ImprovedScraper:
             logger.error(f"Error scraping product URLs: {e}")
             return []
 
+    def _http_product_urls(self, url):
+        """Product links from the search page's embedded JSON (empty if absent)"""
+        state = self._parse_state(self._http_get(url, "search"))
+        if state is None:
+            logger.info("No embedded JSON on search page, falling back to Selenium")
+            return []
+        return parse_search_state(state)
+
+    def _http_scrape_product(self, product_link):
+        """
+        Scrape one product from raw HTML + embedded JSON
+        Returns: DataFrame (empty if the product has no reviews), or None when the
+        JSON is missing and the caller should fall back to Selenium
+        """
+        html = self._http_get(f"{self.base_url}/{product_link.lstrip('/')}", "product")
+        state = self._parse_state(html)
+        product = parse_product_state(state) if state else None
+        if product is None:
+            return None
+        
+        self.product_title = extract_title(html) or product["name"] or "Unknown Product"
+        self.product_rating_value = product["rating"]
+        self.product_price = product["price"]
+        
+        product_id = product["id"] or product_id_from_link(product_link)
+        batches = list(self._iter_http_review_batches(product_id))
+        if not batches:
+            if self._known_hit:
+                # Every review listed is one an earlier run already has
+                return pd.DataFrame(columns=REVIEW_COLUMNS)
+            # Neither the reviews API nor the reviews page JSON had anything usable
+            return None
+        
+        review_data = self._rows_frame([review for batch in batches for review in batch])
+        logger.info(f"Extracted {len(review_data)} reviews for {self.product_title}")
+        return review_data
+
+    def _iter_http_review_batches(self, product_id):
+        """
+        Yield review dicts page by page from the reviews API, falling back to the
+        JSON embedded in the reviews page when the API returns nothing
+        """
+        pages = iter_api_review_pages(
+            self._http_get_json,
+            lambda page, size: (f"{self.base_url}/gateway/v1/reviews/product/{product_id}"
+                                f"?size={size}&sort=0&rating=0&page={page}"),
+            self._parse_reviews_json,
+            page_size=REVIEWS_API_PAGE_SIZE,
+            max_reviews=self.max_reviews_per_product,
+            is_known=self._is_known_review if self.state is not None else None,
+        )
+        found = False
+        for batch in pages:
+            found = True
+            yield batch
+        if found or self._known_hit:
+            # The API answered; its first review already known means nothing is new,
+            # so the reviews page is only fetched when the API is unavailable
+            return
+        
+        review_state = self._parse_state(self._http_get(f"{self.base_url}/reviews/{product_id}", "reviews"))
+        reviews = parse_reviews_state(review_state) if review_state else None
+        if reviews is None:
+            return
+        if self.state is not None:
+            reviews = [review for review in reviews if not self._is_known_review(review)]
+        if self.max_reviews_per_product is not None:
+            reviews = reviews[:self.max_reviews_per_product]
+        # An empty list still counts: the page exists, the product has no reviews
+        yield reviews
+
+    def _is_known(self, key):
+        if key in self._known:
+            self._known_hit = True
+            return True
+        return False
+
+    def _is_known_review(self, review):
+        """For review dicts from the API / embedded JSON"""
+        return self._is_known(review_key(review["name"], review["date"], review["comment"]))
+
+    def _is_known_row(self, row):
+        """For review rows parsed from the DOM"""
+        return self._is_known(review_key(row["Reviewer"], row["Date"], row["Comment"]))
+
+    def _parse_reviews_json(self, data):
+        with self.timings.measure("parse"):
+            return parse_reviews_state(data)
+
+    def _rows_frame(self, reviews):
+        """DataFrame in REVIEW_COLUMNS order from parsed review dicts"""
+        return pd.DataFrame(
+            [self._review_row(r["date"], r["rating"], r["name"], r["comment"]) for r in reviews],
+            columns=REVIEW_COLUMNS,
+        )
+
+    def _review_row(self, date, rating, name, comment):
+        """One review record tagged with the current product's details"""
+        return {
+            "Product Name": self.product_title,
+            "Overall Rating": self.product_rating_value,
+            "Price": self.product_price,
+            "Date": date,
+            "Rating": rating,
+            "Reviewer": name,
+            "Comment": comment,
+        }
+
     def extract_reviews(self, product_link):
         """Extract reviews from a product page"""
         try:
-            productLink = "https://www.myntra.com/" + product_link
-            self.driver.get(productLink)
-            time.sleep(2)
+            productLink = f"{self.base_url}/{product_link.lstrip('/')}"
+            html = self._render(
+                productLink,
+                "product",
+                lambda: (wait_for_selector(self.driver, PRODUCT_READY_SELECTOR)
+                         or wait_for_document_ready(self.driver, timeout=5)),
+            )
             
-            prodRes_html = bs(self.driver.page_source, "html.parser")
+            with self.timings.measure("parse"):
+                product = parse_product_page(html)
             
             # Extract product details
-            title_h = prodRes_html.findAll("title")
-            self.product_title = title_h[0].text if title_h else "Unknown Product"
-            
-            overallRating = prodRes_html.findAll("div", {"class": "index-overallRating"})
-            self.product_rating_value = "N/A"
-            for i in overallRating:
-                rating_div = i.find("div")
-                if rating_div:
-                    self.product_rating_value = rating_div.text
-            
-            price = prodRes_html.findAll("span", {"class": "pdp-price"})
-            self.product_price = "N/A"
-            for i in price:
-                self.product_price = i.text
+            self.product_title = product["title"]
+            self.product_rating_value = product["rating"]
+            self.product_price = product["price"]
             
-            # Try multiple selectors for review link
-            product_reviews = (
-                prodRes_html.find("a", {"class": "detailed-reviews-allReviews"}) or
-                prodRes_html.find("a", string=lambda t: t and ("review" in t.lower() or "rating" in t.lower())) or
-                prodRes_html.find("a", href=lambda h: h and "reviews" in h.lower())
-            )
+            product_reviews = {"href": product["reviews_href"]} if product["reviews_href"] else None
             
             # Fallback: construct reviews URL from product URL directly
             if not product_reviews:
                 # Myntra reviews URL pattern: /productId/reviews
                 product_id = product_link.split("/")[-2] if "/" in product_link else None
                 if product_id and product_id.isdigit():
-                    class FakeTag:
-                        def __init__(self, href):
-                            self["href"] = href
-                        def __getitem__(self, key):
-                            return self._href if key == "href" else None
-                        def __setitem__(self, key, value):
-                            self._href = value
-                    fake = FakeTag(f"/{product_link.replace('/buy', '')}/reviews")
-                    logger.info(f"Constructed review URL: {fake['href']}")
-                    return fake
+                    product_reviews = {"href": f"/{product_link.replace('/buy', '')}/reviews"}
+                    logger.info(f"Constructed review URL: {product_reviews['href']}")
+                    return product_reviews
             
             if not product_reviews:
                 logger.warning(f"No reviews found for: {self.product_title}")
@@ -175,105 +466,98 @@ class ImprovedScraper:
             logger.error(f"Error extracting reviews: {e}")
             return None
 
-    def scroll_to_load_reviews(self):
-        """Scroll page to load all reviews with progress indication"""
-        try:
-            self.driver.set_window_size(1920, 1080)
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            scroll_count = 0
-            max_scrolls = 20  # Prevent infinite scrolling
-            
-            while scroll_count < max_scrolls:
-                self.driver.execute_script("window.scrollBy(0, 1000);")
-                time.sleep(2)
-                
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                
-                if new_height == last_height:
-                    break
-                
-                last_height = new_height
-                scroll_count += 1
-                
-            logger.info(f"Scrolled {scroll_count} times to load reviews")
-            
-        except Exception as e:
-            logger.error(f"Error during scrolling: {e}")
+    def _resolve_container_selector(self):
+        """Pick the first review container layout present on the current page"""
+        for selector in REVIEW_CONTAINER_SELECTORS:
+            if count_elements(self.driver, selector):
+                return selector
+        return REVIEW_CONTAINER_SELECTORS[0]
+
+    def _resolve_item_selector(self, container_selector):
+        """Pick the first review item layout present inside the page's containers"""
+        for selector in REVIEW_ITEM_SELECTORS:
+            if count_elements(self.driver, f"{container_selector} {selector}"):
+                return selector
+        return REVIEW_ITEM_SELECTORS[0]
+
+    def _parse_review_nodes(self, nodes, layout=None):
+        """
+        Parse review HTML fragments into review rows
+        Returns: (rows, layout) — pass layout back in for later batches of the same page
+        """
+        reviews, layout = parse_review_nodes(nodes, layout)
+        return [self._review_row(*review) for review in reviews], layout
+
+    def iter_review_batches(self, product_reviews):
+        """
+        Open a product's reviews page and yield DataFrames of reviews as each
+        scroll loads them; only newly loaded review nodes are parsed
+        """
+        for rows in self._iter_review_rows(product_reviews):
+            yield pd.DataFrame(rows, columns=REVIEW_COLUMNS)
+
+    def _iter_review_rows(self, product_reviews):
+        """iter_review_batches as lists of review rows"""
+        href = product_reviews["href"] if product_reviews["href"].startswith("http") else self.base_url + product_reviews["href"]
+        
+        # The cache holds the review nodes loaded by a previous complete scroll
+        variant = f"items|max={self.max_reviews_per_product}"
+        if self._cached("reviews"):
+            cached = self.cache.get(href, "reviews", variant=variant)
+            if cached is not None:
+                with self.timings.measure("parse"):
+                    rows = self._parse_review_nodes([cached])[0][:self.max_reviews_per_product]
+                if rows:
+                    yield rows
+                return
+        
+        fragments = []
+        layout = None
+        
+        def parse_nodes(nodes):
+            nonlocal layout
+            if self._cached("reviews"):
+                fragments.extend(nodes)
+            rows, layout = self._parse_review_nodes(nodes, layout)
+            return rows
+        
+        self._get(href)
+        self.driver.set_window_size(1920, 1080)
+        
+        with self.timings.measure("wait"):
+            wait_for_selector(self.driver, REVIEW_CONTAINER_SELECTOR, timeout=5)
+        container_selector = self._resolve_container_selector()
+        item_selector = self._resolve_item_selector(container_selector)
+        
+        for rows in iter_dom_review_batches(
+            self.driver,
+            container_selector,
+            item_selector,
+            parse_nodes,
+            max_reviews=self.max_reviews_per_product,
+            settle_timeout=SCROLL_SETTLE_TIMEOUT,
+            timings=self.timings,
+            is_known=self._is_known_row if self.state is not None else None,
+        ):
+            yield rows
+        
+        self.page_stats.record(self.driver)
+        if self._cached("reviews"):
+            self.cache.put(href, "reviews", "".join(fragments), variant=variant)
 
     def extract_review_data(self, product_reviews):
         """Extract individual review data"""
         try:
-            href = product_reviews["href"] if product_reviews["href"].startswith("http") else "https://www.myntra.com" + product_reviews["href"]
-            review_link = href
-            self.driver.get(review_link)
-            
-            self.scroll_to_load_reviews()
+            # Rows are collected and framed once, rather than holding a DataFrame per
+            # scroll plus their concatenation
+            rows = []
+            for batch in self._iter_review_rows(product_reviews):
+                rows.extend(batch)
             
-            review_html = bs(self.driver.page_source, "html.parser")
-            
-            # Try multiple container selectors
-            review_container = (
-                review_html.findAll("div", {"class": "detailed-reviews-userReviewsContainer"}) or
-                review_html.findAll("div", {"class": lambda c: c and "userReview" in c}) or
-                review_html.findAll("div", {"class": lambda c: c and "review" in c.lower() and "container" in c.lower()})
-            )
-            
-            reviews = []
-            
-            for container in review_container:
-                # Try multiple rating selectors
-                user_rating = (
-                    container.findAll("div", {"class": "user-review-main user-review-showRating"}) or
-                    container.findAll("div", {"class": lambda c: c and "showRating" in (c or "")}) or
-                    container.findAll("span", {"class": lambda c: c and "rating" in (c or "").lower()})
-                )
-                # Try multiple comment selectors
-                user_comment = (
-                    container.findAll("div", {"class": "user-review-reviewTextWrapper"}) or
-                    container.findAll("div", {"class": lambda c: c and "reviewText" in (c or "")}) or
-                    container.findAll("p", {"class": lambda c: c and "review" in (c or "").lower()})
-                )
-                user_name = (
-                    container.findAll("div", {"class": "user-review-left"}) or
-                    container.findAll("div", {"class": lambda c: c and "user-review" in (c or "")})
-                )
-                
-                for i in range(len(user_rating)):
-                    try:
-                        rating = user_rating[i].find("span", class_="user-review-starRating").get_text().strip()
-                    except:
-                        rating = "No rating"
-                    
-                    try:
-                        comment = user_comment[i].text.strip()
-                    except:
-                        comment = "No comment"
-                    
-                    try:
-                        name = user_name[i].find("span").text.strip()
-                    except:
-                        name = "Anonymous"
-                    
-                    try:
-                        date = user_name[i].find_all("span")[1].text.strip()
-                    except:
-                        date = "Unknown date"
-                    
-                    review_dict = {
-                        "Product Name": self.product_title,
-                        "Overall Rating": self.product_rating_value,
-                        "Price": self.product_price,
-                        "Date": date,
-                        "Rating": rating,
-                        "Reviewer": name,
-                        "Comment": comment,
-                    }
-                    reviews.append(review_dict)
-            
-            if reviews:
+            if rows:
+                reviews = pd.DataFrame(rows, columns=REVIEW_COLUMNS)
                 logger.info(f"Extracted {len(reviews)} reviews for {self.product_title}")
-                return pd.DataFrame(reviews)
+                return reviews
             else:
                 logger.warning("No reviews extracted")
                 return None
@@ -282,99 +566,277 @@ class ImprovedScraper:
             logger.error(f"Error extracting review data: {e}")
             return None
 
-    def scrape_all_reviews(self):
-        """Main method to scrape all reviews with progress bar"""
+    def scrape_product(self, product_link):
+        """Scrape all reviews of one product (only the new ones in incremental mode)"""
+        self.product_id = product_id_from_link(product_link)
+        if self.state is None:
+            return self._scrape_product(product_link)
+        
+        self._known = self.state.known_keys(self.product_id)
+        self._known_hit = False
+        return self._new_reviews(self._scrape_product(product_link))
+
+    def _new_reviews(self, review_data):
+        """
+        Deduplicate a product's new reviews; they are staged in the scrape state by
+        iter_product_batches once yielded, never here in the worker thread
+        """
+        if review_data is None or review_data.empty:
+            if not self._known_hit:
+                return review_data
+            logger.info(f"No new reviews for {self.product_title}")
+            review_data = pd.DataFrame(columns=REVIEW_COLUMNS)
+            review_data.attrs["up_to_date"] = True
+            return review_data
+        
+        keys = pd.Series([review_key(name, date, comment) for name, date, comment in
+                          zip(review_data["Reviewer"], review_data["Date"], review_data["Comment"])])
+        review_data = review_data[~keys.duplicated().to_numpy()].reset_index(drop=True)
+        logger.info(f"{len(review_data)} new reviews for {self.product_title}")
+        return review_data
+
+    def _is_scraped(self, review_data):
+        """A product counts once it has reviews, or (incremental) once it is known to have none new"""
+        if review_data is None:
+            return False
+        return not review_data.empty or review_data.attrs.get("up_to_date", False)
+
+    def _scrape_product(self, product_link):
+        if self.http is not None:
+            review_data = self._http_scrape_product(product_link)
+            if review_data is not None:
+                return review_data
+            logger.info("No embedded JSON on product page, falling back to Selenium")
+        
+        reviews_link = self.extract_reviews(product_link)
+        if not reviews_link:
+            return None
+        return self.extract_review_data(reviews_link)
+
+    def iter_product_batches(self, on_product=None, should_stop=None):
+        """
+        Yield one DataFrame of reviews per product as soon as it is scraped
+        (in search-result order), closing the browsers when exhausted or closed
+        
+        on_product: Called as on_product(scraper, review_data) after every product
+        checked; review_data is None for products skipped for lack of reviews
+        should_stop: Checked after every product; stops the scrape early when it returns True
+        """
+        run_start = time.perf_counter()
+        self.products_scraped = 0
+        self.products_checked = 0
+        self.products_up_to_date = 0
+        self.cancelled = False
+        pbar = None
         try:
             product_urls = self.scrape_product_urls()
             
             if not product_urls:
                 logger.error("No products found!")
-                return None
+                return
             
-            all_reviews = []
-            products_scraped = 0
-            products_checked = 0
             max_products_to_check = min(len(product_urls), self.no_of_products * 3)  # Check up to 3x requested
             
             # Progress bar
             pbar = tqdm(total=self.no_of_products, desc="Scraping Products")
             
-            for idx, url in enumerate(product_urls):
-                if products_scraped >= self.no_of_products:
-                    break
-                
-                if products_checked >= max_products_to_check:
-                    logger.warning(f"Checked {products_checked} products, found only {products_scraped} with reviews")
-                    break
-                
-                products_checked += 1
-                pbar.set_description(f"Product {products_scraped + 1}/{self.no_of_products} (Checked: {products_checked})")
-                
-                reviews_link = self.extract_reviews(url)
+            # Workers share the URL queue; results arrive in search-result order
+            results = self.pool.iter_results(
+                product_urls,
+                lambda worker, url: worker.scrape_product(url),
+                want=self.no_of_products,
+                max_checks=max_products_to_check,
+                is_success=self._is_scraped,
+            )
+            
+            for idx, url, review_data in results:
+                self.products_checked += 1
                 
-                if reviews_link:
-                    review_data = self.extract_review_data(reviews_link)
-                    
-                    if review_data is not None and not review_data.empty:
-                        all_reviews.append(review_data)
-                        products_scraped += 1
-                        pbar.update(1)
-                        logger.info(f"✓ Found {len(review_data)} reviews from product {products_scraped}")
+                if self._is_scraped(review_data):
+                    self.products_scraped += 1
+                    if review_data.empty:
+                        self.products_up_to_date += 1
+                    elif self.state is not None:
+                        # Staged before the dedup filter: the duplicates it drops were
+                        # yielded under another product, so they are known here too
+                        self.state.stage(product_id_from_link(url), review_data)
+                    if self.dedup is not None:
+                        review_data = self.dedup.filter(review_data)
+                    pbar.update(1)
+                    logger.info(f"✓ Found {len(review_data)} reviews from product {self.products_scraped}")
+                    pbar.set_description(f"Product {self.products_scraped}/{self.no_of_products} (Checked: {self.products_checked})")
+                    if on_product is not None:
+                        on_product(self, review_data)
+                    yield review_data
                 else:
                     # Show user that this product has no reviews
-                    if products_checked % 5 == 0:  # Update every 5 products
-                        logger.info(f"Still searching... Checked {products_checked} products, found {products_scraped} with reviews")
+                    if self.products_checked % 5 == 0:  # Update every 5 products
+                        logger.info(f"Still searching... Checked {self.products_checked} products, found {self.products_scraped} with reviews")
+                    pbar.set_description(f"Product {self.products_scraped}/{self.no_of_products} (Checked: {self.products_checked})")
+                    if on_product is not None:
+                        on_product(self, None)
                 
-                # Add delay to avoid being blocked
-                time.sleep(2)
+                if should_stop is not None and should_stop():
+                    logger.info(f"Scrape stopped after {self.products_scraped} products")
+                    self.cancelled = True
+                    break
             
-            pbar.close()
+            if self.products_scraped < self.no_of_products and self.products_checked >= max_products_to_check:
+                logger.warning(f"Checked {self.products_checked} products, found only {self.products_scraped} with reviews")
+        finally:
+            if pbar is not None:
+                pbar.close()
+            self.stats = {**self.timings.summary(), "total": round(time.perf_counter() - run_start, 2)}
+            logger.info(f"Time spent: {self.timings.format()} (wall clock {self.stats['total']:.1f}s)")
+            self.stats.update(self.page_stats.summary())
+            if self.stats.get("pages_measured"):
+                logger.info(f"Pages: {self.stats['pages_measured']} loaded, {self.stats['avg_page_kb']:.0f} KB "
+                            f"and {self.stats['avg_dom_ready_seconds']:.2f}s to DOM ready on average")
+            if self.state is not None:
+                self.stats["products_up_to_date"] = self.products_up_to_date
+            if self.dedup is not None:
+                self.stats.update(self.dedup.stats())
+                logger.info(f"Duplicates: {self.stats['duplicates_dropped']} of {self.stats['reviews_seen']} reviews "
+                            f"dropped ({self.stats['duplicate_rate']:.1%}, "
+                            f"{self.stats['near_duplicates_dropped']} near-duplicates)")
+            if self.cache is not None:
+                self.stats.update(self.cache.stats())
+                logger.info(f"Page cache: {self.stats['cache_hits']} hits, {self.stats['cache_misses']} misses")
+            if self.driver_manager is not None:
+                # Report this run's share of the manager's cumulative counters
+                drivers_after = self.driver_manager.stats()
+                self.stats.update({key: round(drivers_after[key] - self._drivers_before[key], 2) for key in drivers_after})
+                logger.info(f"Browsers: {self.stats['drivers_started']} started, {self.stats['drivers_reused']} reused "
+                            f"(~{self.stats['driver_startup_saved_seconds']:.1f}s startup saved)")
+            self.close()
+
+    def iter_reviews(self):
+        """Yield individual review records (dicts with REVIEW_COLUMNS keys) as products complete"""
+        for review_data in self.iter_product_batches():
+            yield from review_data.to_dict("records")
+
+    def scrape_all_reviews(self, on_product=None, should_stop=None):
+        """Main method to scrape all reviews with progress bar (see iter_product_batches for the callbacks)"""
+        try:
+            all_reviews = list(self.iter_product_batches(on_product, should_stop))
             
             if all_reviews:
                 final_data = pd.concat(all_reviews, ignore_index=True)
-                logger.info(f"✓ SUCCESS: Total {len(final_data)} reviews scraped from {products_scraped} products!")
+                logger.info(f"✓ SUCCESS: Total {len(final_data)} reviews scraped from {self.products_scraped} products!")
                 return final_data
             else:
-                logger.error(f"✗ NO REVIEWS FOUND: Checked {products_checked} products but none had reviews")
+                logger.error(f"✗ NO REVIEWS FOUND: Checked {self.products_checked} products but none had reviews")
                 logger.error("Try searching for a different product or popular brands")
                 return None
                 
         except Exception as e:
             logger.error(f"Error in main scraping process: {e}")
             return None
-        finally:
-            self.close()
 
     def close(self):
-        """Close the browser"""
+        """Close the browser and any extra pool browsers"""
+        if getattr(self, "pool", None) is not None:
+            self.pool.close()
+        if getattr(self, "http", None) is not None:
+            self.http.close()
+        if getattr(self, "_driver", None) is None:
+            return
+        driver, self._driver = self._driver, None
+        if self.driver_manager is not None:
+            self.driver_manager.release(driver)
+            return
         try:
-            self.driver.quit()
+            driver.quit()
             logger.info("Browser closed successfully")
         except:
             pass
 
 
 # Retry mechanism wrapper
-def scrape_with_retry(product_name, no_of_products, max_retries=3, headless=False):
-    """Scrape with retry mechanism"""
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"Attempt {attempt + 1}/{max_retries}")
-            scraper = ImprovedScraper(product_name, no_of_products, headless=headless)
-            data = scraper.scrape_all_reviews()
-            
-            if data is not None:
-                return data
-            else:
-                logger.warning(f"Attempt {attempt + 1} returned no data")
-                
-        except Exception as e:
-            logger.error(f"Attempt {attempt + 1} failed: {e}")
-            if attempt < max_retries - 1:
-                logger.info("Retrying...")
-                time.sleep(5)
-            else:
-                logger.error("All retry attempts failed")
-                return None
+def scrape_with_retry(product_name, no_of_products, max_retries=3, headless=False, max_workers=1,
+                      fetch_mode="selenium", cache_path=None, driver_manager=None, resource_blocking="none",
+                      store=None, state_path=None, dedup=False, dedup_path=None, near_duplicates=False,
+                      limiter=None, on_product=None, should_stop=None, base_url=BASE_URL):
+    """
+    Scrape with retry mechanism
     
-    return None
\ No newline at end of file
+    cache_path: SQLite page cache file; pages fetched within their TTL are reused
+    across attempts and runs without touching the network (or a browser)
+    driver_manager: Warm browser pool to draw from (e.g. get_driver_manager());
+    without one, a private pool is used so at least the retries share browsers
+    store: ReviewStore that successful results are appended to, under product_name
+    state_path: SQLite scrape state file; enables incremental mode, where only reviews
+    newer than the previous run are fetched and returned (possibly none). Reviews are
+    recorded as known only once an attempt returns them (and the store has saved them)
+    dedup: Drop reviews repeated across products (colour/size variants) within the run
+    dedup_path: SQLite dedup index file; also drops reviews returned by earlier runs
+    near_duplicates: Also drop near-identical comments by the same reviewer and date
+    limiter: RateLimiter shared with other concurrent scrapes of the same site
+    on_product: Progress callback, called as on_product(scraper, review_data) after every
+    product checked (review_data is None for products without reviews)
+    should_stop: Cancellation check; once it returns True the current attempt stops after
+    its product in flight, no retries follow, and the reviews gathered so far are returned
+    base_url: Site root, override to point at a local fixture server
+    """
+    cache = PageCache(cache_path) if cache_path else None
+    state = ScrapeState(state_path) if state_path else None
+    index = DedupIndex(dedup_path, near_duplicates=near_duplicates) if dedup or dedup_path else None
+    own_manager = driver_manager is None
+    if own_manager:
+        driver_manager = DriverManager(headless=headless, resource_blocking=resource_blocking)
+    try:
+        for attempt in range(max_retries):
+            if should_stop is not None and should_stop():
+                logger.info(f"Scrape cancelled before attempt {attempt + 1}")
+                return None
+            try:
+                logger.info(f"Attempt {attempt + 1}/{max_retries}")
+                if state is not None:
+                    state.rollback()
+                if index is not None:
+                    index.rollback()
+                scraper = ImprovedScraper(product_name, no_of_products, headless=headless, max_workers=max_workers,
+                                          fetch_mode=fetch_mode, cache=cache, driver_manager=driver_manager,
+                                          resource_blocking=resource_blocking, state=state, dedup=index,
+                                          limiter=limiter, base_url=base_url)
+                data = scraper.scrape_all_reviews(on_product, should_stop)
+                
+                if data is not None:
+                    saved = True
+                    if store is not None:
+                        try:
+                            store.append(data, product_name)
+                        except Exception as e:
+                            saved = False
+                            logger.warning(f"Could not save reviews to the store: {e}")
+                    # Unsaved reviews must stay new, so the next run fetches them again
+                    for staged in (state, index):
+                        if staged is None:
+                            continue
+                        if saved:
+                            staged.commit()
+                        else:
+                            staged.rollback()
+                    return data
+                else:
+                    logger.warning(f"Attempt {attempt + 1} returned no data")
+                    
+            except Exception as e:
+                logger.error(f"Attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries - 1:
+                    logger.info("Retrying...")
+                    time.sleep(5)
+                else:
+                    logger.error("All retry attempts failed")
+                    return None
+        
+        return None
+    finally:
+        if cache is not None:
+            cache.close()
+        if state is not None:
+            state.close()
+        if index is not None:
+            index.close()
+        if own_manager:
+            driver_manager.close_all()
@@ -0,0 +1,258 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+import uuid
+import logging
+
+import pandas as pd
+
+from analytics.summary import DatasetSummary
+from utils.sqlite import connect
+from .improved_scraper import scrape_with_retry
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+ANALYZING = "analyzing"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING, ANALYZING)
+
+
+class ScrapeJob:
+    """One background scrape: its settings, live progress and (partial) results"""
+
+    def __init__(self, job_id, owner, product_name, no_of_products, scrape_kwargs):
+        self.id = job_id
+        self.owner = owner
+        self.product_name = product_name
+        self.no_of_products = no_of_products
+        self.scrape_kwargs = scrape_kwargs
+        self.status = QUEUED
+        self.products_scraped = 0
+        self.products_checked = 0
+        self.reviews = 0
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.data = None
+        self.future = None
+        self._batches = []
+        self.summary = DatasetSummary()  # of the reviews gathered so far
+        self._scraper = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self.status in ACTIVE_STATUSES
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    @property
+    def progress(self):
+        """Fraction of the requested products scraped so far (1.0 once finished)"""
+        if not self.active:
+            return 1.0
+        return min(self.products_scraped / max(self.no_of_products, 1), 1.0)
+
+    def record_product(self, scraper, review_data):
+        """on_product callback for scrape_with_retry"""
+        with self._lock:
+            if scraper is not self._scraper:
+                # A retry starts over; drop what the failed attempt had gathered
+                self._scraper = scraper
+                self._batches = []
+                self.summary = DatasetSummary()
+            self.products_scraped = scraper.products_scraped
+            self.products_checked = scraper.products_checked
+            if review_data is not None and not review_data.empty:
+                self._batches.append(review_data)
+                self.summary.update(review_data)
+            self.reviews = self.summary.total
+
+    def partial(self):
+        """Reviews gathered so far (the final data once finished)"""
+        with self._lock:
+            if self.data is not None:
+                return self.data
+            if not self._batches:
+                return pd.DataFrame()
+            return pd.concat(self._batches, ignore_index=True)
+
+    def to_row(self):
+        return (
+            self.id, self.owner, self.product_name,
+            json.dumps({"no_of_products": self.no_of_products, **self.scrape_kwargs}, default=str),
+            self.status, self.products_scraped, self.products_checked, self.reviews, self.error,
+            self.created, self.started, self.finished,
+        )
+
+
+class JobRunner:
+    """
+    Runs scrapes in background threads so callers (e.g. Streamlit sessions) only poll.
+
+    At most max_concurrent jobs scrape at once; later submissions queue in order.
+    Job state is written to SQLite on every change, so the job list survives restarts
+    (jobs cut off by a restart are marked interrupted); the scraped reviews themselves
+    live in memory, and in the review store when a store is passed to submit().
+    Concurrent jobs share one RateLimiter, so together they stay within the site's limit.
+    """
+
+    def __init__(self, max_concurrent: int = 2, path: str = ".cache/jobs.sqlite", keep_finished: int = 20,
+                 requests_per_second: float = 1.0):
+        """
+        Args:
+            max_concurrent: Jobs scraping at the same time; more are queued
+            path: SQLite file for job state (created if missing)
+            keep_finished: Finished jobs whose results stay in memory
+            requests_per_second: Per-host request rate shared by all jobs
+        """
+        self.path = path
+        self.keep_finished = keep_finished
+        self.limiter = RateLimiter(requests_per_second)
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="scrape-job")
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, owner TEXT, product_name TEXT, params TEXT, status TEXT,"
+            " products_scraped INTEGER, products_checked INTEGER, reviews INTEGER, error TEXT,"
+            " created REAL, started REAL, finished REAL)"
+        )
+        placeholders = ",".join("?" * len(ACTIVE_STATUSES))
+        interrupted = self._conn.execute(
+            f"UPDATE jobs SET status = ?, finished = ? WHERE status IN ({placeholders})",
+            (INTERRUPTED, time.time(), *ACTIVE_STATUSES),
+        ).rowcount
+        self._conn.commit()
+        if interrupted:
+            logger.warning(f"{interrupted} scrape jobs were interrupted by a restart")
+
+    def _save(self, job):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", job.to_row())
+            self._conn.commit()
+
+    def submit(self, owner, product_name, no_of_products, postprocess=None, **scrape_kwargs):
+        """
+        Queue a scrape; returns its ScrapeJob right away
+
+        Args:
+            owner: Who the job belongs to (e.g. a session id), for listing
+            postprocess: Called on the scraped DataFrame in the worker (e.g. sentiment
+                analysis); its return value becomes the job's data
+            **scrape_kwargs: Passed on to scrape_with_retry (limiter defaults to the runner's)
+        """
+        job = ScrapeJob(uuid.uuid4().hex[:12], owner, product_name, no_of_products, scrape_kwargs)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._save(job)
+        job.future = self._executor.submit(self._run, job, postprocess)
+        logger.info(f"Queued scrape job {job.id} for {product_name!r}")
+        return job
+
+    def _run(self, job, postprocess):
+        if job.cancel_requested:
+            job.status = CANCELLED
+            job.finished = time.time()
+            self._save(job)
+            return
+        job.status = RUNNING
+        job.started = time.time()
+        self._save(job)
+        try:
+            kwargs = {**job.scrape_kwargs, "limiter": job.scrape_kwargs.get("limiter") or self.limiter}
+            data = scrape_with_retry(
+                job.product_name,
+                job.no_of_products,
+                on_product=lambda scraper, review_data: self._on_product(job, scraper, review_data),
+                should_stop=job._cancel.is_set,
+                **kwargs,
+            )
+            if data is not None and not data.empty and postprocess is not None:
+                job.status = ANALYZING
+                self._save(job)
+                data = postprocess(data)
+            job.data = data
+            job.reviews = 0 if data is None else len(data)
+            job.status = CANCELLED if job.cancel_requested else DONE
+        except Exception as e:
+            logger.error(f"Scrape job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished = time.time()
+            self._save(job)
+            self._forget_old_jobs()
+
+    def _on_product(self, job, scraper, review_data):
+        job.record_product(scraper, review_data)
+        self._save(job)
+
+    def _forget_old_jobs(self):
+        """Drop the results of all but the newest keep_finished finished jobs from memory"""
+        with self._lock:
+            finished = sorted((j for j in self._jobs.values() if not j.active), key=lambda j: j.finished or 0)
+            for job in finished[:max(len(finished) - self.keep_finished, 0)]:
+                del self._jobs[job.id]
+
+    def get(self, job_id):
+        """The in-memory ScrapeJob, or None once forgotten (or from before a restart)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Ask a job to stop; a queued job never starts, a running one stops after its current product"""
+        job = self.get(job_id)
+        if job is None or not job.active:
+            return False
+        job._cancel.set()
+        if job.future is not None and job.future.cancel():
+            job.status = CANCELLED
+            job.finished = time.time()
+            self._save(job)
+        logger.info(f"Cancel requested for scrape job {job_id}")
+        return True
+
+    def queue_position(self, job_id):
+        """How many queued jobs are ahead of this one (0 once it runs)"""
+        with self._lock:
+            queued = sorted((j for j in self._jobs.values() if j.status == QUEUED), key=lambda j: j.created)
+        for position, job in enumerate(queued):
+            if job.id == job_id:
+                return position
+        return 0
+
+    def history(self, owner=None, limit=20):
+        """Recent jobs as dicts, newest first, including those from earlier runs"""
+        query = "SELECT id, product_name, status, products_scraped, reviews, error, created, finished FROM jobs"
+        params = ()
+        if owner is not None:
+            query += " WHERE owner = ?"
+            params = (owner,)
+        query += " ORDER BY created DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, (*params, limit)).fetchall()
+        columns = ("id", "product_name", "status", "products_scraped", "reviews", "error", "created", "finished")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def shutdown(self, cancel=True):
+        """Stop accepting jobs; with cancel, running jobs stop after their current product"""
+        if cancel:
+            for job in list(self._jobs.values()):
+                job._cancel.set()
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        with self._lock:
+            self._conn.close()
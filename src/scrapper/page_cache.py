@@ -0,0 +1,125 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import threading
+import time
+import zlib
+import logging
+
+from utils.sqlite import connect
+
+logger = logging.getLogger(__name__)
+
+HOUR = 60 * 60
+
+# Search results change quickly; individual reviews rarely do
+DEFAULT_TTLS = {
+    "search": 1 * HOUR,
+    "product": 6 * HOUR,
+    "reviews": 24 * HOUR,
+    "api": 24 * HOUR,
+}
+
+
+def normalize_url(url):
+    """Canonical cache key: lowercase scheme/host, sorted query, no fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class PageCache:
+    """Persistent page cache in a SQLite file with per-kind TTLs and LRU size eviction"""
+
+    def __init__(self, path: str = ".cache/pages.sqlite", max_bytes: int = 200 * 1024 * 1024, ttls: dict = None):
+        """
+        Args:
+            path: SQLite file to store pages in (created if missing)
+            max_bytes: Evict least recently used pages beyond this total (compressed) size
+            ttls: Seconds each page kind stays fresh, merged over DEFAULT_TTLS
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " key TEXT PRIMARY KEY, kind TEXT, body BLOB, size INTEGER,"
+            " created REAL, accessed REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed)")
+        self._conn.commit()
+
+    def _key(self, url, variant):
+        key = normalize_url(url)
+        return f"{key}|{variant}" if variant else key
+
+    def get(self, url, kind, variant=""):
+        """
+        Return the cached text for url, or None if missing or older than the kind's TTL
+        
+        variant separates different renderings of one URL (raw HTML vs browser DOM)
+        """
+        key = self._key(url, variant)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, created FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttls.get(kind, 0):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE pages SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, url, kind, text, variant=""):
+        """Store text for url, then evict least recently used pages over max_bytes"""
+        if text is None:
+            return
+        body = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, kind, body, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(url, variant), kind, body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM pages ORDER BY accessed").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM pages WHERE key = ?", evicted)
+        logger.info(f"Page cache evicted {len(evicted)} pages")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+
+    def stats(self):
+        """Hit/miss counters plus current size"""
+        with self._lock:
+            pages, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+        total = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "cache_pages": pages,
+            "cache_bytes": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,155 @@
+import logging
+
+from .waiting import wait_for_growth
+
+logger = logging.getLogger(__name__)
+
+# Reviews are counted by their rating rows (arguments[0], e.g. "container item"),
+# since one container may hold every review. Only the rows after `start` are
+# serialized, each as the largest element around it holding no other review, so
+# every review crosses the driver boundary (and gets parsed) exactly once
+NEW_NODES_SCRIPT = """
+var items = document.querySelectorAll(arguments[0]);
+var nodes = [];
+for (var i = arguments[1]; i < items.length; i++) {
+    var node = items[i];
+    // Items in one subtree are adjacent in document order, so checking the
+    // neighbours is enough to tell whether a parent holds another review
+    while (!node.matches(arguments[2]) && node.parentElement
+           && !(i > 0 && node.parentElement.contains(items[i - 1]))
+           && !(i + 1 < items.length && node.parentElement.contains(items[i + 1]))) {
+        node = node.parentElement;
+    }
+    nodes.push(node.outerHTML);
+}
+return nodes;
+"""
+
+
+def _remaining(max_reviews, yielded):
+    return None if max_reviews is None else max_reviews - yielded
+
+
+def _drop_known(reviews, is_known):
+    """Returns (reviews not yet known, whether any known review was reached)"""
+    if is_known is None:
+        return reviews, False
+    fresh = [review for review in reviews if not is_known(review)]
+    return fresh, len(fresh) < len(reviews)
+
+
+def iter_api_review_pages(get_json, page_url, parse_page, page_size=50, max_reviews=None, max_pages=None,
+                          is_known=None):
+    """
+    Pull reviews from a paginated JSON endpoint, one page per request
+
+    Args:
+        get_json: Callable(url) -> decoded JSON or None
+        page_url: Callable(page_number, page_size) -> URL (pages start at 1)
+        parse_page: Callable(json) -> list of review dicts, or None if unrecognised
+        page_size: Reviews requested per page
+        max_reviews: Stop after this many reviews (None for all)
+        max_pages: Safety limit on requests (None for no limit)
+        is_known: Callable(review) -> True for reviews an earlier run already has;
+            pages are newest first, so pagination stops at the first page holding one
+
+    Yields: non-empty lists of review dicts. Reviews with an already-seen id are
+    dropped, so a page shifting under us never produces duplicates.
+    """
+    seen_ids = set()
+    yielded = 0
+    page = 1
+
+    while max_pages is None or page <= max_pages:
+        remaining = _remaining(max_reviews, yielded)
+        if remaining is not None and remaining <= 0:
+            return
+
+        reviews = parse_page(get_json(page_url(page, page_size)))
+        if not reviews:
+            return
+
+        batch = []
+        for review in reviews:
+            review_id = review.get("id")
+            if review_id is not None:
+                if review_id in seen_ids:
+                    continue
+                seen_ids.add(review_id)
+            batch.append(review)
+
+        batch, reached_known = _drop_known(batch, is_known)
+        if remaining is not None:
+            batch = batch[:remaining]
+        if batch:
+            yielded += len(batch)
+            yield batch
+
+        if reached_known or len(reviews) < page_size:
+            return
+        page += 1
+
+
+def iter_dom_review_batches(driver, container_selector, item_selector, parse_nodes, max_reviews=None,
+                            max_scrolls=200, settle_timeout=2, timings=None, is_known=None):
+    """
+    Scroll a lazily loading review page, yielding only the reviews that each
+    scroll adds (incremental DOM diffing instead of re-parsing the whole page)
+
+    Args:
+        driver: Selenium driver already on the reviews page
+        container_selector: CSS selector of one review container
+        item_selector: CSS selector of the element marking one review inside a
+            container (its rating row); loaded reviews are counted by it
+        parse_nodes: Callable(list of outerHTML strings, one review each) -> list of review rows
+        max_reviews: Stop after this many reviews (None for all)
+        max_scrolls: Safety limit on scroll steps
+        settle_timeout: Seconds to wait for a scroll to load more reviews
+        timings: Optional Timings to record wait/parse time
+        is_known: Callable(row) -> True for reviews an earlier run already has;
+            scrolling stops at the first batch holding one
+
+    Yields: non-empty lists of review rows
+    """
+    items = f"{container_selector} {item_selector}"
+    seen = 0
+    yielded = 0
+    height = driver.execute_script("return document.body.scrollHeight")
+
+    for scroll in range(max_scrolls + 1):
+        nodes = driver.execute_script(NEW_NODES_SCRIPT, items, seen, container_selector) or []
+        seen += len(nodes)
+
+        if nodes:
+            if timings is not None:
+                with timings.measure("parse"):
+                    rows = parse_nodes(nodes)
+            else:
+                rows = parse_nodes(nodes)
+
+            rows, reached_known = _drop_known(rows, is_known)
+            remaining = _remaining(max_reviews, yielded)
+            if remaining is not None:
+                rows = rows[:remaining]
+            if rows:
+                yielded += len(rows)
+                yield rows
+            if reached_known or (max_reviews is not None and yielded >= max_reviews):
+                break
+
+        if scroll == max_scrolls:
+            logger.warning(f"Stopped after {max_scrolls} scrolls with {yielded} reviews")
+            break
+
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        if timings is not None:
+            with timings.measure("wait"):
+                count, new_height = wait_for_growth(driver, items, seen, height, timeout=settle_timeout)
+        else:
+            count, new_height = wait_for_growth(driver, items, seen, height, timeout=settle_timeout)
+
+        if count <= seen and new_height == height:
+            break
+        height = new_height
+
+    logger.info(f"Loaded {yielded} reviews from {seen} review nodes")
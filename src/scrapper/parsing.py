@@ -0,0 +1,171 @@
+from lxml import etree
+import lxml.html
+
+# Pages are parsed with lxml and queried with XPath compiled once at import time.
+# Each selector fallback chain is resolved once per page layout, not per container.
+
+UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWER = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _has_class(name):
+    """XPath predicate: class attribute contains the token `name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _lower(expr):
+    return f"translate({expr}, '{UPPER}', '{LOWER}')"
+
+
+# Search results
+SEARCH_ITEMS = etree.XPath(f"//ul[{_has_class('results-base')}]//li[{_has_class('product-base')}]")
+LINK_HREFS = etree.XPath(".//a[@href]/@href")
+
+# Product page
+TITLE = etree.XPath("//title")
+OVERALL_RATING = etree.XPath(f"//div[{_has_class('index-overallRating')}]/div")
+PRICE = etree.XPath(f"//span[{_has_class('pdp-price')}]")
+REVIEW_LINK_CHAIN = [
+    etree.XPath(f"//a[{_has_class('detailed-reviews-allReviews')}]/@href"),
+    etree.XPath(f"//a[contains({_lower('normalize-space(.)')}, 'review') or "
+                f"contains({_lower('normalize-space(.)')}, 'rating')]/@href"),
+    etree.XPath(f"//a[contains({_lower('@href')}, 'reviews')]/@href"),
+]
+
+# Inside one review container, most specific layout first
+RATING_CHAIN = [
+    etree.XPath(".//div[@class='user-review-main user-review-showRating']"),
+    etree.XPath(".//div[contains(@class, 'showRating')]"),
+    etree.XPath(f".//span[contains({_lower('@class')}, 'rating')]"),
+]
+COMMENT_CHAIN = [
+    etree.XPath(f".//div[{_has_class('user-review-reviewTextWrapper')}]"),
+    etree.XPath(".//div[contains(@class, 'reviewText')]"),
+    etree.XPath(f".//p[contains({_lower('@class')}, 'review')]"),
+]
+NAME_CHAIN = [
+    etree.XPath(f".//div[{_has_class('user-review-left')}]"),
+    etree.XPath(".//div[contains(@class, 'user-review')]"),
+]
+STAR_RATING = etree.XPath(f".//span[{_has_class('user-review-starRating')}]")
+SPANS = etree.XPath(".//span")
+
+
+def _text(element):
+    return element.text_content().strip()
+
+
+def _document(html):
+    return lxml.html.document_fromstring(html or "<html></html>")
+
+
+def parse_search_results(html):
+    """Unique product links from a search results page, in page order"""
+    urls = []
+    seen = set()
+    for item in SEARCH_ITEMS(_document(html)):
+        hrefs = LINK_HREFS(item)
+        if not hrefs:
+            continue
+        href = hrefs[0]
+        if href not in seen:
+            seen.add(href)
+            urls.append(href)
+    return urls
+
+
+def parse_product_page(html):
+    """
+    Product details from a rendered product page
+    Returns: dict with title, rating, price and reviews_href (None if no link)
+    """
+    doc = _document(html)
+    titles = TITLE(doc)
+    ratings = OVERALL_RATING(doc)
+    prices = PRICE(doc)
+
+    reviews_href = None
+    for xpath in REVIEW_LINK_CHAIN:
+        hrefs = xpath(doc)
+        if hrefs:
+            reviews_href = hrefs[0]
+            break
+
+    return {
+        "title": titles[0].text_content() if titles else "Unknown Product",
+        "rating": ratings[-1].text_content() if ratings else "N/A",
+        "price": prices[-1].text_content() if prices else "N/A",
+        "reviews_href": reviews_href,
+    }
+
+
+class ReviewLayout:
+    """The rating/comment/name selectors that match a page's review markup"""
+
+    def __init__(self, rating, comment, name):
+        self.rating = rating
+        self.comment = comment
+        self.name = name
+
+    @property
+    def complete(self):
+        return None not in (self.rating, self.comment, self.name)
+
+    @classmethod
+    def resolve(cls, containers):
+        """Pick, for each field, the first selector in its chain matching any container"""
+        return cls(*(_first_matching(chain, containers) for chain in (RATING_CHAIN, COMMENT_CHAIN, NAME_CHAIN)))
+
+    def parse(self, container):
+        """Return (date, rating, name, comment) tuples for one container"""
+        user_rating = self.rating(container) if self.rating is not None else []
+        user_comment = self.comment(container) if self.comment is not None else []
+        user_name = self.name(container) if self.name is not None else []
+
+        reviews = []
+        for i, rating_el in enumerate(user_rating):
+            stars = STAR_RATING(rating_el)
+            rating = _text(stars[0]) if stars else "No rating"
+            comment = _text(user_comment[i]) if i < len(user_comment) else "No comment"
+
+            spans = SPANS(user_name[i]) if i < len(user_name) else []
+            name = _text(spans[0]) if spans else "Anonymous"
+            date = _text(spans[1]) if len(spans) > 1 else "Unknown date"
+
+            reviews.append((date, rating, name, comment))
+        return reviews
+
+
+def _first_matching(chain, containers):
+    for xpath in chain:
+        if any(xpath(container) for container in containers):
+            return xpath
+    return None
+
+
+def parse_review_nodes(nodes, layout=None):
+    """
+    Parse review HTML fragments
+
+    Args:
+        nodes: outerHTML strings, each holding one review's element or one or more
+            whole review containers
+        layout: ReviewLayout from an earlier batch of the same page, if any
+
+    Returns: (list of (date, rating, name, comment) tuples, layout used)
+    """
+    containers = []
+    for node in nodes:
+        if node and node.strip():
+            containers.extend(lxml.html.fragments_fromstring(node))
+    containers = [c for c in containers if isinstance(c, lxml.html.HtmlElement)]
+    if not containers:
+        return [], layout
+
+    if layout is None or not layout.complete:
+        layout = ReviewLayout.resolve(containers)
+
+    reviews = []
+    for container in containers:
+        reviews.extend(layout.parse(container))
+    return reviews, layout
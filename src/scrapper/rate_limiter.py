@@ -0,0 +1,35 @@
+from urllib.parse import urlsplit
+import threading
+import time
+
+
+class RateLimiter:
+    """Per-host politeness limit shared by every worker of a scrape"""
+
+    def __init__(self, requests_per_second: float = 1.0):
+        """
+        Args:
+            requests_per_second: Maximum request rate per host (0 disables limiting)
+        """
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """
+        Block until a request to url's host is allowed
+        Returns: seconds spent waiting
+        """
+        if not self.min_interval:
+            return 0.0
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,107 @@
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Third-party analytics, ad and tag-manager hosts seen on Myntra pages
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*facebook.com/tr*",
+    "*hotjar.com*",
+    "*clevertap*",
+    "*branch.io*",
+    "*criteo*",
+    "*moengage*",
+    "*newrelic*",
+    "*nr-data.net*",
+]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.m3u8", "*.gif"]
+IMAGE_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.webp", "*.svg"]
+
+# name -> (disable images via prefs, CDP blocked URL patterns, page load strategy)
+BLOCKING_PROFILES = {
+    "none": (False, [], "normal"),
+    "images": (True, IMAGE_PATTERNS, "eager"),
+    "standard": (True, IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS, "eager"),
+}
+
+PAGE_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var res = performance.getEntriesByType('resource');
+var bytes = nav ? nav.transferSize : 0;
+for (var i = 0; i < res.length; i++) { bytes += res[i].transferSize || 0; }
+return {
+    bytes: bytes,
+    resources: res.length,
+    dom_ready_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : 0
+};
+"""
+
+
+def _profile(name):
+    if name not in BLOCKING_PROFILES:
+        raise ValueError(f"resource_blocking must be one of {tuple(BLOCKING_PROFILES)}, got {name!r}")
+    return BLOCKING_PROFILES[name]
+
+
+def apply_to_options(options, name):
+    """Set the launch-time parts of a blocking profile on Chrome Options"""
+    block_images, _, page_load_strategy = _profile(name)
+    if block_images:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = page_load_strategy
+
+
+def apply_to_driver(driver, name):
+    """Block the profile's URL patterns for the whole session through CDP"""
+    _, patterns, _ = _profile(name)
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logger.warning(f"Could not set blocked URLs: {e}")
+
+
+class PageStats:
+    """Bytes transferred and DOM-ready time per page, summed across workers"""
+
+    def __init__(self):
+        self.pages = 0
+        self.bytes = 0
+        self.resources = 0
+        self.dom_ready_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, driver):
+        """Read the browser's resource timing for the page it is on"""
+        try:
+            metrics = driver.execute_script(PAGE_METRICS_SCRIPT)
+        except Exception:
+            return
+        if not isinstance(metrics, dict):
+            return
+        with self._lock:
+            self.pages += 1
+            self.bytes += int(metrics.get("bytes") or 0)
+            self.resources += int(metrics.get("resources") or 0)
+            self.dom_ready_seconds += (metrics.get("dom_ready_ms") or 0) / 1000
+
+    def summary(self):
+        with self._lock:
+            if not self.pages:
+                return {}
+            return {
+                "pages_measured": self.pages,
+                "bytes_transferred": self.bytes,
+                "avg_page_kb": round(self.bytes / self.pages / 1024, 1),
+                "avg_resources_per_page": round(self.resources / self.pages, 1),
+                "avg_dom_ready_seconds": round(self.dom_ready_seconds / self.pages, 2),
+            }
@@ -0,0 +1,110 @@
+import hashlib
+import threading
+import time
+import logging
+
+import pandas as pd
+
+from utils.sqlite import connect
+
+logger = logging.getLogger(__name__)
+
+
+def review_key(reviewer, date, comment):
+    """Identity of one review: reviewer, date and case/whitespace-normalized comment"""
+    text = " ".join(str(comment).lower().split())
+    return hashlib.blake2b(f"{reviewer}\0{date}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+class ScrapeState:
+    """
+    What earlier runs already scraped, per product id, for incremental re-scrapes:
+    the keys of every review seen and the newest review date.
+
+    Reviews are staged in memory by stage() and only written by commit(), so a run
+    that fails or is cut short leaves the state as it was.
+    """
+
+    def __init__(self, path: str = ".cache/scrape_state.sqlite"):
+        """
+        Args:
+            path: SQLite file (created if missing)
+        """
+        self.path = path
+        self._pending = {}  # product_id -> (keys, newest date) awaiting commit()
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS products ("
+            " product_id TEXT PRIMARY KEY, newest_date TEXT, reviews INTEGER, updated REAL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS known ("
+            " product_id TEXT, key BLOB, PRIMARY KEY (product_id, key)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def known_keys(self, product_id):
+        """Keys of every review recorded for a product (empty for a new product)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM known WHERE product_id = ?", (str(product_id),))
+            return {key for (key,) in rows}
+
+    def product(self, product_id):
+        """{"newest_date", "reviews", "updated"} for a product, or None if never scraped"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_date, reviews, updated FROM products WHERE product_id = ?", (str(product_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"newest_date": row[0], "reviews": row[1], "updated": row[2]}
+
+    def stage(self, product_id, review_data):
+        """
+        Hold a product's newly scraped reviews (a DataFrame with Reviewer/Date/Comment)
+        until commit(), so reviews that never reach the caller are not marked known
+        """
+        keys = {
+            review_key(name, date, comment)
+            for name, date, comment in zip(review_data["Reviewer"], review_data["Date"], review_data["Comment"])
+        }
+        newest = pd.to_datetime(review_data["Date"], format="%d %b %Y", errors="coerce").max()
+        newest = None if pd.isna(newest) else newest.strftime("%Y-%m-%d")
+
+        with self._lock:
+            staged_keys, staged_newest = self._pending.get(str(product_id), (set(), None))
+            staged_keys |= keys
+            if staged_newest is not None and (newest is None or staged_newest > newest):
+                newest = staged_newest
+            self._pending[str(product_id)] = (staged_keys, newest)
+
+    def commit(self):
+        """Persist the staged reviews so later runs treat them as known"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for product_id, (keys, newest) in pending.items():
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO known VALUES (?, ?)", [(product_id, key) for key in keys]
+                )
+                count = self._conn.execute(
+                    "SELECT COUNT(*) FROM known WHERE product_id = ?", (product_id,)
+                ).fetchone()[0]
+                previous = self._conn.execute(
+                    "SELECT newest_date FROM products WHERE product_id = ?", (product_id,)
+                ).fetchone()
+                if previous is not None and previous[0] and (newest is None or previous[0] > newest):
+                    newest = previous[0]
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?)", (product_id, newest, count, time.time())
+                )
+            self._conn.commit()
+
+    def rollback(self):
+        """Forget the reviews staged since the last commit, e.g. from a failed attempt"""
+        with self._lock:
+            self._pending = {}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import queue
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerStartError(RuntimeError):
+    """No worker could be started; the item was not attempted"""
+
+
+class ScraperPool:
+    """Bounded pool of browser workers sharing one product URL queue"""
+
+    def __init__(self, worker_factory, max_workers: int = 1, workers=None):
+        """
+        Args:
+            worker_factory: Callable returning a new worker (one browser each)
+            max_workers: Maximum number of workers scraping at the same time
+            workers: Already-created workers to use before spawning new ones
+        """
+        self.worker_factory = worker_factory
+        self.max_workers = max(1, int(max_workers))
+        self._idle = queue.Queue()
+        self._seeded = list(workers or [])
+        self._spawned = []
+        self._starting = 0
+        self._lock = threading.Lock()
+
+        for worker in self._seeded:
+            self._idle.put(worker)
+
+    def _acquire(self):
+        """
+        Take an idle worker, spawning one if the pool is not yet full. The slot is
+        reserved under the lock but the worker (a browser cold start) is created
+        outside it, so workers start in parallel.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            spawn = len(self._seeded) + len(self._spawned) + self._starting < self.max_workers
+            if spawn:
+                self._starting += 1
+
+        if spawn:
+            try:
+                worker = self.worker_factory()
+            except Exception as e:
+                with self._lock:
+                    self._starting -= 1
+                    running = len(self._seeded) + len(self._spawned)
+                    # Don't keep trying a factory that fails; carry on with the workers there are
+                    self.max_workers = max(running + self._starting, 1)
+                if not running:
+                    raise WorkerStartError(f"Could not start a worker: {e}") from e
+                logger.warning(f"Could not start a worker ({e}); continuing with {running}")
+                return self._idle.get()
+            with self._lock:
+                self._starting -= 1
+                self._spawned.append(worker)
+            return worker
+
+        return self._idle.get()
+
+    def _run(self, fn, idx, item):
+        worker = self._acquire()
+        try:
+            return fn(worker, item)
+        finally:
+            self._idle.put(worker)
+
+    def iter_results(self, items, fn, want, max_checks=None, is_success=None):
+        """
+        Run fn(worker, item) over items concurrently and yield (idx, item, result)
+        in input order, stopping once `want` successful results have been yielded.
+
+        The output is identical to a sequential scan: an item is only yielded
+        after every item before it has finished.
+
+        is_success: Callable(result) -> bool; by default a result succeeds when it
+        is neither None nor empty
+        """
+        is_success = is_success or _is_success
+        items = list(items)
+        limit = len(items) if max_checks is None else min(len(items), max_checks)
+
+        pending = {}
+        finished = {}
+        next_submit = 0
+        next_yield = 0
+        successes = 0  # completed in any order
+        found = 0      # yielded in input order
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while found < want:
+                    # Keep every worker busy until enough results are in flight
+                    while (len(pending) < self.max_workers and next_submit < limit
+                           and successes < want):
+                        future = executor.submit(self._run, fn, next_submit, items[next_submit])
+                        pending[future] = next_submit
+                        next_submit += 1
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        idx = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except WorkerStartError:
+                            # Nothing could scrape the item; failing beats counting it as empty
+                            raise
+                        except Exception as e:
+                            logger.error(f"Worker failed on item {idx}: {e}")
+                            result = None
+                        finished[idx] = result
+                        if is_success(result):
+                            successes += 1
+
+                    while next_yield in finished and found < want:
+                        result = finished.pop(next_yield)
+                        if is_success(result):
+                            found += 1
+                        yield next_yield, items[next_yield], result
+                        next_yield += 1
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def close(self):
+        """Close every worker the pool spawned (seeded workers belong to the caller)"""
+        with self._lock:
+            spawned, self._spawned = self._spawned, []
+        for worker in spawned:
+            try:
+                worker.close()
+            except Exception as e:
+                logger.error(f"Error closing worker: {e}")
+
+
+def _is_success(result):
+    return result is not None and not getattr(result, "empty", False)
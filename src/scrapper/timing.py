@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from collections import defaultdict
+import threading
+import time
+
+
+class Timings:
+    """Accumulate seconds spent per phase (fetch, wait, throttle, parse) across workers"""
+
+    def __init__(self):
+        self._totals = defaultdict(float)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def add(self, phase, seconds):
+        with self._lock:
+            self._totals[phase] += seconds
+
+    def summary(self):
+        """Return {phase: seconds} rounded for reporting"""
+        with self._lock:
+            return {phase: round(seconds, 2) for phase, seconds in self._totals.items()}
+
+    def format(self):
+        return ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in sorted(self.summary().items()))
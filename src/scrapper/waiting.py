@@ -0,0 +1,66 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Selenium is imported inside the helpers so that importing the scraper (e.g. for
+# HTTP mode or a warm cache) does not load it
+
+POLL_INTERVAL = 0.2
+
+
+def wait_for_selector(driver, css_selector, timeout=10, poll=POLL_INTERVAL):
+    """
+    Wait until at least one element matches css_selector
+    Returns: True if found, False on timeout (the caller parses what is there)
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, css_selector)
+        )
+        return True
+    except TimeoutException:
+        logger.debug(f"Timed out waiting for {css_selector}")
+        return False
+
+
+def wait_for_document_ready(driver, timeout=10, poll=POLL_INTERVAL):
+    """Wait until the browser reports the document as fully loaded"""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def count_elements(driver, css_selector):
+    """Count matching elements in the page without fetching element handles"""
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", css_selector)
+
+
+def wait_for_growth(driver, css_selector, last_count, last_height, timeout=3, poll=POLL_INTERVAL):
+    """
+    Wait for lazily loaded content after a scroll: either more elements match
+    css_selector or the page grows taller.
+    Returns: (count, height) — unchanged values mean loading has settled
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    state = {"count": last_count, "height": last_height}
+
+    def grew(d):
+        state["count"] = count_elements(d, css_selector)
+        state["height"] = d.execute_script("return document.body.scrollHeight")
+        return state["count"] > last_count or state["height"] != last_height
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(grew)
+    except TimeoutException:
+        pass
+    return state["count"], state["height"]
@@ -1,9 +1,10 @@
 import pandas as pd
 from datetime import datetime
 import io
-from fpdf import FPDF
 import logging
 
+from analytics.summary import DatasetSummary
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,10 +12,15 @@ class ExportManager:
     """Handle data export to various formats"""
     
     @staticmethod
-    def export_to_excel(df, filename=None):
+    def export_to_excel(df, filename=None, summary=None):
         """
         Export dataframe to Excel with formatting
+        
+        Args:
+            summary: DatasetSummary of df for the statistics sheet (computed when not given)
         """
+        if summary is None:
+            summary = DatasetSummary.from_frame(df)
         if filename is None:
             filename = f"myntra_reviews_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
@@ -42,20 +48,13 @@ class ExportManager:
                 # Auto-adjust column widths
                 for i, col in enumerate(df.columns):
                     max_length = max(
-                        df[col].astype(str).apply(len).max(),
+                        df[col].map(str).str.len().max(),
                         len(str(col))
                     )
                     worksheet.set_column(i, i, min(max_length + 2, 50))
                 
                 # Add statistics sheet
-                try:
-                    rating_numeric = pd.to_numeric(
-                        df['Rating'].astype(str).str.extract(r'(\d+\.?\d*)')[0], 
-                        errors='coerce'
-                    )
-                    avg_rating = f"{rating_numeric.mean():.2f}"
-                except:
-                    avg_rating = "N/A"
+                avg_rating = "N/A" if pd.isna(summary.avg_rating) else f"{summary.avg_rating:.2f}"
                 
                 stats_df = pd.DataFrame({
                     'Metric': [
@@ -67,12 +66,12 @@ class ExportManager:
                         'Neutral Reviews'
                     ],
                     'Value': [
-                        len(df),
-                        df['Product Name'].nunique(),
+                        summary.total,
+                        summary.products,
                         avg_rating,
-                        len(df[df['VADER_Sentiment'] == 'Positive']),
-                        len(df[df['VADER_Sentiment'] == 'Negative']),
-                        len(df[df['VADER_Sentiment'] == 'Neutral'])
+                        summary.sentiment_count('Positive'),
+                        summary.sentiment_count('Negative'),
+                        summary.sentiment_count('Neutral')
                     ]
                 })
                 
@@ -100,8 +99,10 @@ class ExportManager:
             return None
     
     @staticmethod
-    def create_summary_report(df):
-        """Create a text summary report"""
+    def create_summary_report(df, summary=None):
+        """Create a text summary report (summary: DatasetSummary of df, computed when not given)"""
+        if summary is None:
+            summary = DatasetSummary.from_frame(df)
         report = []
         report.append("=" * 60)
         report.append("MYNTRA REVIEW SCRAPER - SUMMARY REPORT")
@@ -111,41 +112,34 @@ class ExportManager:
         
         # Basic stats
         report.append("OVERVIEW:")
-        report.append(f"  Total Reviews Scraped: {len(df)}")
-        report.append(f"  Unique Products: {df['Product Name'].nunique()}")
-        report.append(f"  Date Range: {df['Date'].min()} to {df['Date'].max()}")
+        report.append(f"  Total Reviews Scraped: {summary.total}")
+        report.append(f"  Unique Products: {summary.products}")
+        first, last = summary.date_range
+        if pd.notna(first):
+            report.append(f"  Date Range: {first:%d %b %Y} to {last:%d %b %Y}")
+        else:
+            report.append("  Date Range: Unknown")
         
         # Rating stats
         report.append(f"\n{'─' * 60}\n")
         report.append("RATING ANALYSIS:")
-        try:
-            rating_numeric = pd.to_numeric(
-                df['Rating'].astype(str).str.extract(r'(\d+\.?\d*)')[0], 
-                errors='coerce'
-            )
-            avg_rating = rating_numeric.mean()
-        except:
-            avg_rating = 0.0
-        report.append(f"  Average Rating: {avg_rating:.2f} stars")
-        rating_dist = df['Rating'].value_counts().sort_index()
-        for rating, count in rating_dist.items():
-            report.append(f"  {rating} stars: {count} reviews ({count/len(df)*100:.1f}%)")
+        report.append(f"  Average Rating: {summary.avg_rating:.2f} stars")
+        for rating, count in summary.rating_counts.items():
+            report.append(f"  {rating} stars: {count} reviews ({count/summary.total*100:.1f}%)")
         
         # Sentiment stats
         report.append(f"\n{'─' * 60}\n")
         report.append("SENTIMENT ANALYSIS:")
-        sentiment_dist = df['VADER_Sentiment'].value_counts()
-        for sentiment, count in sentiment_dist.items():
-            report.append(f"  {sentiment}: {count} reviews ({count/len(df)*100:.1f}%)")
+        for sentiment, count in summary.sentiment_counts.items():
+            report.append(f"  {sentiment}: {count} reviews ({count/summary.total*100:.1f}%)")
         
-        avg_sentiment = df['VADER_Score'].mean()
-        report.append(f"  Average Sentiment Score: {avg_sentiment:.3f}")
+        report.append(f"  Average Sentiment Score: {summary.avg_sentiment:.3f}")
         
         # Top products
         report.append(f"\n{'─' * 60}\n")
         report.append("TOP PRODUCTS BY REVIEW COUNT:")
-        top_products = df['Product Name'].value_counts().head(5)
-        for idx, (product, count) in enumerate(top_products.items(), 1):
+        top_products = summary.product_stats.head(5)
+        for idx, (product, count) in enumerate(zip(top_products['Product'], top_products['Reviews']), 1):
             report.append(f"  {idx}. {product[:50]}... ({count} reviews)")
         
         # Most positive/negative
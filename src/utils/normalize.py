@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+NUMBER_PATTERN = r'(\d+\.?\d*)'
+SENTIMENT_LABELS = ['Positive', 'Neutral', 'Negative']
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+
+def parse_rating(values):
+    """Numeric rating from strings like '4', '4.3' or '★ 4' (NaN when absent)"""
+    return pd.to_numeric(
+        pd.Series(values).astype(str).str.extract(NUMBER_PATTERN)[0],
+        errors='coerce'
+    ).astype('float32')
+
+
+def parse_price(values):
+    """Numeric price from strings like '₹1,299' or 'Rs. 1299' (NaN when absent)"""
+    return pd.to_numeric(
+        pd.Series(values).astype(str).str.replace(',', '', regex=False).str.extract(NUMBER_PATTERN)[0],
+        errors='coerce'
+    )
+
+
+def parse_date(values):
+    """Review dates like '14 Feb 2024', falling back to pandas' own parsing"""
+    values = pd.Series(values).astype(str)
+    dates = pd.to_datetime(values, format='%d %b %Y', errors='coerce')
+    missing = dates.isna()
+    if missing.any():
+        dates[missing] = pd.to_datetime(values[missing], format='mixed', errors='coerce')
+    return dates
+
+
+def sentiment_labels(scores):
+    """Vectorized get_sentiment_label: categorical Positive / Neutral / Negative"""
+    scores = np.asarray(scores, dtype=float)
+    # Codes index SENTIMENT_LABELS, so no per-row strings are ever built
+    codes = np.select(
+        [scores >= POSITIVE_THRESHOLD, scores <= NEGATIVE_THRESHOLD],
+        [0, 2],
+        default=1
+    ).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=SENTIMENT_LABELS)
+
+
+def normalize_reviews(df):
+    """
+    Add typed columns once, right after scraping, so consumers never re-parse strings:
+    Rating_Numeric, Overall_Rating_Numeric, Price_Numeric, Date_Parsed
+    """
+    df['Rating_Numeric'] = parse_rating(df['Rating']).values
+    df['Overall_Rating_Numeric'] = parse_rating(df['Overall Rating']).values
+    df['Price_Numeric'] = parse_price(df['Price']).values
+    df['Date_Parsed'] = parse_date(df['Date']).values
+    return df
+
+
+def numeric_rating(df):
+    """The Rating_Numeric column, parsing Rating only for frames that skipped normalize_reviews"""
+    if 'Rating_Numeric' in df.columns:
+        return df['Rating_Numeric']
+    return pd.Series(parse_rating(df['Rating']).values, index=df.index)
+
+
+def parsed_dates(df):
+    """The Date_Parsed column, parsing Date only for frames that skipped normalize_reviews"""
+    if 'Date_Parsed' in df.columns:
+        return df['Date_Parsed']
+    return pd.Series(parse_date(df['Date']).values, index=df.index)
@@ -0,0 +1,223 @@
+import os
+import threading
+import uuid
+from urllib.parse import quote, unquote
+from datetime import date, datetime
+import logging
+
+import pandas as pd
+
+from .normalize import normalize_reviews
+from .text_index import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+# Optional: the store needs pyarrow; the rest of the app runs without it
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+QUERY = 'query'
+SCRAPE_DATE = 'scrape_date'
+DOC_ID = 'Doc_ID'
+# Underscore-prefixed, so dataset discovery skips it
+TEXT_INDEX_DIR = '_text_index'
+
+STRING_COLUMNS = ['Product Name', 'Overall Rating', 'Price', 'Date', 'Rating', 'Reviewer', 'Comment']
+# Low-cardinality string columns, returned as pandas categoricals
+CATEGORY_COLUMNS = ['Product Name', 'Overall Rating', 'Price', 'Date', 'Rating', 'Reviewer', QUERY, SCRAPE_DATE]
+
+if PYARROW_AVAILABLE:
+    STORE_SCHEMA = pa.schema(
+        [(col, pa.string()) for col in STRING_COLUMNS] + [
+            ('Rating_Numeric', pa.float32()),
+            ('Overall_Rating_Numeric', pa.float32()),
+            ('Price_Numeric', pa.float32()),
+            ('Date_Parsed', pa.timestamp('ms')),
+            ('Scraped_At', pa.timestamp('ms')),
+            (DOC_ID, pa.int64()),
+        ]
+    )
+    PARTITIONING = ds.partitioning(pa.schema([(QUERY, pa.string()), (SCRAPE_DATE, pa.string())]), flavor='hive')
+
+
+def normalize_query(query):
+    """Partition key for a search: case and spacing don't make a new query"""
+    return " ".join(str(query).lower().split())
+
+
+def _day(value):
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+class ReviewStore:
+    """
+    Scraped reviews on disk as Parquet, partitioned by search query and scrape date:
+    <root>/query=<query>/scrape_date=<YYYY-MM-DD>/part-*.parquet
+
+    Query values are URI-encoded in directory names, as hive partitioning expects.
+    Comments are also added to a full-text InvertedIndex under <root>/_text_index as
+    they are appended; each row's Doc_ID is its document id there.
+    """
+
+    def __init__(self, root: str = "data/reviews", row_group_size: int = 50_000, text_index: bool = True):
+        """
+        Args:
+            root: Directory holding the partitioned dataset (created on first append)
+            row_group_size: Rows per Parquet row group; smaller groups let product and
+                date filters skip more of each file using its min/max statistics
+            text_index: Maintain the comment search index (needed by search())
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("ReviewStore needs pyarrow: pip install pyarrow")
+        self.root = root
+        self.row_group_size = row_group_size
+        self.index = InvertedIndex(os.path.join(root, TEXT_INDEX_DIR)) if text_index else None
+        self._lock = threading.Lock()
+
+    def append(self, df, query, scraped_at=None):
+        """
+        Write one scrape's reviews as a new file in its query/date partition
+
+        Returns: path of the written file (None if df is empty)
+        """
+        if df is None or df.empty:
+            return None
+        scraped_at = scraped_at or datetime.now()
+
+        df = df.copy()
+        for col in STRING_COLUMNS:
+            # Categoricals from the compact schema are written as plain strings
+            df[col] = df[col].astype(object) if col in df.columns else None
+        if 'Rating_Numeric' not in df.columns:
+            df = normalize_reviews(df)
+        df['Scraped_At'] = pd.Timestamp(scraped_at).floor('ms')
+
+        with self._lock:
+            return self._write(df, query, scraped_at)
+
+    def _write(self, df, query, scraped_at):
+        if self.index is not None:
+            # Ids are taken before the file is written: if writing fails they are
+            # simply never used, rather than reused for different reviews
+            self.index.refresh()
+            df[DOC_ID] = self.index.add(df['Comment'].fillna(''))
+        else:
+            df[DOC_ID] = None
+
+        table = pa.Table.from_pandas(df[STORE_SCHEMA.names], schema=STORE_SCHEMA, preserve_index=False)
+
+        directory = os.path.join(
+            self.root,
+            f"{QUERY}={quote(normalize_query(query), safe='')}",
+            f"{SCRAPE_DATE}={_day(scraped_at)}",
+        )
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{scraped_at:%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        path = os.path.join(directory, name)
+        # Dataset discovery ignores dot-files, so readers never see a half-written part
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        pq.write_table(table, tmp_path, row_group_size=self.row_group_size, compression='zstd')
+        os.replace(tmp_path, path)
+        if self.index is not None:
+            self.index.save()
+
+        logger.info(f"Stored {len(table)} reviews in {path}")
+        return path
+
+    def _dataset(self):
+        if not os.path.isdir(self.root):
+            return None
+        return ds.dataset(self.root, format='parquet', schema=_full_schema(), partitioning=PARTITIONING)
+
+    def _filter(self, query=None, products=None, date_from=None, date_to=None, scraped_from=None, scraped_to=None,
+                doc_ids=None):
+        """Arrow filter expression; partition fields prune whole directories"""
+        conditions = []
+        if doc_ids is not None:
+            conditions.append(ds.field(DOC_ID).isin(pa.array(doc_ids, type=pa.int64())))
+        if query is not None:
+            queries = [query] if isinstance(query, str) else list(query)
+            conditions.append(ds.field(QUERY).isin([normalize_query(q) for q in queries]))
+        if scraped_from is not None:
+            conditions.append(ds.field(SCRAPE_DATE) >= _day(scraped_from))
+        if scraped_to is not None:
+            conditions.append(ds.field(SCRAPE_DATE) <= _day(scraped_to))
+        if products is not None:
+            conditions.append(ds.field('Product Name').isin(list(products)))
+        if date_from is not None:
+            conditions.append(ds.field('Date_Parsed') >= pd.Timestamp(date_from).to_pydatetime())
+        if date_to is not None:
+            conditions.append(ds.field('Date_Parsed') <= pd.Timestamp(date_to).to_pydatetime())
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def read(self, columns=None, query=None, products=None, date_from=None, date_to=None,
+             scraped_from=None, scraped_to=None, doc_ids=None):
+        """
+        Load reviews, reading only the requested columns of the matching partitions and row groups
+
+        Args:
+            columns: Columns to load (default: all, including query and scrape_date)
+            query: Search query, or a list of them
+            products: Product names to keep
+            date_from, date_to: Inclusive review date range (on Date_Parsed)
+            scraped_from, scraped_to: Inclusive scrape date range (dates or 'YYYY-MM-DD')
+            doc_ids: Doc_IDs to keep, e.g. from search()
+
+        Returns: DataFrame with string columns as categoricals (empty if nothing matches)
+        """
+        dataset = self._dataset()
+        if dataset is None:
+            return pd.DataFrame(columns=columns or _full_schema().names)
+
+        table = dataset.to_table(
+            columns=columns,
+            filter=self._filter(query, products, date_from, date_to, scraped_from, scraped_to, doc_ids),
+        )
+        categories = [col for col in CATEGORY_COLUMNS if col in table.column_names]
+        return table.to_pandas(categories=categories)
+
+    def count(self, query=None, products=None, date_from=None, date_to=None, scraped_from=None, scraped_to=None):
+        """Number of stored reviews matching the filters, without loading any columns"""
+        dataset = self._dataset()
+        if dataset is None:
+            return 0
+        return dataset.count_rows(
+            filter=self._filter(query, products, date_from, date_to, scraped_from, scraped_to)
+        )
+
+    def search(self, text, limit=None):
+        """
+        Doc_IDs of stored reviews whose comment matches a text query, best BM25 match first
+
+        text uses the InvertedIndex syntax: words are ANDed, OR between alternatives,
+        -word to exclude, "quoted phrase"
+        """
+        if self.index is None:
+            raise RuntimeError("This ReviewStore was opened with text_index=False")
+        self.index.refresh()
+        return self.index.search(text, limit=limit)[0]
+
+    def queries(self):
+        """Stored search queries, from the partition directory names"""
+        if not os.path.isdir(self.root):
+            return []
+        prefix = f"{QUERY}="
+        return sorted(
+            unquote(entry[len(prefix):]) for entry in os.listdir(self.root) if entry.startswith(prefix)
+        )
+
+
+def _full_schema():
+    return STORE_SCHEMA.append(pa.field(QUERY, pa.string())).append(pa.field(SCRAPE_DATE, pa.string()))
+
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from .normalize import SENTIMENT_LABELS
+
+# Product-level fields repeat on every review row as scraped; they live once per product
+# in the products table, and reviews refer to them by a compact integer Product ID.
+PRODUCT_ID = 'Product ID'
+PRODUCT_KEY_COLUMNS = ['Product Name', 'Overall Rating', 'Price']
+
+SENTIMENT_DTYPE = pd.CategoricalDtype(SENTIMENT_LABELS)
+
+PRODUCT_DTYPES = {
+    PRODUCT_ID: 'int32',
+    'Overall_Rating_Numeric': 'float32',
+    'Price_Numeric': 'float32',
+}
+
+REVIEW_DTYPES = {
+    PRODUCT_ID: 'int32',
+    'Date': 'category',
+    'Rating': 'category',
+    'Reviewer': 'category',
+    'Rating_Numeric': 'float32',
+    'Date_Parsed': 'datetime64[ns]',
+    'TB_Polarity': 'float32',
+    'TB_Subjectivity': 'float32',
+    'TB_Sentiment': SENTIMENT_DTYPE,
+    'VADER_Score': 'float32',
+    'VADER_Sentiment': SENTIMENT_DTYPE,
+}
+
+# Columns of the products table beyond the key, when the frame has them
+PRODUCT_EXTRA_COLUMNS = ['Overall_Rating_Numeric', 'Price_Numeric']
+
+
+def _apply_dtypes(df, dtypes):
+    df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+    for col in df.columns:
+        # Frames filtered out of a larger categorical frame keep every old category otherwise
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and df[col].dtype != SENTIMENT_DTYPE:
+            df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+
+def split_products(df):
+    """
+    Split a wide review frame into a products table and a reviews table
+
+    Returns: (products, reviews) - products has one row per distinct
+    (Product Name, Overall Rating, Price) with a Product ID from 0 in order of
+    first appearance; reviews keeps every other column plus that Product ID
+    """
+    ids = df.groupby(PRODUCT_KEY_COLUMNS, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    first = ~df.duplicated(PRODUCT_KEY_COLUMNS).to_numpy()
+
+    product_columns = PRODUCT_KEY_COLUMNS + [c for c in PRODUCT_EXTRA_COLUMNS if c in df.columns]
+    products = df.loc[first, product_columns].reset_index(drop=True)
+    products.insert(0, PRODUCT_ID, np.arange(len(products)))
+
+    reviews = df.drop(columns=product_columns)
+    reviews.insert(0, PRODUCT_ID, ids)
+
+    return _apply_dtypes(products, PRODUCT_DTYPES), _apply_dtypes(reviews, REVIEW_DTYPES)
+
+
+def join_products(products, reviews):
+    """
+    Wide frame for the dashboard and exports: product fields are joined back as
+    categoricals (or numeric arrays), so they cost one small code per review
+    """
+    ids = reviews[PRODUCT_ID].to_numpy()
+    wide = reviews.copy()
+    position = 1
+    for col in products.columns.drop(PRODUCT_ID):
+        if col in PRODUCT_KEY_COLUMNS:
+            values = products[col].astype('category').cat.remove_unused_categories()
+            column = pd.Categorical.from_codes(values.cat.codes.to_numpy()[ids], dtype=values.dtype)
+        else:
+            column = products[col].to_numpy()[ids]
+        wide.insert(position, col, column)
+        position += 1
+    return wide
+
+
+def compact_reviews(df):
+    """The scraped/analyzed review frame in the compact typed schema, same column names"""
+    return join_products(*split_products(df))
+
+
+def bytes_per_row(df):
+    """Deep memory use of a frame divided by its row count"""
+    return df.memory_usage(deep=True, index=False).sum() / max(len(df), 1)
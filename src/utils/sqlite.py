@@ -0,0 +1,22 @@
+import os
+import sqlite3
+
+# SQLite allows 999 ? parameters per statement in older builds; stay below that
+SQLITE_MAX_VARIABLES = 900
+
+
+def connect(path):
+    """
+    Open a SQLite file, creating its directory if missing. The connection may be
+    used from any thread; callers serialize access with their own lock.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return sqlite3.connect(path, check_same_thread=False)
+
+
+def chunked(items, size=SQLITE_MAX_VARIABLES):
+    """Split a list into pieces small enough for one `IN (?, ?, ...)` query"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
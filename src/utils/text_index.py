@@ -0,0 +1,426 @@
+from itertools import chain
+import json
+import math
+import os
+import re
+import threading
+import uuid
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Quoted phrases (optionally negated with a leading -) or bare words
+QUERY_PATTERN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+INDEX_VERSION = 1
+
+# Left out of keyword statistics (not out of the index: phrases still match them)
+STOP_WORDS = frozenset([
+    'the', 'is', 'in', 'and', 'to', 'a', 'of', 'for', 'it', 'this',
+    'that', 'on', 'with', 'as', 'are', 'was', 'be', 'but', 'not',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'can', 'could', 'should', 'i', 'you', 'my', 'me', 'your',
+])
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens, in order (positions are list indices)"""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _in_sorted(values, sorted_values):
+    """Mask of values present in a sorted array (binary search, no re-sorting)"""
+    if not len(sorted_values):
+        return np.zeros(len(values), dtype=bool)
+    at = np.minimum(np.searchsorted(sorted_values, values), len(sorted_values) - 1)
+    return sorted_values[at] == values
+
+
+def _intersect(a, b):
+    """Intersection of two sorted unique arrays, looking up the shorter in the longer"""
+    if len(a) > len(b):
+        a, b = b, a
+    return a[_in_sorted(a, b)]
+
+
+class _Vocab(dict):
+    """term -> id, assigning the next id to unseen terms on lookup"""
+
+    def __init__(self, terms=()):
+        super().__init__((term, i) for i, term in enumerate(terms))
+        self.terms = list(terms)
+
+    def __missing__(self, term):
+        term_id = self[term] = len(self.terms)
+        self.terms.append(term)
+        return term_id
+
+
+class _Segment:
+    """
+    Immutable postings for a contiguous range of documents, in CSR form:
+    term_offsets[t]:term_offsets[t + 1] slices docs/tfs for term t, and
+    pos_offsets[p]:pos_offsets[p + 1] slices positions for posting p
+    """
+
+    ARRAYS = ('term_offsets', 'docs', 'tfs', 'pos_offsets', 'positions', 'lengths')
+
+    def __init__(self, first_doc, term_offsets, docs, tfs, pos_offsets, positions, lengths, name=None):
+        self.first_doc = int(first_doc)
+        self.term_offsets = term_offsets
+        self.docs = docs
+        self.tfs = tfs
+        self.pos_offsets = pos_offsets
+        self.positions = positions
+        self.lengths = lengths
+        self.name = name
+        self._posting_terms = None
+
+    @property
+    def n_docs(self):
+        return len(self.lengths)
+
+    @classmethod
+    def build(cls, first_doc, term_ids, doc_ids, positions, lengths, vocab_size):
+        """From one (term, doc, pos) triple per token, in doc then position order"""
+        order = np.argsort(term_ids, kind='stable')  # keeps doc/position order within a term
+        terms, docs, positions = term_ids[order], doc_ids[order], positions[order]
+
+        new_posting = np.ones(len(terms), dtype=bool)
+        new_posting[1:] = (terms[1:] != terms[:-1]) | (docs[1:] != docs[:-1])
+        starts = np.flatnonzero(new_posting)
+        pos_offsets = np.append(starts, len(terms)).astype(np.int64)
+
+        return cls(
+            first_doc,
+            term_offsets=np.searchsorted(terms[starts], np.arange(vocab_size + 1)).astype(np.int64),
+            docs=docs[starts],
+            tfs=np.diff(pos_offsets).astype(np.int32),
+            pos_offsets=pos_offsets,
+            positions=positions.astype(np.int32),
+            lengths=lengths,
+        )
+
+    @property
+    def posting_terms(self):
+        """Term id of each posting (built on first use, for keyword counts and merges)"""
+        if self._posting_terms is None:
+            self._posting_terms = np.repeat(
+                np.arange(len(self.term_offsets) - 1, dtype=np.int32), np.diff(self.term_offsets)
+            )
+        return self._posting_terms
+
+    def triples(self):
+        """(term, doc, pos) per token, grouped by term: the inverse of build()"""
+        return np.repeat(self.posting_terms, self.tfs), np.repeat(self.docs, self.tfs), self.positions
+
+    def postings(self, term_id):
+        """(docs, tfs, posting indices) of one term"""
+        if term_id is None or term_id >= len(self.term_offsets) - 1:
+            return np.empty(0, np.int32), np.empty(0, np.int32), np.empty(0, np.int64)
+        start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+        return self.docs[start:end], self.tfs[start:end], np.arange(start, end)
+
+    def doc_positions(self, term_id, candidates):
+        """(doc, position) of every occurrence of a term within the sorted candidate docs"""
+        docs, tfs, postings = self.postings(term_id)
+        keep = _in_sorted(docs, candidates)
+        docs, counts, starts = docs[keep], tfs[keep], self.pos_offsets[postings[keep]]
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(docs, counts), self.positions[np.repeat(starts, counts) + within]
+
+
+class InvertedIndex:
+    """
+    Positional inverted index over review comments with BM25 ranking.
+
+    Documents are numbered in the order they are added. Each add() becomes a new
+    segment of numpy arrays, so ingesting a batch never rewrites earlier postings;
+    segments are merged once there are more than max_segments. With a path, save()
+    writes new segments next to a small manifest, and another process can pick
+    them up with refresh().
+
+    Queries: words are ANDed, OR separates alternatives, a leading - excludes,
+    and "quoted words" must appear as a phrase, e.g.  fabric "colour faded" -wash
+    """
+
+    def __init__(self, path: str = None, max_segments: int = 8, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            path: Directory the index is saved to and loaded from (None: memory only)
+            max_segments: Newer segments are merged once there are more than this
+            k1, b: BM25 term-frequency saturation and length normalization
+        """
+        self.path = path
+        self.max_segments = max_segments
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._reset()
+        if path and os.path.exists(os.path.join(path, 'manifest.json')):
+            self._load()
+
+    def _reset(self):
+        self.vocab = _Vocab()
+        self.segments = []
+        self._lengths = None
+        self._obsolete = []
+
+    @property
+    def n_docs(self):
+        return sum(segment.n_docs for segment in self.segments)
+
+    def __len__(self):
+        return self.n_docs
+
+    def _doc_lengths(self):
+        if self._lengths is None:
+            self._lengths = np.concatenate([s.lengths for s in self.segments]) if self.segments else np.empty(0, np.int32)
+        return self._lengths
+
+    def add(self, texts):
+        """
+        Index a batch of texts as the next documents
+
+        Returns: range of the doc ids assigned, in input order
+        """
+        with self._lock:
+            first = self.n_docs
+            token_ids = [list(map(self.vocab.__getitem__, tokenize(text))) for text in texts]
+            if not token_ids:
+                return range(first, first)
+            lengths = np.fromiter(map(len, token_ids), dtype=np.int32, count=len(token_ids))
+            total = int(lengths.sum())
+            term_ids = np.fromiter(chain.from_iterable(token_ids), dtype=np.int32, count=total)
+            doc_ids = np.repeat(np.arange(first, first + len(lengths), dtype=np.int32), lengths)
+            positions = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+            self.segments.append(_Segment.build(first, term_ids, doc_ids, positions, lengths, len(self.vocab.terms)))
+            self._lengths = None
+            if len(self.segments) > self.max_segments:
+                self._merge(len(self.segments) // 2)
+            return range(first, first + len(lengths))
+
+    def _merge(self, start):
+        """Replace segments[start:] with one segment"""
+        merging = self.segments[start:]
+        parts = [segment.triples() for segment in merging]
+        terms, docs, positions = (np.concatenate(arrays) for arrays in zip(*parts))
+        # build() sorts by term stably; segments are in doc order, so docs stay ascending per term
+        merged = _Segment.build(
+            merging[0].first_doc, terms, docs, positions,
+            np.concatenate([segment.lengths for segment in merging]), len(self.vocab.terms),
+        )
+        self._obsolete.extend(segment.name for segment in merging if segment.name)
+        self.segments[start:] = [merged]
+        logger.info(f"Merged {len(merging)} index segments ({merged.n_docs} documents)")
+
+    # ---- queries ----
+
+    def _term_id(self, term):
+        return self.vocab.get(term)
+
+    def term_docs(self, term):
+        """(docs, tfs) of a term across all segments, docs ascending"""
+        term_id = self._term_id(term)
+        if term_id is None:
+            return np.empty(0, np.int32), np.empty(0, np.int32)
+        parts = [segment.postings(term_id)[:2] for segment in self.segments]
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def doc_freq(self, term):
+        """Number of documents containing a term"""
+        return len(self.term_docs(term)[0])
+
+    def _phrase_docs(self, tokens):
+        """Docs containing every token, consecutively when there are several"""
+        postings = sorted((self.term_docs(token)[0] for token in set(tokens)), key=len)
+        candidates = postings[0]
+        for docs in postings[1:]:
+            candidates = _intersect(candidates, docs)
+        if not len(candidates) or len(tokens) == 1:
+            return candidates
+        matches = None
+        for offset, token in enumerate(tokens):
+            term_id = self._term_id(token)
+            keys = []
+            for segment in self.segments:
+                docs, positions = segment.doc_positions(term_id, candidates)
+                keep = positions >= offset
+                # Shift so consecutive phrase words share one (doc, start position) key;
+                # postings are in doc then position order, so keys come out sorted and unique
+                keys.append((docs[keep].astype(np.int64) << 32) | (positions[keep] - offset))
+            keys = np.concatenate(keys)
+            matches = keys if matches is None else _intersect(matches, keys)
+        return np.unique(matches >> 32).astype(np.int32)
+
+    def _parse(self, query):
+        """OR-separated clauses of (negated, tokens) items"""
+        clauses = [[]]
+        for negated, phrase, word in QUERY_PATTERN.findall(str(query)):
+            if word == 'OR':
+                clauses.append([])
+                continue
+            if word.startswith('-') and len(word) > 1:
+                negated, word = '-', word[1:]
+            tokens = tokenize(phrase if phrase else word)
+            if tokens:
+                clauses[-1].append((bool(negated), tokens))
+        return [clause for clause in clauses if clause]
+
+    def match(self, query):
+        """Sorted doc ids matching a query (empty for an empty query)"""
+        with self._lock:
+            result = None
+            for clause in self._parse(query):
+                positive = [tokens for negated, tokens in clause if not negated]
+                docs = None
+                for tokens in positive:
+                    hits = self._phrase_docs(tokens)
+                    docs = hits if docs is None else _intersect(docs, hits)
+                if docs is None:
+                    docs = np.arange(self.n_docs, dtype=np.int32)
+                for tokens in (tokens for negated, tokens in clause if negated):
+                    docs = docs[~_in_sorted(docs, self._phrase_docs(tokens))]
+                result = docs if result is None else np.union1d(result, docs)
+            return np.empty(0, np.int32) if result is None else result
+
+    def scores(self, query, docs):
+        """BM25 scores of docs for the query's non-negated terms"""
+        with self._lock:
+            docs = np.asarray(docs)
+            terms = {token for clause in self._parse(query) for negated, tokens in clause if not negated
+                     for token in tokens}
+            n_docs = self.n_docs
+            lengths = self._doc_lengths()
+            if not n_docs or not len(docs):
+                return np.zeros(len(docs))
+            norm = self.k1 * (1 - self.b + self.b * lengths[docs] / max(lengths.mean(), 1e-9))
+            scores = np.zeros(len(docs))
+            for term in terms:
+                term_docs, tfs = self.term_docs(term)
+                if not len(term_docs):
+                    continue
+                idf = math.log(1 + (n_docs - len(term_docs) + 0.5) / (len(term_docs) + 0.5))
+                at = np.minimum(np.searchsorted(term_docs, docs), len(term_docs) - 1)
+                tf = np.where(term_docs[at] == docs, tfs[at], 0)
+                scores += idf * tf * (self.k1 + 1) / (tf + norm)
+            return scores
+
+    def search(self, query, limit=None):
+        """
+        Matching doc ids ranked by BM25, best first (ties in doc order)
+
+        Returns: (doc_ids, scores)
+        """
+        docs = self.match(query)
+        scores = self.scores(query, docs)
+        if limit is not None and limit < len(docs):
+            # Only the top `limit` need sorting; the partition keeps doc order for ties
+            top = np.sort(np.argpartition(-scores, limit - 1)[:limit])
+            docs, scores = docs[top], scores[top]
+        order = np.argsort(-scores, kind='stable')
+        return docs[order], scores[order]
+
+    def top_terms(self, docs=None, n=20, exclude=(), min_length=1):
+        """
+        Most frequent terms (by occurrences) within a set of documents
+
+        Args:
+            docs: Boolean mask over doc ids, or doc ids (default: every document)
+            exclude: Terms to leave out, e.g. stop words
+            min_length: Shortest term reported
+
+        Returns: list of (term, count), most frequent first
+        """
+        with self._lock:
+            vocab_size = len(self.vocab.terms)
+            if docs is not None:
+                docs = np.asarray(docs)
+                if docs.dtype != bool:
+                    mask = np.zeros(self.n_docs, dtype=bool)
+                    mask[docs] = True
+                    docs = mask
+            counts = np.zeros(vocab_size, dtype=np.int64)
+            for segment in self.segments:
+                posting_terms, tfs = segment.posting_terms, segment.tfs
+                if docs is not None:
+                    keep = docs[segment.docs]
+                    posting_terms, tfs = posting_terms[keep], tfs[keep]
+                counts += np.bincount(posting_terms, weights=tfs, minlength=vocab_size).astype(np.int64)
+
+            terms = self.vocab.terms
+            for term in exclude:
+                if term in self.vocab:
+                    counts[self.vocab[term]] = 0
+            if min_length > 1:
+                counts[[i for i, term in enumerate(terms) if len(term) < min_length]] = 0
+            top = np.argsort(-counts, kind='stable')[:n]
+            return [(terms[i], int(counts[i])) for i in top if counts[i] > 0]
+
+    # ---- persistence ----
+
+    def save(self):
+        """Write segments added since the last save, then the vocabulary and manifest"""
+        if not self.path:
+            return
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            for segment in self.segments:
+                if segment.name is None:
+                    segment.name = f"segment-{segment.first_doc:010d}-{uuid.uuid4().hex[:8]}.npz"
+                    tmp_path = os.path.join(self.path, f".{segment.name}")
+                    with open(tmp_path, 'wb') as f:
+                        np.savez(f, **{key: getattr(segment, key) for key in _Segment.ARRAYS})
+                    os.replace(tmp_path, os.path.join(self.path, segment.name))
+            self._write_json('vocab.json', self.vocab.terms)
+            # The manifest goes last: readers only ever see complete segment sets
+            self._write_json('manifest.json', {
+                'version': INDEX_VERSION,
+                'n_docs': self.n_docs,
+                'vocab_size': len(self.vocab.terms),
+                'segments': [[segment.name, segment.first_doc] for segment in self.segments],
+            })
+            for name in self._obsolete:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+            self._obsolete = []
+
+    def _write_json(self, name, value):
+        tmp_path = os.path.join(self.path, f".{name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+        os.replace(tmp_path, os.path.join(self.path, name))
+
+    def _load(self):
+        with open(os.path.join(self.path, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+        with open(os.path.join(self.path, 'vocab.json'), encoding='utf-8') as f:
+            terms = json.load(f)
+        self._reset()
+        # The vocabulary may have grown past the manifest if a save is in progress
+        self.vocab = _Vocab(terms[:manifest['vocab_size']])
+        for name, first_doc in manifest['segments']:
+            with np.load(os.path.join(self.path, name)) as arrays:
+                self.segments.append(_Segment(first_doc, *(arrays[key] for key in _Segment.ARRAYS), name=name))
+        logger.info(f"Loaded text index: {self.n_docs} documents, {len(self.vocab.terms)} terms")
+
+    def refresh(self):
+        """Reload if another process saved more documents; returns True if it did"""
+        if not self.path:
+            return False
+        manifest_path = os.path.join(self.path, 'manifest.json')
+        if not os.path.exists(manifest_path):
+            return False
+        with open(manifest_path, encoding='utf-8') as f:
+            n_docs = json.load(f)['n_docs']
+        with self._lock:
+            if n_docs <= self.n_docs:
+                return False
+            self._load()
+            return True
@@ -0,0 +1,132 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# The app and batch scripts put src/ on the path the same way; the root holds the scripts
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "src"))
+sys.path.append(ROOT)
+
+
+def review_json(product_id, i):
+    return {
+        "id": f"{product_id}-{i}",
+        "updatedOn": 1704110400000 + i * 86400000,  # noon UTC, 1 Jan 2024 + i days
+        "userRating": i % 5 + 1,
+        "userName": f"User {i}",
+        "reviewText": f"Review {i} of product {product_id}",
+    }
+
+
+def state_page(title, state):
+    return (f"<html><head><title>{title}</title></head><body><div id='root'></div>"
+            f"<script>window.__myx = {json.dumps(state)}</script></body></html>")
+
+
+class FixtureSite:
+    """
+    A local stand-in for Myntra's HTTP endpoints: search results, product pages and
+    the paginated reviews API, all serving embedded JSON the way the live site does
+
+    products: {product id: {"reviews": count, "delay": seconds before the product
+    page responds, "json": False to serve a page without embedded JSON, "api": False
+    to leave the reviews only in the reviews page's embedded JSON}}
+    """
+
+    def __init__(self, products):
+        self.products = products
+        self.requests = []
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.requests.append(self.path)
+                status, content_type, body = site.respond(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @staticmethod
+    def link(product_id):
+        return f"shirts/brand/shirt-{product_id}/{product_id}/buy"
+
+    def requested(self, product_id):
+        """Whether the product page was fetched"""
+        return f"/{self.link(product_id)}" in self.requests
+
+    def respond(self, path):
+        parts = urlsplit(path)
+        segments = parts.path.strip("/").split("/")
+        html = "text/html; charset=utf-8"
+
+        if parts.path.startswith("/gateway/v1/reviews/product/"):
+            product = self.products.get(segments[-1])
+            if product is None:
+                return 404, "application/json", b"{}"
+            query = parse_qs(parts.query)
+            size, page = int(query["size"][0]), int(query["page"][0])
+            count = product["reviews"] if product.get("api", True) else 0
+            reviews = [review_json(segments[-1], i) for i in range(count)]
+            body = {"reviews": reviews[(page - 1) * size:page * size]}
+            return 200, "application/json", json.dumps(body).encode()
+
+        if segments[0] == "reviews" and segments[-1] in self.products:
+            product_id = segments[-1]
+            reviews = [review_json(product_id, i) for i in range(self.products[product_id]["reviews"])]
+            return 200, html, state_page("Reviews", {"reviewsData": {"reviews": reviews}}).encode()
+
+        if segments[-1] == "buy" and segments[-2] in self.products:
+            product_id = segments[-2]
+            product = self.products[product_id]
+            time.sleep(product.get("delay", 0))
+            if not product.get("json", True):
+                return 200, html, f"<html><head><title>Product {product_id}</title></head></html>".encode()
+            state = {"pdpData": {"id": product_id, "name": f"Product {product_id}",
+                                 "ratings": {"averageRating": 4.2}, "price": {"discounted": 999}}}
+            return 200, html, state_page(f"Product {product_id}", state).encode()
+
+        if "rawQuery" in parts.query:
+            products = [{"landingPageUrl": self.link(product_id)} for product_id in self.products]
+            return 200, html, state_page("Search", {"searchData": {"results": {"products": products}}}).encode()
+
+        return 404, html, b"<html></html>"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fixture_site():
+    """Factory: fixture_site({product id: options}) starts a FixtureSite for the test"""
+    sites = []
+
+    def start(products):
+        site = FixtureSite(products).__enter__()
+        sites.append(site)
+        return site
+
+    yield start
+    for site in sites:
+        site.__exit__(None, None, None)
@@ -0,0 +1,33 @@
+import glob
+
+import pandas as pd
+
+import batch
+from scrapper.improved_scraper import scrape_with_retry
+
+
+def run_batch(tmp_path, site, monkeypatch, out_dir):
+    monkeypatch.setattr(batch, "scrape_with_retry",
+                        lambda *args, **kwargs: scrape_with_retry(*args, base_url=site.url, **kwargs))
+    queries = tmp_path / "queries.txt"
+    queries.write_text("shirt\n")
+    return batch.main([
+        str(queries), "--products", "1", "--retries", "1", "--fetch-mode", "http",
+        "--requests-per-second", "0", "--incremental", "--state", str(tmp_path / "state.sqlite"),
+        "--output", "csv", "--out-dir", str(out_dir),
+    ])
+
+
+def test_failed_output_write_keeps_reviews_new(fixture_site, tmp_path, monkeypatch):
+    site = fixture_site({"7": {"reviews": 3}})
+    blocked = tmp_path / "exports"
+    blocked.write_text("a file where the output directory should be")
+
+    assert run_batch(tmp_path, site, monkeypatch, blocked) == 1
+
+    # The failed query is not checkpointed and its reviews are still new on the rerun
+    out_dir = tmp_path / "exports-ok"
+    assert run_batch(tmp_path, site, monkeypatch, out_dir) == 0
+    files = glob.glob(str(out_dir / "reviews_shirt_*.csv"))
+    assert len(files) == 1
+    assert pd.read_csv(files[0])["Reviewer"].tolist() == ["User 0", "User 1", "User 2"]
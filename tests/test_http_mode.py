@@ -0,0 +1,92 @@
+import pandas as pd
+
+from scrapper.http_fetcher import extract_embedded_json, parse_product_state, parse_reviews_state
+from scrapper.improved_scraper import ImprovedScraper, REVIEW_COLUMNS, scrape_with_retry
+from scrapper.rate_limiter import RateLimiter
+from conftest import review_json, state_page
+
+
+def scraper(site, no_of_products=1):
+    return ImprovedScraper("shirt", no_of_products, fetch_mode="http", base_url=site.url, requests_per_second=0)
+
+
+def test_embedded_json_is_parsed_from_the_page():
+    state = {"pdpData": {"id": 7, "name": "Shirt", "ratings": {"averageRating": 4.25},
+                         "price": {"discounted": None, "mrp": 1299}}}
+    html = state_page("Shirt", state).replace("</script>", ";window.other = {}</script>")
+
+    assert extract_embedded_json(html) == state
+    assert parse_product_state(state) == {"id": 7, "name": "Shirt", "rating": "4.2", "price": "₹1299"}
+    assert extract_embedded_json("<html>no state</html>") is None
+
+
+def test_reviews_state_maps_each_review():
+    review = review_json("7", 2)
+    expected = {"id": "7-2", "date": "3 Jan 2024", "rating": "3", "name": "User 2", "comment": "Review 2 of product 7"}
+
+    assert parse_reviews_state({"reviewsData": {"reviews": [review]}}) == [expected]
+    assert parse_reviews_state({"reviews": [review]}) == [expected]
+    assert parse_reviews_state({"reviews": [{}]}) == [
+        {"id": None, "date": "Unknown date", "rating": "No rating", "name": "Anonymous", "comment": "No comment"}
+    ]
+    assert parse_reviews_state({"pdpData": {}}) is None
+
+
+def test_http_mode_returns_review_columns(fixture_site):
+    site = fixture_site({"7": {"reviews": 120}})
+    data = scraper(site).scrape_all_reviews()
+
+    assert list(data.columns) == REVIEW_COLUMNS
+    assert len(data) == 120  # three API pages of 50
+    assert data.iloc[1].to_dict() == {
+        "Product Name": "Product 7", "Overall Rating": "4.2", "Price": "₹999", "Date": "2 Jan 2024",
+        "Rating": "2", "Reviewer": "User 1", "Comment": "Review 1 of product 7",
+    }
+    assert not any("/reviews/7" in path for path in site.requests)
+
+
+def test_http_mode_falls_back_to_the_reviews_page(fixture_site):
+    site = fixture_site({"7": {"reviews": 3, "api": False}})
+    data = scraper(site).scrape_all_reviews()
+
+    assert data["Reviewer"].tolist() == ["User 0", "User 1", "User 2"]
+    assert "/reviews/7" in site.requests
+
+
+def test_missing_json_falls_back_to_the_browser(fixture_site, monkeypatch):
+    site = fixture_site({"7": {"reviews": 3, "json": False}, "8": {"reviews": 2}})
+    browser_calls = []
+
+    def extract_reviews(self, product_link):
+        browser_calls.append(product_link)
+        return {"href": "/reviews/7"}
+
+    def extract_review_data(self, product_reviews):
+        self.product_title = "Product 7"
+        return pd.DataFrame([{"Reviewer": "Browser user"}], columns=REVIEW_COLUMNS)
+
+    monkeypatch.setattr(ImprovedScraper, "extract_reviews", extract_reviews)
+    monkeypatch.setattr(ImprovedScraper, "extract_review_data", extract_review_data)
+    data = scraper(site, no_of_products=2).scrape_all_reviews()
+
+    # Only the product without embedded JSON goes through the browser
+    assert browser_calls == [site.link("7")]
+    assert data["Reviewer"].tolist() == ["Browser user", "User 0", "User 1"]
+
+
+def test_unchanged_product_costs_one_api_page(fixture_site, tmp_path):
+    site = fixture_site({"7": {"reviews": 120}})
+    state_path = str(tmp_path / "state.sqlite")
+    kwargs = dict(max_retries=1, fetch_mode="http", base_url=site.url, state_path=state_path,
+                  limiter=RateLimiter(0))
+    assert len(scrape_with_retry("shirt", 1, **kwargs)) == 120
+
+    site.requests.clear()
+    data = scrape_with_retry("shirt", 1, **kwargs)
+
+    assert data.empty
+    assert site.requests == [
+        "/shirt?rawQuery=shirt",
+        f"/{site.link('7')}",
+        "/gateway/v1/reviews/product/7?size=50&sort=0&rating=0&page=1",
+    ]
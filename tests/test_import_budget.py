@@ -0,0 +1,26 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# The budgets and the measurement live with the benchmark, which reports them
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from bench_importtime import BUDGETS, HEAVY, measure  # noqa: E402
+
+
+@pytest.mark.parametrize("module", list(BUDGETS))
+def test_module_import_stays_within_budget(module):
+    runs = [measure(module) for _ in range(3)]
+
+    heavy = sorted(set.union(*(loaded for _, loaded in runs)) & set(HEAVY))
+    assert heavy == [], f"{module} imports {heavy} at import time"
+    best = min(ms for ms, _ in runs)
+    assert best <= BUDGETS[module], f"{module} adds {best:.0f} ms on import (budget {BUDGETS[module]} ms)"
+
+
+@pytest.mark.skipif(importlib.util.find_spec("streamlit") is None, reason="streamlit not installed")
+def test_app_loads_no_heavy_dependency_at_startup():
+    _, loaded = measure("app")
+    assert sorted(loaded & set(HEAVY)) == []
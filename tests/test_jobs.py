@@ -0,0 +1,29 @@
+import pandas as pd
+
+from scrapper import jobs
+from scrapper.jobs import JobRunner, DONE
+from scrapper.rate_limiter import RateLimiter
+
+
+def test_jobs_share_the_runner_limiter(tmp_path, monkeypatch):
+    limiters = {}
+
+    def fake_scrape(product_name, no_of_products, limiter=None, **kwargs):
+        limiters[product_name] = limiter
+        return pd.DataFrame({"Comment": ["ok"]})
+
+    monkeypatch.setattr(jobs, "scrape_with_retry", fake_scrape)
+    runner = JobRunner(max_concurrent=2, path=str(tmp_path / "jobs.sqlite"))
+    own = RateLimiter(5)
+    submitted = [
+        runner.submit("a", "shirt", 1),
+        runner.submit("b", "jeans", 1),
+        runner.submit("c", "shoes", 1, limiter=own),
+    ]
+    for job in submitted:
+        job.future.result()
+
+    assert all(job.status == DONE for job in submitted)
+    assert limiters["shirt"] is runner.limiter
+    assert limiters["jeans"] is runner.limiter
+    assert limiters["shoes"] is own
@@ -0,0 +1,21 @@
+from collections import Counter
+
+from analytics.keywords import count_terms
+
+COMMENTS = ["Great fabric, great fit", "Not worth the price", "Fit is great"]
+
+
+def test_words_skip_stop_words_and_short_words():
+    assert count_terms(COMMENTS) == Counter({"great": 3, "fit": 2, "fabric": 1, "worth": 1, "price": 1})
+
+
+def test_words_and_phrases_come_from_the_same_tokens():
+    counts = count_terms(COMMENTS, ngrams=(1, 2))
+
+    assert {term: n for term, n in counts.items() if " " not in term} == count_terms(COMMENTS)
+    # Phrases may start with "not" but not with other stop words, and never span comments;
+    # words under three letters are not tokens, so "fit is great" holds "fit great"
+    assert {term: n for term, n in counts.items() if " " in term} == {
+        "great fabric": 1, "fabric great": 1, "great fit": 1, "not worth": 1, "fit great": 1,
+    }
+    assert count_terms(COMMENTS, ngrams=(2,)) == counts - count_terms(COMMENTS)
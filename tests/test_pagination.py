@@ -0,0 +1,108 @@
+import lxml.html
+import pytest
+
+from scrapper.pagination import NEW_NODES_SCRIPT, iter_api_review_pages, iter_dom_review_batches
+from scrapper.parsing import parse_review_nodes
+
+CONTAINER = "div.detailed-reviews-userReviewsContainer"
+ITEM = "div.user-review-main.user-review-showRating"
+CONTAINER_XPATH = "//div[@class='detailed-reviews-userReviewsContainer']"
+ITEM_XPATH = f"{CONTAINER_XPATH}//div[@class='user-review-main user-review-showRating']"
+
+
+def review(i):
+    return (
+        '<div class="user-review-userReviewWrapper">'
+        '<div class="user-review-main user-review-showRating">'
+        f'<span class="user-review-starRating">{i % 5 + 1}</span></div>'
+        f'<div class="user-review-reviewTextWrapper">Review {i}</div>'
+        f'<div class="user-review-left"><span>User {i}</span><span>{i % 28 + 1} Jan 2024</span></div>'
+        '</div>'
+    )
+
+
+class FakeReviewPage:
+    """
+    Enough of a Selenium driver for iter_dom_review_batches: a lazily loading
+    reviews page held in lxml, where every scroll appends `per_scroll` reviews
+    """
+
+    def __init__(self, total, per_scroll=10, one_wrapper=True):
+        self.total = total
+        self.per_scroll = per_scroll
+        self.one_wrapper = one_wrapper
+        self.loaded = 0
+        self.doc = lxml.html.document_fromstring("<html><body><header>Reviews</header></body></html>")
+        self.body = self.doc.find("body")
+        self._load()
+
+    def _load(self):
+        for i in range(self.loaded, min(self.loaded + self.per_scroll, self.total)):
+            if self.one_wrapper:
+                wrappers = self.doc.xpath(CONTAINER_XPATH)
+                if not wrappers:
+                    self.body.append(lxml.html.fragment_fromstring(f'<div class="{CONTAINER[4:]}"></div>'))
+                    wrappers = self.doc.xpath(CONTAINER_XPATH)
+                wrappers[0].append(lxml.html.fragment_fromstring(review(i)))
+            else:
+                self.body.append(lxml.html.fragment_fromstring(f'<div class="{CONTAINER[4:]}">{review(i)}</div>'))
+        self.loaded = min(self.loaded + self.per_scroll, self.total)
+
+    def _is_container(self, node):
+        return node.get("class") == CONTAINER[4:]
+
+    def execute_script(self, script, *args):
+        if script == NEW_NODES_SCRIPT:
+            # The same walk the script does in the browser
+            assert args[0] == f"{CONTAINER} {ITEM}" and args[2] == CONTAINER
+            items = self.doc.xpath(ITEM_XPATH)
+            nodes = []
+            for i in range(args[1], len(items)):
+                node = items[i]
+                while (not self._is_container(node) and node.getparent() is not None
+                       and not (i > 0 and node.getparent() in items[i - 1].iterancestors())
+                       and not (i + 1 < len(items) and node.getparent() in items[i + 1].iterancestors())):
+                    node = node.getparent()
+                nodes.append(lxml.html.tostring(node, encoding="unicode", with_tail=False))
+            return nodes
+        if script.startswith("return document.querySelectorAll"):
+            assert args[0] == f"{CONTAINER} {ITEM}"
+            return len(self.doc.xpath(ITEM_XPATH))
+        if script == "return document.body.scrollHeight":
+            return self.loaded * 100
+        if script.startswith("window.scrollTo"):
+            self._load()
+            return None
+        raise AssertionError(f"unexpected script {script!r}")
+
+
+def scroll(page, **kwargs):
+    rows = []
+    for batch in iter_dom_review_batches(page, CONTAINER, ITEM, lambda nodes: parse_review_nodes(nodes)[0],
+                                         settle_timeout=0.05, **kwargs):
+        rows.extend(batch)
+    return rows
+
+
+@pytest.mark.parametrize("one_wrapper", [True, False])
+def test_every_review_is_read_once(one_wrapper):
+    rows = scroll(FakeReviewPage(50, one_wrapper=one_wrapper))
+    assert [name for _, _, name, _ in rows] == [f"User {i}" for i in range(50)]
+    assert rows[7] == ("8 Jan 2024", "3", "User 7", "Review 7")
+
+
+def test_stops_at_max_reviews():
+    assert len(scroll(FakeReviewPage(50), max_reviews=25)) == 25
+
+
+def test_stops_at_first_known_review():
+    rows = scroll(FakeReviewPage(50), is_known=lambda row: row[2] == "User 34")
+    # The batch holding the known review is the last one read
+    assert [name for _, _, name, _ in rows] == [f"User {i}" for i in range(40) if i != 34]
+
+
+def test_api_pages_stop_at_short_page():
+    pages = {1: [{"id": i} for i in range(50)], 2: [{"id": i} for i in range(45, 60)]}
+    batches = list(iter_api_review_pages(pages.get, lambda page, size: page, lambda reviews: reviews))
+    # Ids repeated by a shifting page are dropped
+    assert [len(batch) for batch in batches] == [50, 10]
@@ -0,0 +1,108 @@
+from fnmatch import fnmatchcase
+
+import pytest
+from selenium.webdriver.chrome.options import Options
+
+from scrapper.resource_blocking import (
+    BLOCKING_PROFILES,
+    IMAGE_PATTERNS,
+    PageStats,
+    apply_to_driver,
+    apply_to_options,
+)
+
+# Pages and API calls the scraper needs must never match a blocking pattern
+NEEDED = [
+    "https://www.myntra.com/shirts/brand/shirt/123/buy",
+    "https://www.myntra.com/reviews/123",
+    "https://www.myntra.com/gateway/v1/reviews/product/123?size=50&sort=0&rating=0&page=1",
+    "https://constant.myntassets.com/web/assets/js/bundle.js",
+    "https://constant.myntassets.com/web/assets/css/main.css",
+]
+BLOCKED = [
+    "https://assets.myntassets.com/h_720,q_90,w_540/v1/assets/images/123/1.jpg",
+    "https://constant.myntassets.com/web/fonts/Assistant-Regular.woff2",
+    "https://www.google-analytics.com/analytics.js",
+    "https://www.googletagmanager.com/gtm.js?id=GTM-X",
+    "https://connect.facebook.net/en_US/fbevents.js",
+    "https://bam.nr-data.net/1/abc",
+]
+
+
+def blocked(url, profile):
+    # CDP's Network.setBlockedURLs patterns are whole-URL globs with * wildcards
+    return any(fnmatchcase(url, pattern) for pattern in BLOCKING_PROFILES[profile][1])
+
+
+@pytest.mark.parametrize("profile", list(BLOCKING_PROFILES))
+def test_scraper_requests_are_never_blocked(profile):
+    assert not [url for url in NEEDED if blocked(url, profile)]
+
+
+def test_standard_profile_blocks_heavy_and_tracking_requests():
+    assert [url for url in BLOCKED if not blocked(url, "standard")] == []
+    assert [url for url in BLOCKED if blocked(url, "images")] == BLOCKED[:1]
+    assert not any(blocked(url, "none") for url in BLOCKED)
+
+
+def test_options_for_each_profile():
+    options = Options()
+    apply_to_options(options, "none")
+    assert options.page_load_strategy == "normal"
+    assert "prefs" not in options.experimental_options
+
+    options = Options()
+    apply_to_options(options, "standard")
+    assert options.page_load_strategy == "eager"
+    assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 2}
+    assert "--blink-settings=imagesEnabled=false" in options.arguments
+
+
+class RecordingDriver:
+    def __init__(self, fail=False, metrics=None):
+        self.fail = fail
+        self.metrics = metrics
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.fail:
+            raise RuntimeError("not a Chromium browser")
+        self.commands.append((cmd, params))
+
+    def execute_script(self, script):
+        return self.metrics
+
+
+def test_cdp_commands():
+    driver = RecordingDriver()
+    apply_to_driver(driver, "none")
+    assert driver.commands == []
+
+    apply_to_driver(driver, "images")
+    assert driver.commands == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": IMAGE_PATTERNS})]
+
+    # A browser without CDP still scrapes, just unblocked
+    apply_to_driver(RecordingDriver(fail=True), "standard")
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        apply_to_options(Options(), "all")
+    with pytest.raises(ValueError):
+        apply_to_driver(RecordingDriver(), "all")
+
+
+def test_page_stats_average_over_pages():
+    stats = PageStats()
+    stats.record(RecordingDriver(metrics={"bytes": 3072, "resources": 10, "dom_ready_ms": 500}))
+    stats.record(RecordingDriver(metrics={"bytes": 1024, "resources": 20, "dom_ready_ms": 1500}))
+    stats.record(RecordingDriver(metrics=None))
+
+    assert stats.summary() == {
+        "pages_measured": 2,
+        "bytes_transferred": 4096,
+        "avg_page_kb": 2.0,
+        "avg_resources_per_page": 15.0,
+        "avg_dom_ready_seconds": 1.0,
+    }
+    assert PageStats().summary() == {}
@@ -0,0 +1,73 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from utils.normalize import normalize_reviews, sentiment_labels
+from utils.schema import PRODUCT_ID, bytes_per_row, compact_reviews, split_products
+
+# Budgets for the compact schema (measured ~148 bytes/row, 23% of the object frame)
+MAX_BYTES_PER_ROW = 200
+MAX_SHARE_OF_OBJECT_FRAME = 0.30
+
+PHRASES = ["great quality and fits perfectly", "colour faded after one wash", "value for money",
+           "size runs small, had to return", "not as shown in the picture", "awesome product, loved it"]
+
+
+def analyzed_reviews(n=5000, products=50, seed=0):
+    """An analyzed frame as the app holds it before compaction: strings as objects"""
+    rng = random.Random(seed)
+    catalogue = [(f"Brand{p % 20} Men Solid Round Neck T-shirt {p} | Buy Online at Myntra",
+                  f"{rng.uniform(3, 5):.1f}", f"₹{rng.randint(299, 2999):,}") for p in range(products)]
+    rows = []
+    for _ in range(n):
+        name, overall, price = rng.choice(catalogue)
+        rows.append({
+            'Product Name': name, 'Overall Rating': overall, 'Price': price,
+            'Date': f"{rng.randint(1, 28)} {rng.choice(['Jan', 'Feb', 'Mar'])} 2024",
+            'Rating': str(rng.randint(1, 5)),
+            'Reviewer': rng.choice(["Aarav", "Priya", "Rohit", "Myntra Customer"]),
+            'Comment': " ".join(rng.sample(PHRASES, rng.randint(1, 3))),
+        })
+    df = normalize_reviews(pd.DataFrame(rows).astype(object))
+    scores = np.random.default_rng(seed).uniform(-1, 1, (n, 3))
+    df['TB_Polarity'], df['TB_Subjectivity'], df['VADER_Score'] = scores[:, 0], abs(scores[:, 1]), scores[:, 2]
+    df['TB_Sentiment'] = np.asarray(sentiment_labels(df['TB_Polarity']), dtype=object)
+    df['VADER_Sentiment'] = np.asarray(sentiment_labels(df['VADER_Score']), dtype=object)
+    return df
+
+
+def test_compact_schema_stays_within_bytes_per_row_budget():
+    df = analyzed_reviews()
+    compact = compact_reviews(df)
+
+    assert bytes_per_row(compact) <= MAX_BYTES_PER_ROW
+    assert bytes_per_row(compact) <= MAX_SHARE_OF_OBJECT_FRAME * bytes_per_row(df)
+
+
+def test_compact_schema_keeps_every_value():
+    df = analyzed_reviews(500)
+    compact = compact_reviews(df)
+
+    assert set(compact.columns) == set(df.columns) | {PRODUCT_ID}
+    for col in ['Product Name', 'Overall Rating', 'Price', 'Date', 'Rating', 'Reviewer', 'Comment',
+                'TB_Sentiment', 'VADER_Sentiment']:
+        assert compact[col].astype(object).tolist() == df[col].tolist(), col
+    np.testing.assert_allclose(compact['VADER_Score'], df['VADER_Score'], atol=1e-6)
+
+
+def test_products_are_stored_once():
+    products, reviews = split_products(analyzed_reviews(1000, products=7))
+
+    assert len(products) == 7
+    assert sorted(reviews[PRODUCT_ID].unique()) == list(range(7))
+    assert 'Product Name' not in reviews.columns
+
+
+def test_categorical_product_keys_number_only_observed_products():
+    # A frame compacted earlier holds the product fields as categoricals
+    df = compact_reviews(analyzed_reviews(300, products=5)).drop(columns=PRODUCT_ID)
+    products, reviews = split_products(df[df['Product Name'] != df['Product Name'].iloc[0]])
+
+    assert len(products) == 4
+    assert sorted(reviews[PRODUCT_ID].unique()) == list(range(4))
@@ -0,0 +1,101 @@
+import time
+
+import pandas as pd
+import pytest
+
+from scrapper.improved_scraper import ImprovedScraper, REVIEW_COLUMNS, scrape_with_retry
+from scrapper.scrape_state import ScrapeState
+
+
+def reviews(product, count):
+    return pd.DataFrame([
+        {"Product Name": product, "Overall Rating": "4.0", "Price": "₹999", "Date": f"{i + 1} Jan 2024",
+         "Rating": "5", "Reviewer": f"user{i}", "Comment": f"review {i} of {product}"}
+        for i in range(count)
+    ], columns=REVIEW_COLUMNS)
+
+
+@pytest.fixture
+def fake_site(monkeypatch):
+    """
+    Three products; 111 is slow, so 333 finishes first and is then discarded
+    once 111 alone satisfies no_of_products=1
+    """
+    pages = {"p/111/buy": (0.3, 5), "p/222/buy": (0.0, 0), "p/333/buy": (0.0, 7)}
+
+    def scrape(self, url):
+        delay, count = pages[url]
+        time.sleep(delay)
+        self.product_title = url
+        if not count:
+            return None
+        # Pagination drops the reviews an earlier run recorded
+        rows = reviews(url, count)
+        return rows[[not self._is_known_row(row) for _, row in rows.iterrows()]]
+
+    monkeypatch.setattr(ImprovedScraper, "scrape_product_urls", lambda self: list(pages))
+    monkeypatch.setattr(ImprovedScraper, "_scrape_product", scrape)
+    return pages
+
+
+def run(state_path, no_of_products=1, **kwargs):
+    return scrape_with_retry("shirt", no_of_products, max_retries=1, max_workers=3, fetch_mode="http",
+                             state_path=state_path, **kwargs)
+
+
+def test_only_yielded_products_are_recorded(fake_site, tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    data = run(path)
+    assert len(data) == 5
+
+    state = ScrapeState(path)
+    assert len(state.known_keys("111")) == 5
+    # 333 was scraped by a worker but never returned: its reviews must stay new
+    assert state.known_keys("333") == set()
+    state.close()
+
+    # The next run finds nothing new on 111 and still returns all of 333's reviews
+    data = run(path, no_of_products=2)
+    assert sorted(data["Product Name"].unique()) == ["p/333/buy"]
+    assert len(data) == 7
+
+
+def test_cancelled_run_records_nothing_unreturned(fake_site, tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    done = []
+    data = run(path, no_of_products=3, on_product=lambda scraper, rows: done.append(rows),
+               should_stop=lambda: bool(done))
+    assert len(data) == 5
+
+    state = ScrapeState(path)
+    assert len(state.known_keys("111")) == 5
+    assert state.known_keys("333") == set()
+    state.close()
+
+
+def test_failed_store_append_rolls_back(fake_site, tmp_path):
+    class BrokenStore:
+        def append(self, data, product_name):
+            raise OSError("disk full")
+
+    path = str(tmp_path / "state.sqlite")
+    data = run(path, store=BrokenStore())
+    assert len(data) == 5
+
+    state = ScrapeState(path)
+    assert state.known_keys("111") == set()
+    state.close()
+
+
+def test_rollback_discards_staged_reviews(tmp_path):
+    state = ScrapeState(str(tmp_path / "state.sqlite"))
+    state.stage("111", reviews("p/111/buy", 3))
+    state.rollback()
+    state.commit()
+    assert state.known_keys("111") == set()
+
+    state.stage("111", reviews("p/111/buy", 3))
+    state.commit()
+    assert len(state.known_keys("111")) == 3
+    assert state.product("111")["newest_date"] == "2024-01-03"
+    state.close()
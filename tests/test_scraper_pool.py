@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+from scrapper.improved_scraper import ImprovedScraper
+from scrapper.scraper_pool import ScraperPool, WorkerStartError
+
+
+def scraper(site, no_of_products, max_workers=3, **kwargs):
+    return ImprovedScraper("shirt", no_of_products, max_workers=max_workers, fetch_mode="http",
+                           base_url=site.url, requests_per_second=0, **kwargs)
+
+
+def product_names(batches):
+    return [batch["Product Name"].iloc[0] for batch in batches]
+
+
+def test_results_arrive_in_search_order(fixture_site):
+    # Later products answer first; results must still follow the search order
+    site = fixture_site({"1": {"reviews": 3, "delay": 0.3}, "2": {"reviews": 4, "delay": 0.15},
+                         "3": {"reviews": 5}})
+    batches = list(scraper(site, 3).iter_product_batches())
+
+    assert product_names(batches) == ["Product 1", "Product 2", "Product 3"]
+    assert [len(batch) for batch in batches] == [3, 4, 5]
+
+
+def test_stops_at_no_of_products_with_slow_early_products(fixture_site):
+    site = fixture_site({"1": {"reviews": 3, "delay": 0.4}, "2": {"reviews": 0}, "3": {"reviews": 2},
+                         "4": {"reviews": 2}, "5": {"reviews": 2}, "6": {"reviews": 2}})
+    run = scraper(site, 2)
+    batches = list(run.iter_product_batches())
+
+    # Product 2 has no reviews, so the second product yielded is 3
+    assert product_names(batches) == ["Product 1", "Product 3"]
+    assert run.products_scraped == 2
+    assert run.products_checked == 3
+    # Workers stop taking new products once enough have succeeded
+    assert not site.requested("6")
+
+
+def test_completed_but_discarded_results_are_dropped(fixture_site):
+    # 2 and 3 finish while 1 is still loading; 1 alone satisfies no_of_products=1
+    site = fixture_site({"1": {"reviews": 3, "delay": 0.4}, "2": {"reviews": 4}, "3": {"reviews": 5}})
+    seen = []
+    run = scraper(site, 1)
+    batches = list(run.iter_product_batches(on_product=lambda s, review_data: seen.append(review_data)))
+
+    assert site.requested("2") and site.requested("3")
+    assert product_names(batches) == ["Product 1"]
+    # Results past the last one yielded never reach callbacks or counters
+    assert len(seen) == 1
+    assert run.products_checked == 1
+
+
+def test_should_stop_cancels_the_rest(fixture_site):
+    site = fixture_site({str(i): {"reviews": 2, "delay": 0.1} for i in range(1, 9)})
+    run = scraper(site, 8, max_workers=2)
+    batches = list(run.iter_product_batches(should_stop=lambda: True))
+
+    assert product_names(batches) == ["Product 1"]
+    assert run.cancelled
+    # Only the products already in flight were fetched
+    assert not site.requested("8")
+
+
+def test_pool_cancels_pending_work_when_the_consumer_stops():
+    started = []
+    lock = threading.Lock()
+
+    def work(worker, item):
+        with lock:
+            started.append(item)
+        time.sleep(0.05)
+        return [item]
+
+    pool = ScraperPool(lambda: object(), max_workers=2)
+    results = pool.iter_results(range(20), work, want=20)
+    assert next(results)[1] == 0
+    results.close()
+
+    assert len(started) <= 4
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_pool_matches_a_sequential_scan(max_workers):
+    def work(worker, item):
+        time.sleep(0.01 * (item % 3))
+        return [item] if item % 2 else None
+
+    pool = ScraperPool(lambda: object(), max_workers=max_workers)
+    results = list(pool.iter_results(range(12), work, want=3))
+    assert [idx for idx, _, _ in results] == [0, 1, 2, 3, 4, 5]
+    assert [result for _, _, result in results if result] == [[1], [3], [5]]
+
+
+def test_workers_start_in_parallel():
+    def slow_factory():
+        time.sleep(0.3)
+        return object()
+
+    pool = ScraperPool(slow_factory, max_workers=4)
+    start = time.perf_counter()
+    results = list(pool.iter_results(range(4), lambda worker, item: [item], want=4))
+
+    assert len(results) == 4
+    assert time.perf_counter() - start < 0.9  # one after another would take 1.2s
+
+
+def test_failed_worker_start_does_not_consume_items():
+    calls = []
+
+    def failing_factory():
+        calls.append(1)
+        raise RuntimeError("chrome did not start")
+
+    def work(worker, item):
+        time.sleep(0.01)
+        return [item]
+
+    # The seeded worker takes over every item the failed spawn would have had
+    pool = ScraperPool(failing_factory, max_workers=3, workers=[object()])
+    results = list(pool.iter_results(range(6), work, want=6))
+    assert [result for _, _, result in results] == [[i] for i in range(6)]
+    assert len(calls) == 1
+
+    # With no worker at all the scrape fails instead of reporting empty products
+    pool = ScraperPool(failing_factory, max_workers=2)
+    with pytest.raises(WorkerStartError):
+        list(pool.iter_results(range(3), work, want=3))